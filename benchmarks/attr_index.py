@@ -0,0 +1,110 @@
+""" Times the lookup of the parent docstrings of every method of a class with 150 methods,
+    deriving from a 5-level hierarchy, by scanning the bases' mros with hasattr/getattr
+    versus by looking the docstrings up in the bases' attribute-docstring indexes; and
+    times the creation of such a class, with its attributes' docstrings merged eagerly
+    and lazily.
+
+    Usage: python benchmarks/attr_index.py"""
+
+from __future__ import print_function
+
+import timeit
+
+from custom_inherit import DocInheritMeta, merge_cache
+from custom_inherit._metaclass_base import _attr_docs
+
+N_METHODS = 150
+DEPTH = 5
+
+
+def _method(n):
+    def method(self):
+        pass
+
+    method.__name__ = "method{}".format(n)
+    method.__doc__ = "Method {}.\n\nReturns\n-------\nint".format(n)
+    return method
+
+
+def build_bases(meta, n_methods=N_METHODS, depth=DEPTH):
+    cls = meta(
+        "Level0",
+        (object,),
+        dict(("method{}".format(n), _method(n)) for n in range(n_methods)),
+    )
+    for n in range(1, depth):
+        cls = meta("Level{}".format(n), (cls,), {})
+    return (cls,)
+
+
+def scan_lookup(class_bases, attrs):
+    for attr in attrs:
+        for mro_cls in (
+            mro_cls
+            for base in class_bases
+            for mro_cls in base.mro()
+            if hasattr(mro_cls, attr)
+        ):
+            if getattr(mro_cls, attr).__doc__ is not None:
+                break
+
+
+def index_lookup(class_bases, attrs):
+    prnt_attr_docs = [
+        attr_docs
+        for attr_docs in (
+            _attr_docs(mro_cls) for base in class_bases for mro_cls in base.mro()
+        )
+        if attr_docs
+    ]
+    for attr in attrs:
+        for attr_docs in prnt_attr_docs:
+            if attr_docs.get(attr) is not None:
+                break
+
+
+def main():
+    meta = DocInheritMeta(style="numpy")
+    class_bases = build_bases(meta)
+    attrs = ["method{}".format(n) for n in range(N_METHODS)]
+
+    for label, lookup in (("hasattr scan", scan_lookup), ("index", index_lookup)):
+        best = min(
+            timeit.repeat(lambda: lookup(class_bases, attrs), number=20, repeat=5)
+        )
+        print(
+            "{:<14} {:>8.3f} ms per lookup of {} docstrings".format(
+                label, 1e3 * best / 20, N_METHODS
+            )
+        )
+
+    def create():
+        meta("Child", class_bases, dict((attr, lambda self: None) for attr in attrs))
+
+    create()  # populate merge_cache, so that only the lookups and merge-cache hits are timed
+    best = min(timeit.repeat(create, number=20, repeat=5))
+    print(
+        "{:<14} {:>8.3f} ms per class with {} methods".format(
+            "creation", 1e3 * best / 20, N_METHODS
+        )
+    )
+    merge_cache.clear()
+
+    lazy_meta = DocInheritMeta(style="numpy", lazy=True)
+    lazy_bases = build_bases(lazy_meta)
+
+    def create_lazy():
+        lazy_meta(
+            "Child", lazy_bases, dict((attr, lambda self: None) for attr in attrs)
+        )
+
+    best = min(timeit.repeat(create_lazy, number=20, repeat=5))
+    print(
+        "{:<14} {:>8.3f} ms per class with {} methods".format(
+            "lazy creation", 1e3 * best / 20, N_METHODS
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+""" Times the creation of a 30-level chain of numpy-documented classes, resolving class
+    docstrings across the full mro versus incrementally from the bases' docstrings, versus
+    deferring their resolution until they are accessed.
+
+    Usage: python benchmarks/class_chain.py"""
+
+from __future__ import print_function
+
+import timeit
+
+from custom_inherit import DocInheritMeta, merge_cache, parse_cache
+
+DEPTH = 30
+
+
+def build_chain(style="numpy_with_merge", depth=DEPTH, **kwargs):
+    meta = DocInheritMeta(style=style, **kwargs)
+    cls = meta(
+        "Level0",
+        (object,),
+        dict(
+            __doc__="Level 0.\n\nParameters\n----------\nx0 : int\n    The 0th parameter."
+        ),
+    )
+    for n in range(1, depth):
+        doc = "Parameters\n----------\nx{0} : int\n    The {0}th parameter.".format(n)
+        cls = meta("Level{}".format(n), (cls,), dict(__doc__=doc))
+    return cls
+
+
+def main():
+    for label, kwargs in (
+        ("full mro", {}),
+        ("incremental", dict(incremental=True)),
+        ("lazy", dict(lazy=True)),
+    ):
+
+        def run():
+            parse_cache.clear()
+            merge_cache.clear()
+            build_chain(**kwargs)
+
+        best = min(timeit.repeat(run, number=5, repeat=5)) / 5
+        print("{:<12} {:>8.2f} ms per {}-level chain".format(label, 1e3 * best, DEPTH))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+""" Times `import custom_inherit` in fresh interpreters, and reports the modules that it imports
+    that it should not need: e.g. custom_inherit._version, whose resolution of the version may
+    spawn git subprocesses.
+
+    Usage: python benchmarks/import_time.py"""
+
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+
+REPEATS = 20
+
+UNWANTED = ("custom_inherit._version", "subprocess")
+
+CODE = """
+import sys, time
+start = time.perf_counter()
+import custom_inherit
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(name for name in {unwanted!r} if name in sys.modules))
+""".format(
+    unwanted=UNWANTED
+)
+
+
+def time_import():
+    env = dict(os.environ)
+    env.pop("CUSTOM_INHERIT_CACHE_DIR", None)
+    out = subprocess.check_output([sys.executable, "-c", CODE], env=env)
+    elapsed, _, unwanted = out.decode("utf-8").strip().partition(" ")
+    return float(elapsed), unwanted
+
+
+if __name__ == "__main__":
+    results = [time_import() for _ in range(REPEATS)]
+    best = min(elapsed for elapsed, _ in results)
+    print("import custom_inherit: {:.2f} ms (best of {})".format(1e3 * best, REPEATS))
+    unwanted = results[0][1]
+    print("unwanted imports: {}".format(unwanted or "none"))
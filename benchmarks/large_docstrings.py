@@ -0,0 +1,83 @@
+""" Measures the peak of the memory allocated by the parsing, and by the merging, of very large
+    (indented) numpy-style reference docstrings, from 100 KB to 1 MB - a parent documenting many
+    parameters, along with long Notes and Examples sections, and a child that overrides only its
+    Parameters section - along with the time taken by a merge. The parse cache is cleared before
+    each merge.
+
+    The parsed sections hold the offsets of their text in the cleaned docstring, such that the
+    Notes and Examples of the parent are only copied out of it once they are rendered.
+
+    Usage: python benchmarks/large_docstrings.py"""
+
+from __future__ import print_function
+
+import timeit
+import tracemalloc
+
+from custom_inherit import parse_cache
+from custom_inherit._doc_parse_tools.numpy_parse_tools import (
+    merge_numpy_docs,
+    parse_numpy_doc,
+)
+
+SIZES_KB = (100, 300, 1000)
+
+PARAMETER = "x{0} : int, optional (default: {0})\n    The {0}th option.\n"
+PARAGRAPH = (
+    "A paragraph of the notes, which discusses the {0}th aspect of the class.\n\n"
+)
+EXAMPLE = ">>> obj.method({0})\n{0}\n"
+
+
+def build_parent(size_kb):
+    n = max(1, size_kb * 1024 // 3 // 60)
+    doc = "".join(
+        ["Summary.\n\nParameters\n----------\n"]
+        + [PARAMETER.format(i) for i in range(n)]
+        + ["\nNotes\n-----\n"]
+        + [PARAGRAPH.format(i) for i in range(n)]
+        + ["Examples\n--------\n"]
+        + [EXAMPLE.format(i) for i in range(3 * n)]
+    )
+    return doc.replace("\n", "\n    ")
+
+
+def traced(func, *args):
+    """ Returns the peak of the memory allocated by the call."""
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def kib(size):
+    return "{:7.1f} KiB".format(size / 1024)
+
+
+if __name__ == "__main__":
+    child = """Summary.
+
+    Parameters
+    ----------
+    y : int
+        The child's parameter.
+    """
+    for size_kb in SIZES_KB:
+        prnt = build_parent(size_kb)
+        parse_peak = traced(parse_numpy_doc.__wrapped__, prnt)
+
+        def merge():
+            parse_cache.clear()
+            return merge_numpy_docs(prnt, child)
+
+        merge()
+        merge_peak = traced(merge)
+        timer = timeit.Timer(merge)
+        number, _ = timer.autorange()
+        elapsed = min(timer.repeat(repeat=5, number=number)) / number
+        print(
+            "{:>5} KB docstring: parse peak {} | merge peak {} | {:8.1f} us per merge".format(
+                size_kb, kib(parse_peak), kib(merge_peak), 1e6 * elapsed
+            )
+        )
@@ -0,0 +1,123 @@
+""" Measures the memory allocated, and the time taken, by a merge of two numpy- and two
+    google-style docstrings with long Parameters sections: with the indentation of the docstrings
+    removed once, versus with it removed again from each section with items (by
+    `inspect.cleandoc`) and with each item re-indented (by `textwrap.indent`) upon rendering,
+    as the parse tools used to do. The parse cache is cleared before each merge.
+
+    The scratch memory of the parsing and the rendering of the sections with items - that is
+    allocated during a call of these stages, but freed before it returns - is reported as the
+    sum, over the calls, of the peak of the memory allocated during a call less the memory
+    held upon its return; along with the peak of the memory allocated during the whole merge.
+
+    Usage: python benchmarks/merge_allocations.py"""
+
+from __future__ import print_function
+
+import inspect
+import sys
+import timeit
+import tracemalloc
+from collections import OrderedDict
+from textwrap import indent
+
+from custom_inherit import parse_cache
+from custom_inherit._doc_parse_tools import section_items
+from custom_inherit._doc_parse_tools.napoleon_parse_tools import (
+    merge_google_napoleon_docs,
+)
+from custom_inherit._doc_parse_tools.numpy_parse_tools import merge_numpy_docs
+
+N_ITEMS = 200
+
+
+def numpy_doc(name, n_items=N_ITEMS):
+    items = "".join(
+        "\n        {0}{1} : int\n            The {1}th parameter.".format(name, n)
+        for n in range(n_items)
+    )
+    return "Summary.\n\n        Parameters\n        ----------" + items
+
+
+def google_doc(name, n_items=N_ITEMS):
+    items = "".join(
+        "\n            {0}{1} (int): The {1}th parameter.".format(name, n)
+        for n in range(n_items)
+    )
+    return "Summary.\n\n        Args:" + items
+
+
+def legacy_parse(doc_sections):
+    for section_name in section_items.SECTION_NAMES:
+        section_content = doc_sections[section_name]
+        if section_content:
+            doc_sections[section_name] = OrderedDict(
+                section_items.parse_items(inspect.cleandoc(str(section_content)))
+            )
+
+
+def legacy_render(body, style):
+    padding = section_items._STYLE_TO_PADDING[style]
+    section = []
+    for key, value in body.items():
+        section += [indent("{}{}".format(key, value), padding)]
+    return "\n".join(section)
+
+
+def traced(stage, peaks):
+    """ Wraps a stage, such that the scratch memory of each call is recorded."""
+
+    def wrapper(*args):
+        tracemalloc.reset_peak()
+        try:
+            return stage(*args)
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - current)
+
+    return wrapper
+
+
+def measure(merge, prnt, child, parse, render):
+    def run():
+        parse_cache.clear()
+        return merge(prnt, child, merge_within_sections=True)
+
+    section_items.parse, section_items.render = parse, render
+    run()
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    elapsed = min(timer.repeat(repeat=5, number=number)) / number
+
+    peaks = []
+    section_items.parse = traced(parse, peaks)
+    section_items.render = traced(render, peaks)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sum(peaks), peak, elapsed
+
+
+if __name__ == "__main__":
+    if sys.version_info < (3, 9):
+        raise RuntimeError("requires Python 3.9 or later")  # for tracemalloc.reset_peak
+
+    cases = (
+        ("numpy", merge_numpy_docs, numpy_doc),
+        ("google", merge_google_napoleon_docs, google_doc),
+    )
+    parse, render = section_items.parse, section_items.render
+    for style, merge, doc in cases:
+        prnt, child = doc("x"), doc("y")
+        try:
+            before = measure(merge, prnt, child, legacy_parse, legacy_render)
+            after = measure(merge, prnt, child, parse, render)
+        finally:
+            section_items.parse, section_items.render = parse, render
+        for label, (stages, peak, elapsed) in (("before", before), ("after", after)):
+            print(
+                "{:>6} ({} items) {:>6}: scratch {:6.1f} KiB | merge peak"
+                " {:6.1f} KiB | {:7.1f} us per merge".format(
+                    style, N_ITEMS, label, stages / 1024, peak / 1024, 1e6 * elapsed
+                )
+            )
@@ -0,0 +1,135 @@
+""" Times the parsing, and the merging, of long Sphinx-style (reST) docstrings, from 1 KB to
+    200 KB: by the delimiter scanner of custom_inherit._doc_parse_tools.rest_parse_tools versus
+    by the line-by-line loop that it replaced (which defined its section class upon each call).
+    The parse cache is cleared before each merge.
+
+    Usage: python benchmarks/rest_parse.py"""
+
+from __future__ import print_function
+
+import timeit
+from collections import OrderedDict
+from inspect import cleandoc
+from string import punctuation
+
+from custom_inherit import parse_cache
+from custom_inherit._doc_parse_tools import rest_parse_tools
+
+SIZES_KB = (1, 10, 50, 200)
+
+SECTION = """
+    {overline}
+    {title}
+    {underline}
+
+    The {n}th section, which documents :class:`Widget` and :func:`frobnicate`; see
+    :ref:`usage` for details.
+
+    :param x{n}: The {n}th parameter.
+    :type x{n}: int
+    :returns: The frobnicated widget.
+
+    .. code-block:: python
+
+        >>> frobnicate(Widget({n}))
+"""
+
+ADORNMENTS = ("=", "-", "~", "^")
+
+
+def build_doc(size_kb, name="parent"):
+    doc = ["The front-matter of the {}.\n".format(name)]
+    n = 0
+    while sum(len(part) for part in doc) < 1024 * size_kb:
+        title = "Section {}".format(n)
+        adornment = ADORNMENTS[n % len(ADORNMENTS)] * len(title)
+        doc.append(
+            SECTION.format(
+                overline=adornment if n % 2 else "",
+                title=title,
+                underline=adornment,
+                n=n,
+            )
+        )
+        n += 1
+    return "".join(doc)
+
+
+def is_delimiter(line):
+    return bool(line) and line[0] in punctuation and line[0] * len(line) == line
+
+
+def line_loop(doc):
+    """ The line-by-line parsing of a reST docstring, prior to the delimiter scanner."""
+
+    class Section(object):
+        def __init__(self, header=None, body=None):
+            self.header = header
+            self.body = body
+
+    doc_sections = OrderedDict([("", Section(header=""))])
+    if not doc:
+        return doc_sections
+
+    lines = iter(cleandoc(doc).splitlines())
+    header = ""
+    body = []
+    section = Section(header=header)
+    line = ""
+    while True:
+        try:
+            prev_line = line
+            line = next(lines)
+            if is_delimiter(line) and 0 < len(prev_line) <= len(line):
+                if (
+                    len(body) >= 2
+                    and len(body[-2]) == len(line)
+                    and body[-2][0] == line[0]
+                    and is_delimiter(body[-2])
+                ):
+                    lim = -2
+                else:
+                    lim = -1
+                section.body = "\n".join(body[:lim]).rstrip()
+                doc_sections.update([(header.strip(), section)])
+                section = Section(header="\n".join(body[lim:] + [line]))
+                header = prev_line
+                body = []
+                line = ""
+            else:
+                body.append(line)
+        except StopIteration:
+            section.body = "\n".join(body).rstrip()
+            doc_sections.update([(header.strip(), section)])
+            break
+    return doc_sections
+
+
+def best_of(func, repeat=5):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def merge(parse, prnt, child):
+    parse_cache.clear()
+    return rest_parse_tools.render_sections(
+        rest_parse_tools.merge_sections(parse(prnt), parse(child))
+    )
+
+
+if __name__ == "__main__":
+    scanner = rest_parse_tools.parse_rest_doc.__wrapped__
+    for size_kb in SIZES_KB:
+        prnt, child = build_doc(size_kb), build_doc(size_kb // 2 or 1, name="child")
+        assert merge(scanner, prnt, child) == merge(line_loop, prnt, child)
+
+        looped = best_of(lambda: line_loop(prnt))
+        scanned = best_of(lambda: scanner(prnt))
+        merged = best_of(lambda: merge(rest_parse_tools.parse_rest_doc, prnt, child))
+        print(
+            "{:>4} KB: line loop {:9.1f} us | scanner {:9.1f} us ({:.1f}x)"
+            " | merge {:9.1f} us".format(
+                size_kb, 1e6 * looped, 1e6 * scanned, looped / scanned, 1e6 * merged
+            )
+        )
@@ -0,0 +1,51 @@
+""" Times the splitting of Parameters sections, of 10 to 5000 items, into their items: by the
+    line-based scanner of custom_inherit._doc_parse_tools.section_items versus by the regex that
+    it replaced; along with a malformed section (a long run of asterisks), upon which the regex
+    degrades quadratically.
+
+    Usage: python benchmarks/section_items.py"""
+
+from __future__ import print_function
+
+import re
+import timeit
+
+from custom_inherit._doc_parse_tools.section_items import parse_items
+
+# the regex by which sections were split into their items, before `parse_items`
+RE_PATTERN_ITEMS = re.compile(r"(\**\w+)(.*?)(?:$|(?=\n\**\w+))", flags=re.DOTALL)
+
+N_ITEMS = (10, 100, 1000, 5000)
+N_ASTERISKS = (1000, 2000, 4000)
+
+
+def build_section(n_items):
+    return "\n".join(
+        "x{0} : int, optional (default: {0})\n"
+        "    The {0}th option of a generated configuration.".format(n)
+        for n in range(n_items)
+    )
+
+
+def best_of(func, repeat=5):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(label, section):
+    assert parse_items(section) == RE_PATTERN_ITEMS.findall(section)
+    regex = best_of(lambda: RE_PATTERN_ITEMS.findall(section))
+    scanner = best_of(lambda: parse_items(section))
+    print(
+        "{:>24}: regex {:10.1f} us | scanner {:8.1f} us ({:.1f}x)".format(
+            label, 1e6 * regex, 1e6 * scanner, regex / scanner
+        )
+    )
+
+
+if __name__ == "__main__":
+    for n_items in N_ITEMS:
+        report("{} items".format(n_items), build_section(n_items))
+    for n_asterisks in N_ASTERISKS:
+        report("{} asterisks".format(n_asterisks), "*" * n_asterisks)
@@ -0,0 +1,131 @@
+""" Times the splitting of (cleaned) numpy- and google-style docstrings, from 1 KB to 200 KB,
+    into their sections: by the single-pass section scanners of the parse tools versus by the
+    line-by-line loop that they replaced. The removal of the docstrings' indentation, which both
+    share, and the parse tools themselves (uncached) are timed alongside.
+
+    Usage: python benchmarks/section_tokenizer.py"""
+
+from __future__ import print_function
+
+import timeit
+from inspect import cleandoc
+
+from custom_inherit._doc_parse_tools import napoleon_parse_tools, numpy_parse_tools
+from custom_inherit._doc_parse_tools.section_scanner import clean_doc
+
+SIZES_KB = (1, 10, 50, 200)
+
+ITEMS_PER_SECTION = 8
+
+NUMPY_SECTION = """
+    {name}
+    {underline}
+{items}
+"""
+
+NUMPY_ITEM = """    x{n} : int
+        The {n}th parameter, whose description
+        spans a couple of lines."""
+
+GOOGLE_SECTION = """
+    {name}:
+{items}
+"""
+
+GOOGLE_ITEM = """        x{n} (int): The {n}th parameter, whose description
+            spans a couple of lines."""
+
+NAMES = ("Parameters", "Returns", "Notes", "Examples", "See Also", "Raises")
+
+
+def build_doc(section, item, size_kb):
+    doc = ["Short summary.\n\n    Extended summary."]
+    n = 0
+    while sum(len(part) for part in doc) < 1024 * size_kb:
+        name = NAMES[n % len(NAMES)]
+        items = "\n".join(item.format(n=i) for i in range(ITEMS_PER_SECTION))
+        doc.append(section.format(name=name, underline="-" * len(name), items=items))
+        n += 1
+    return "".join(doc)
+
+
+def line_loop(doc, headers, underlined):
+    """ The line-by-line splitting of a docstring into its sections, prior to the scanners."""
+    sections = {}
+    lines = iter(doc.splitlines())
+    key = "Short Summary"
+    body = []
+    while True:
+        try:
+            line = next(lines).rstrip()
+            header = line if underlined else (line[:-1] if line.endswith(":") else line)
+            if header and header in headers:
+                sections[key] = "\n".join(body).rstrip() if body else None
+                body = []
+                key = header
+                if underlined:
+                    next(lines)  # skip section delimiter
+            else:
+                body.append(line)
+        except StopIteration:
+            sections[key] = "\n".join(body)
+            break
+    return sections
+
+
+def scan(doc, scanner):
+    sections = scanner.split(doc)
+    doc_sections = dict(
+        (header or "Short Summary", None if body is None else body.rstrip())
+        for header, body in sections[:-1]
+    )
+    header, body = sections[-1]
+    doc_sections[header or "Short Summary"] = body or ""
+    return doc_sections
+
+
+def best_of(func, repeat=5):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+if __name__ == "__main__":
+    headers = napoleon_parse_tools._HEADERS
+    cases = (
+        ("numpy", (NUMPY_SECTION, NUMPY_ITEM), numpy_parse_tools._SCANNER, True),
+        (
+            "google",
+            (GOOGLE_SECTION, GOOGLE_ITEM),
+            napoleon_parse_tools._SCANNERS["google"],
+            False,
+        ),
+    )
+    parsers = {
+        "numpy": numpy_parse_tools.parse_numpy_doc.__wrapped__,
+        "google": lambda doc: napoleon_parse_tools.parse_napoleon_doc.__wrapped__(
+            doc, "google"
+        ),
+    }
+    for style, template, scanner, underlined in cases:
+        for size_kb in SIZES_KB:
+            raw = build_doc(*template, size_kb=size_kb)
+            doc = clean_doc(raw)
+            assert scan(doc, scanner) == line_loop(doc, headers, underlined)
+
+            loop = best_of(lambda: line_loop(doc, headers, underlined))
+            scanned = best_of(lambda: scan(doc, scanner))
+            cleaned = best_of(lambda: cleandoc(raw))
+            parsed = best_of(lambda: parsers[style](raw))
+            print(
+                "{:>6} {:>4} KB: line loop {:8.1f} us | scanner {:8.1f} us ({:.1f}x)"
+                " | cleandoc {:8.1f} us | full parse {:8.1f} us".format(
+                    style,
+                    size_kb,
+                    1e6 * loop,
+                    1e6 * scanned,
+                    loop / scanned,
+                    1e6 * cleaned,
+                    1e6 * parsed,
+                )
+            )
@@ -0,0 +1,58 @@
+""" Times the creation of a numpy-documented class that derives from 10 mixins, each
+    sharing a common base, and reports the number of parent docstrings merged into its
+    docstring when the bases' mros are walked separately versus the linearized mro.
+
+    Usage: python benchmarks/wide_mixins.py"""
+
+from __future__ import print_function
+
+import timeit
+
+from custom_inherit import DocInheritMeta, merge_cache, parse_cache
+
+N_MIXINS = 10
+
+
+def build_mixins(meta, n_mixins=N_MIXINS):
+    base = meta(
+        "Base",
+        (object,),
+        dict(
+            __doc__="Base.\n\nParameters\n----------\nx : int\n    The base parameter."
+        ),
+    )
+    return tuple(
+        meta(
+            "Mixin{}".format(n),
+            (base,),
+            dict(
+                __doc__="Parameters\n----------\ny{0} : int\n    Mixin {0}.".format(n)
+            ),
+        )
+        for n in range(n_mixins)
+    )
+
+
+def main():
+    meta = DocInheritMeta(style="numpy_with_merge")
+    mixins = build_mixins(meta)
+    child = meta("Child", mixins, {})
+
+    per_base = sum(len(mixin.__mro__) for mixin in mixins)
+    print(
+        "parent docstrings merged: {} (per base) vs {} (linearized)".format(
+            per_base, len(child.__mro__) - 1
+        )
+    )
+
+    def run():
+        parse_cache.clear()
+        merge_cache.clear()
+        meta("Child", mixins, {})
+
+    best = min(timeit.repeat(run, number=20, repeat=5)) / 20
+    print("{:.3f} ms per class with {} mixins".format(1e3 * best, N_MIXINS))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 from __future__ import absolute_import as _absolute_import
 
+import os as _os
+import sys as _sys
+import weakref as _weakref
 from abc import ABCMeta as _ABCMeta
 
-from . import _style_store
+from . import _cache, _style_store
+from ._cache import MemoizedStyle as _MemoizedStyle
+from ._cache import merge_cache, parse_cache
 from ._decorator_base import DocInheritDecorator as _DocInheritDecorator
 from ._metaclass_base import DocInheritorBase as _DocInheritorBase
+from ._metaclass_base import _MetaclassDoc
 from ._style_store import (
     google,
     google_with_merge,
@@ -15,10 +21,26 @@ from ._style_store import (
     parent,
     reST,
 )
-from ._version import get_versions
+from ._warm import WarmInfo, warm, warm_in_background
+
+if _sys.version_info < (3, 7):  # module-level __getattr__ is unsupported (PEP 562)
+    from ._version import get_versions
+
+    __version__ = get_versions()["version"]
+    del get_versions
+else:
+
+    def __getattr__(name):
+        # Resolving the version may spawn git subprocesses (e.g. for a source checkout), thus
+        # it is deferred until `__version__` is first accessed.
+        if name == "__version__":
+            from ._version import get_versions
+
+            global __version__
+            __version__ = get_versions()["version"]
+            return __version__
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
-__version__ = get_versions()["version"]
-del get_versions
 
 try:
     _basestring = basestring
@@ -26,7 +48,23 @@ except NameError:
     _basestring = str  # Python 2 -> 3 alias
 
 
-__all__ = ["DocInheritMeta", "doc_inherit", "store", "add_style", "remove_style"]
+__all__ = [
+    "DocInheritMeta",
+    "doc_inherit",
+    "store",
+    "add_style",
+    "remove_style",
+    "merge_cache",
+    "parse_cache",
+    "enable_disk_cache",
+    "disable_disk_cache",
+    "publish_shared_cache",
+    "attach_shared_cache",
+    "detach_shared_cache",
+    "warm",
+    "warm_in_background",
+    "WarmInfo",
+]
 
 
 def _check_style_function(style_func):
@@ -41,10 +79,16 @@ class _Store(object):
     respectively.
 
     Only callable objects with the signature: f(Optional[str], Optional[str]) -> Optional[str]
-    can be stored. If f is a valid callable, then _Store()[f] -> f."""
+    can be stored. If f is a valid callable, then _Store()[f] -> f.
+
+    Unless opted out of, the merges performed by a stored style are memoized in
+    `custom_inherit.merge_cache`; see `_Store.get_merger`."""
 
     def __init__(self, *args, **kwargs):
         self._store = dict()
+        self._mergers = dict()
+        # the style functions that have passed validation, which need not be validated again
+        self._validated = _weakref.WeakKeyDictionary()
         self.update(*args, **kwargs)
 
     def __repr__(self):
@@ -55,6 +99,9 @@ class _Store(object):
         styles = "\n".join("\t- " + style for style in sorted(self.keys()))
         return "\n".join((out_str, styles))
 
+    def __contains__(self, style_name):
+        return style_name in self._store
+
     def __setitem__(self, style_name, style_func):
         """Make available a new function for merging a 'parent' and 'child' docstring.
 
@@ -64,14 +111,49 @@ class _Store(object):
             The identifier of the style being logged
         style_func: Callable[[Optional[str], Optional[str]], Optional[str]]
             The style function that merges two docstrings into a single docstring."""
+        self.register(style_name, style_func)
+
+    def register(self, style_name, style_func, memoize=True):
+        """Make available a new function for merging a 'parent' and 'child' docstring.
+
+        Parameters
+        ----------
+        style_name : Any
+            The identifier of the style being logged
+        style_func: Callable[[Optional[str], Optional[str]], Optional[str]]
+            The style function that merges two docstrings into a single docstring.
+        memoize : bool, optional (default: True)
+            If True, the docstrings merged by this style are cached in `custom_inherit.merge_cache`.
+            Styles whose output does not depend solely on their inputs must opt out of this."""
         try:
-            _check_style_function(style_func)
+            self._validate(style_func)
         except TypeError:
             raise TypeError(
                 "The style store only stores callables of the form: "
                 "\n\tstyle_func(Optional[str], Optional[str]) -> Optional[str]"
             )
+        self._register(style_name, style_func, memoize)
+
+    def _register(self, style_name, style_func, memoize=True):
+        """ Stores a style function without validating it; used for the built-in styles."""
         self._store[style_name] = style_func
+        self._mergers[style_name] = _memoize(style_func) if memoize else style_func
+
+    def _validate(self, style_func):
+        """Validates a style function by a trial call, unless it has already passed validation.
+
+        Raises
+        ------
+        TypeError
+            `style_func` is not a valid style function."""
+        try:
+            if style_func in self._validated:
+                return
+        except TypeError:  # cannot be weakly referenced
+            _check_style_function(style_func)
+            return
+        _check_style_function(style_func)
+        self._validated[style_func] = True
 
     def __getitem__(self, item):
         """Given a valid style-ID, retrieve a stored style. If a valid function (callable) is
@@ -83,15 +165,32 @@ class _Store(object):
             A valid style-ID or style-function."""
         try:
             return self._store[item]
-        except KeyError:
+        except (KeyError, TypeError):  # an unhashable style function is not a style-ID
             try:
-                _check_style_function(item)
+                self._validate(item)
                 return item
             except (TypeError, ValueError):
                 raise TypeError(
                     "Either a valid style name or style-function must be specified"
                 )
 
+    def get_merger(self, item):
+        """Given a valid style-ID, retrieve the (possibly memoized) function that performs the
+        stored style's merges. If a valid function (callable) is supplied, return it in place.
+
+        Parameters
+        ----------
+        item : Union[Any, Callable[Optional[str], Optional[str]], Optional[str]]
+            A valid style-ID or style-function.
+
+        Returns
+        -------
+        Callable[[Optional[str], Optional[str]], Optional[str]]"""
+        try:
+            return self._mergers[item]
+        except (KeyError, TypeError):
+            return self[item]
+
     def keys(self):
         """  D.keys() -> a set-like object providing a view on D's keys"""
         return self._store.keys()
@@ -100,6 +199,8 @@ class _Store(object):
         """D.pop(k[,d]) -> v, remove specified key and return the corresponding value.
         If key is not found, d is returned if given, otherwise KeyError is raised."""
         if len(args) < 3:
+            if args:
+                self._mergers.pop(args[0], None)
             return self._store.pop(*args)
         else:
             raise TypeError(
@@ -124,10 +225,25 @@ class _Store(object):
         return self._store.items()
 
 
-store = _Store([(key, getattr(_style_store, key)) for key in _style_store.__all__])
+def _memoize(style_func):
+    try:
+        hash(style_func)
+    except TypeError:
+        return style_func
+    return _MemoizedStyle(style_func)
+
+
+store = _Store()
+for _style_name in _style_store.__all__:
+    # the built-in styles are trusted: validating them would parse docstrings upon import;
+    # "parent" merely picks one of its inputs, which is cheaper than a lookup in the cache
+    store._register(
+        _style_name, getattr(_style_store, _style_name), _style_name != "parent"
+    )
+del _style_name
 
 
-def add_style(style_name, style_func):
+def add_style(style_name, style_func, memoize=True):
     """Make available a new function for merging a 'parent' and 'child' docstring.
 
     Parameters
@@ -135,8 +251,11 @@ def add_style(style_name, style_func):
     style_name : Any
         The identifier of the style being logged
     style_func: Callable[[Optional[str], Optional[str]], Optional[str]]
-        The style function that merges two docstrings into a single docstring."""
-    store[style_name] = style_func
+        The style function that merges two docstrings into a single docstring.
+    memoize : bool, optional (default: True)
+        If True, the docstrings merged by this style are cached in `custom_inherit.merge_cache`.
+        Styles whose output does not depend solely on their inputs must opt out of this."""
+    store.register(style_name, style_func, memoize=memoize)
 
 
 def remove_style(style):
@@ -150,8 +269,134 @@ def remove_style(style):
         store.pop(style)
 
 
+def enable_disk_cache(path=None, max_entries=100000, version=None):
+    """Persist the docstrings merged by stored styles in an on-disk cache, which is shared by
+    all processes that use the same cache file. This is consulted before a merge is performed
+    (and after `merge_cache` is).
+
+    The cache is keyed by the version of custom_inherit, by the code of the style function,
+    and by the docstrings merged, so that its entries are invalidated once the code of a style
+    changes. The helper functions and the globals that a style function uses are not part of
+    its key: bump `version` once these change. Styles whose state cannot be hashed - callable objects, bound methods, and closures
+    over anything but primitive values - are not cached on disk. Setting the environment
+    variable CUSTOM_INHERIT_CACHE_DIR enables the cache, within that directory, upon import.
+
+    Parameters
+    ----------
+    path : Optional[str]
+        The path of the cache's sqlite database. By default, this is the file merged_docs.sqlite3
+        within CUSTOM_INHERIT_CACHE_DIR, or within ~/.cache/custom_inherit.
+
+    max_entries : int, optional (default: 100000)
+        The maximum number of docstrings held by the cache; the oldest are evicted first.
+
+    version : Optional[str]
+        Salts the keys of the cache, such that bumping it invalidates the cached docstrings.
+
+    Returns
+    -------
+    custom_inherit._disk_cache.DiskCache"""
+    from ._disk_cache import DiskCache, default_cache_dir
+
+    if path is None:
+        path = _os.path.join(default_cache_dir(), "merged_docs.sqlite3")
+    disable_disk_cache()
+    _cache.disk_cache = DiskCache(path, max_entries=max_entries, version=version)
+    return _cache.disk_cache
+
+
+def disable_disk_cache():
+    """ Stop using the on-disk cache of merged docstrings, committing any pending writes to it."""
+    disk_cache, _cache.disk_cache = _cache.disk_cache, None
+    if disk_cache is not None:
+        disk_cache.close()
+
+
+if _os.environ.get("CUSTOM_INHERIT_CACHE_DIR"):
+    enable_disk_cache()
+
+
+def publish_shared_cache(name=None):
+    """Publish the docstrings held by `merge_cache` in a read-only table in shared memory
+    (Python 3.8+), to which the worker processes spawned by this process attach upon importing
+    custom_inherit. Thus workers that re-import the same classes - e.g. in a multiprocessing pool
+    that uses the "spawn" start method - look their merged docstrings up, rather than merging them.
+
+    Call this once the classes and functions whose docstrings are to be shared are created
+    (and, if they are lazy, resolved; see `custom_inherit.warm`), and before the workers are
+    started. The name of the table is passed to them through the environment variable
+    CUSTOM_INHERIT_SHARED_CACHE. The table is destroyed once this process exits.
+
+    Parameters
+    ----------
+    name : Optional[str]
+        The name of the block of shared memory; a unique name is generated by default.
+
+    Returns
+    -------
+    custom_inherit._shared_cache.SharedDocTable"""
+    from ._shared_cache import ENV_VAR, SharedDocTable
+
+    entries = []
+    for (style_func, prnt_docs, child_doc), doc in merge_cache.items():
+        # folded merges are keyed by a tuple of parent docstrings
+        docs = prnt_docs if isinstance(prnt_docs, tuple) else (prnt_docs,)
+        entries.append((style_func, docs + (child_doc,), doc))
+
+    table = SharedDocTable.publish(entries, name=name)
+    _os.environ[ENV_VAR] = table.name
+    return table
+
+
+def attach_shared_cache(name=None):
+    """Consult the table of docstrings published, in shared memory, by another process (see
+    `publish_shared_cache`) upon misses of `merge_cache`. The processes spawned by a publishing
+    process attach to its table upon importing custom_inherit.
+
+    Parameters
+    ----------
+    name : Optional[str]
+        The name of the table; by default, the value of the environment variable
+        CUSTOM_INHERIT_SHARED_CACHE.
+
+    Returns
+    -------
+    Optional[custom_inherit._shared_cache.SharedDocTable]
+        None if there is no such table."""
+    from ._shared_cache import ENV_VAR, SharedDocTable
+
+    if name is None:
+        name = _os.environ.get(ENV_VAR)
+    detach_shared_cache()
+    if name:
+        try:
+            _cache.shared_cache = SharedDocTable.attach(name)
+        except (ImportError, OSError, ValueError):  # e.g. the publisher has exited
+            pass
+    return _cache.shared_cache
+
+
+def detach_shared_cache():
+    """ Stop consulting the table of docstrings published, in shared memory, by another process."""
+    shared_cache, _cache.shared_cache = _cache.shared_cache, None
+    if shared_cache is not None:
+        shared_cache.close()
+
+
+if _os.environ.get("CUSTOM_INHERIT_SHARED_CACHE"):
+    attach_shared_cache()
+
+
+# DocInheritMeta's metaclasses, keyed by their merge function and options
+_metaclasses = dict()
+
+
 def DocInheritMeta(
-    style="parent", abstract_base_class=False, include_special_methods=False
+    style="parent",
+    abstract_base_class=False,
+    include_special_methods=False,
+    incremental=False,
+    lazy=False,
 ):
     """A metaclass that merges the respective docstrings of a parent class and of its child, along with their
     properties, methods (including classmethod, staticmethod, decorated methods).
@@ -172,26 +417,81 @@ def DocInheritMeta(
         Wether special methods of class (i.e. starting en ending with "__") are included in the docstring
         inheritance process.
 
+    incremental: bool, optional (default: False)
+        If True, a class' docstring is merged with the docstrings of its bases, whose own docstrings
+        are, in turn, already merged with those of their ancestors. Thus a class costs one merge
+        per base, rather than one merge per class in the mro of each of its bases.
+
+    lazy: bool, optional (default: False)
+        If True, the docstrings of a class and of its attributes are merged when they are first
+        accessed (e.g. via `cls.__doc__`, `inspect.getdoc`, or `help`), rather than when the class
+        is created.
 
     Returns
     -------
-    custom_inherit.DocInheritorBase"""
+    custom_inherit.DocInheritorBase
 
-    merge_func = store[style]
-    metaclass = type(
-        _DocInheritorBase.__name__,
-        _DocInheritorBase.__bases__,
-        dict(_DocInheritorBase.__dict__),
+    Notes
+    -----
+    The metaclasses are cached: calls that specify the same (resolved) style and options
+    return the same metaclass.
+
+    When Python runs with `-OO`, which strips all docstrings, the metaclass creates classes
+    without merging anything. The environment variable CUSTOM_INHERIT_PASSTHROUGH forces this
+    mode when set (e.g. to "1"), or disables it when set to "0"."""
+
+    name = getattr(style, "__name__", None)
+    if (
+        name in _style_store.__all__
+        and style is getattr(_style_store, name)
+        and store._store.get(name) is style
+    ):
+        # a built-in style, passed as a function, is merged as it is when passed by name
+        style = name
+    style_func = store[style]
+    merge_func = store.get_merger(style)
+    if _DocInheritorBase.passthrough:
+        lazy = False  # there is nothing to resolve
+
+    # keyed by the style function itself, rather than by the merger that memoizes it
+    key = (
+        style_func,
+        merge_func is style_func,
+        bool(abstract_base_class),
+        bool(include_special_methods),
+        bool(incremental),
+        bool(lazy),
     )
-    metaclass.include_special_methods = include_special_methods
-    metaclass.class_doc_inherit = staticmethod(merge_func)
-    metaclass.attr_doc_inherit = staticmethod(merge_func)
-
-    return (
-        metaclass
-        if not abstract_base_class
-        else type("abc" + metaclass.__name__, (_ABCMeta, metaclass), {})
+    try:
+        return _metaclasses[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable style function
+        key = None
+
+    namespace = dict(
+        include_special_methods=include_special_methods,
+        incremental=incremental,
+        lazy=lazy,
+        class_doc_inherit=staticmethod(merge_func),
+        attr_doc_inherit=staticmethod(merge_func),
     )
+    if lazy:
+        # resolves the pending docstrings of the metaclass' instances
+        namespace["__doc__"] = _MetaclassDoc()
+
+    metaclass = type(_DocInheritorBase.__name__, (_DocInheritorBase,), namespace)
+    if abstract_base_class:
+        metaclass = type(
+            "abc" + metaclass.__name__,
+            (_ABCMeta, metaclass),
+            dict(__doc__=namespace["__doc__"]) if lazy else {},
+        )
+
+    if key is not None:
+        metaclass = _metaclasses.setdefault(key, metaclass)
+    return metaclass
 
 
 def doc_inherit(parent, style="parent"):
@@ -214,9 +514,12 @@ def doc_inherit(parent, style="parent"):
     Notes
     -----
     `doc_inherit` should always be used as the inner-most decorator when being used in
-    conjunction with other decorators, such as `@property`, `@staticmethod`, etc."""
+    conjunction with other decorators, such as `@property`, `@staticmethod`, etc.
+
+    Like `DocInheritMeta`, the decorator merges nothing when Python runs with `-OO`, or when
+    the environment variable CUSTOM_INHERIT_PASSTHROUGH is set."""
 
-    merge_func = store[style]
+    merge_func = store.get_merger(style)
     decorator = _DocInheritDecorator
     decorator.doc_merger = staticmethod(merge_func)
     return decorator(parent)
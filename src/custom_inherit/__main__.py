@@ -0,0 +1,108 @@
+from __future__ import absolute_import, print_function
+
+import argparse
+import sys
+
+""" The command-line interface of custom_inherit.
+
+    Usage: python -m custom_inherit compile <package>
+           python -m custom_inherit inline <root> [--output <dir>]
+           python -m custom_inherit stubs <root> --output <dir> [--force]"""
+
+
+def _compile(args):
+    from ._sidecar import compile_package
+
+    path, n_docs = compile_package(args.package)
+    print("Compiled {} docstrings into {}".format(n_docs, path))
+    return 0
+
+
+def _inline(args):
+    from ._inline import inline_project
+
+    inlined, problems = inline_project(args.root, output=args.output)
+    print(
+        "Inlined {} docstrings into {} files".format(
+            sum(inlined.values()), len(inlined)
+        )
+    )
+    if problems:
+        print("The following could not be resolved statically:")
+        for problem in problems:
+            print("  " + problem)
+        return 1
+    return 0
+
+
+def _stubs(args):
+    from ._stubs import generate_stubs
+
+    written, problems = generate_stubs(args.root, output=args.output, force=args.force)
+    print("Generated {} stubs".format(len(written)))
+    if problems:
+        print("The following could not be resolved statically:")
+        for problem in problems:
+            print("  " + problem)
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m custom_inherit")
+    subparsers = parser.add_subparsers(dest="command")
+
+    compile_parser = subparsers.add_parser(
+        "compile",
+        help="Resolve the inherited docstrings of a package ahead of time, and write them "
+        "into its sidecar module, <package>._custom_inherit_docs",
+    )
+    compile_parser.add_argument("package", help="The name of a top-level package")
+    compile_parser.set_defaults(func=_compile)
+
+    inline_parser = subparsers.add_parser(
+        "inline",
+        help="Rewrite the sources of a project such that their inherited docstrings are "
+        "inlined, reporting any hierarchy that cannot be resolved statically",
+    )
+    inline_parser.add_argument(
+        "root", help="The directory from which the project's modules are imported"
+    )
+    inline_parser.add_argument(
+        "--output",
+        default=None,
+        help="Rewrite a copy of the project, in this directory, instead of the project itself",
+    )
+    inline_parser.set_defaults(func=_inline)
+
+    stubs_parser = subparsers.add_parser(
+        "stubs",
+        help="Generate type stubs (.pyi files) that carry the inherited docstrings of a "
+        "project; only the stubs of changed modules are regenerated",
+    )
+    stubs_parser.add_argument(
+        "root", help="The directory from which the project's modules are imported"
+    )
+    stubs_parser.add_argument(
+        "--output",
+        required=True,
+        help="The directory into which the stubs are written (e.g. typings), which must not be "
+        "the project's own",
+    )
+    stubs_parser.add_argument(
+        "--force", action="store_true", help="Regenerate every stub"
+    )
+    stubs_parser.set_defaults(func=_stubs)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "func", None) is None:
+        parser.print_help()
+        return 2
+    try:
+        return args.func(args)
+    except ValueError as err:
+        parser.error(str(err))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
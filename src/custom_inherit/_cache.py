@@ -0,0 +1,338 @@
+from __future__ import absolute_import
+
+from collections import OrderedDict, namedtuple
+from functools import update_wrapper, wraps
+from threading import RLock
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # for Python 2
+    from collections import Mapping
+
+""" Exposes the bounded caches that spare re-parsing and re-merging identical docstrings.
+
+    Parsed docstrings are shared between every caller that parses the same text, thus
+    they are handed out as read-only mappings."""
+
+__all__ = [
+    "BoundedCache",
+    "CacheInfo",
+    "MemoizedStyle",
+    "ReadOnlyDict",
+    "cached_parse",
+    "merge_cache",
+    "parse_cache",
+]
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+_POLICIES = ("lru", "fifo")
+
+
+class BoundedCache(object):
+    """A thread-safe mapping that holds at most `maxsize` entries. Once it is full, the least
+    recently used entry ("lru" policy) or the oldest entry ("fifo" policy) is evicted.
+
+    Hit and miss statistics are reported by `info()`, and all entries are dropped by `clear()`.
+
+    A frozen cache (see `freeze()`) leaves its entries, and its statistics, untouched upon lookups."""
+
+    def __init__(self, maxsize=1024, policy="lru"):
+        """
+        Parameters
+        ----------
+        maxsize : int, optional (default: 1024)
+            The maximum number of entries held by the cache.
+
+        policy : str, optional (default: "lru")
+            The eviction policy: "lru" (least recently used) or "fifo" (first in, first out)."""
+        self._data = OrderedDict()
+        self._lock = RLock()
+        self._maxsize = _validate_maxsize(maxsize)
+        self._policy = _validate_policy(policy)
+        self._hits = 0
+        self._misses = 0
+        self._frozen = False
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, self.info())
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    @property
+    def maxsize(self):
+        """ The maximum number of entries held by the cache. Shrinking it evicts entries right away."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        with self._lock:
+            self._maxsize = _validate_maxsize(value)
+            self._evict()
+
+    @property
+    def policy(self):
+        """ The eviction policy of the cache: "lru" or "fifo"."""
+        return self._policy
+
+    @policy.setter
+    def policy(self, value):
+        with self._lock:
+            self._policy = _validate_policy(value)
+
+    @property
+    def frozen(self):
+        """ Whether lookups leave the cache untouched; see `freeze()`."""
+        return self._frozen
+
+    def freeze(self):
+        """Stop reordering entries, and counting hits and misses, upon lookups. Thus the pages
+        of memory that hold the cache are not written to when it is read from - e.g. so that the
+        worker processes forked from a server share them, copy-on-write. New entries are still
+        cached."""
+        with self._lock:
+            self._frozen = True
+
+    def unfreeze(self):
+        """ Resume reordering entries, and counting hits and misses, upon lookups."""
+        with self._lock:
+            self._frozen = False
+
+    def get(self, key, default=None):
+        """Return the value cached for `key`. Under the "lru" policy, the entry is marked as
+        the most recently used one.
+
+        Parameters
+        ----------
+        key : Hashable
+        default : Any, optional (default: None)
+            Returned (and counted as a miss) if `key` is not cached.
+
+        Returns
+        -------
+        Any"""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if self._frozen:
+                return default if value is _MISSING else value
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            if self._policy == "lru":
+                del self._data[key]
+                self._data[key] = value
+            self._hits += 1
+            return value
+
+    def put(self, key, value):
+        """Cache `value` under `key`, evicting an entry if the cache is full.
+
+        Parameters
+        ----------
+        key : Hashable
+        value : Any"""
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            self._evict()
+
+    def items(self):
+        """ Returns a list of the (key, value) entries of the cache, from the oldest to the newest."""
+        with self._lock:
+            return list(self._data.items())
+
+    def info(self):
+        """ Returns a CacheInfo(hits, misses, maxsize, currsize) report of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def clear(self):
+        """ Remove all entries from the cache and reset its statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _evict(self):
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+def _validate_maxsize(maxsize):
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 0:
+        raise ValueError(
+            "`maxsize` must be a non-negative integer, got: {!r}".format(maxsize)
+        )
+    return maxsize
+
+
+def _validate_policy(policy):
+    if policy not in _POLICIES:
+        raise ValueError(
+            "`policy` must be one of {}, got: {!r}".format(_POLICIES, policy)
+        )
+    return policy
+
+
+class ReadOnlyDict(Mapping):
+    """An insertion-ordered mapping that cannot be modified.
+
+    `copy()` returns a mutable `OrderedDict` holding the same items."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, *args, **kwargs):
+        self._data = OrderedDict(*args, **kwargs)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self._data.items()))
+
+    def copy(self):
+        return OrderedDict(self._data)
+
+
+def _freeze(doc_sections):
+    """ Recursively convert the (ordered) dictionaries of a parsed docstring into read-only mappings."""
+    return ReadOnlyDict(
+        (key, _freeze(value) if isinstance(value, dict) else value)
+        for key, value in doc_sections.items()
+    )
+
+
+parse_cache = BoundedCache(maxsize=2048)
+
+
+def cached_parse(style):
+    """Returns a decorator that caches, in `parse_cache`, the sections extracted by a docstring
+    parser; these are keyed by the docstring, `style`, and any additional arguments of the parser.
+
+    Parameters
+    ----------
+    style : str
+        Identifies the docstring format handled by the parser.
+
+    Returns
+    -------
+    Callable[[Callable[..., Mapping]], Callable[..., ReadOnlyDict]]"""
+
+    def decorator(parse):
+        @wraps(parse)
+        def wrapper(doc, *args):
+            key = (style, doc) + args
+            doc_sections = parse_cache.get(key, _MISSING)
+            if doc_sections is _MISSING:
+                doc_sections = _freeze(parse(doc, *args))
+                parse_cache.put(key, doc_sections)
+            return doc_sections
+
+        return wrapper
+
+    return decorator
+
+
+merge_cache = BoundedCache(maxsize=4096)
+
+# the table shared by the process that spawned this one, consulted upon misses of `merge_cache`;
+# see `custom_inherit.attach_shared_cache`
+shared_cache = None
+
+# the persistent cache consulted upon misses of `merge_cache` (and `shared_cache`);
+# see `custom_inherit.enable_disk_cache`
+disk_cache = None
+
+
+class MemoizedStyle(object):
+    """Wraps a (pure) style function so that its merged docstrings are cached in `merge_cache`,
+    keyed by the style function and the parent's and child's docstrings, and in `disk_cache`
+    if it is enabled."""
+
+    def __init__(self, style_func):
+        """
+        Parameters
+        ----------
+        style_func: Callable[[Optional[str], Optional[str]], Optional[str]]
+            The style function whose results are memoized."""
+        self.style_func = style_func
+        try:
+            update_wrapper(self, style_func)
+        except AttributeError:
+            # Python 2 requires the wrapped callable to have a __name__
+            pass
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, self.style_func)
+
+    def __call__(self, prnt_doc, child_doc):
+        return self._memoized(
+            (self.style_func, prnt_doc, child_doc),
+            (prnt_doc, child_doc),
+            lambda: self.style_func(prnt_doc, child_doc),
+        )
+
+    def fold(self, prnt_docs, child_doc):
+        """Merge the child's docstring with each of the parents' docstrings in turn, with the
+        accumulated docstring serving as the 'child' for each subsequent merge. The result is
+        memoized as a whole.
+
+        Parameters
+        ----------
+        prnt_docs : Sequence[Optional[str]]
+        child_doc : Optional[str]
+
+        Returns
+        -------
+        Optional[str]"""
+        prnt_docs = tuple(prnt_docs)
+        if not prnt_docs:
+            return child_doc
+
+        def fold():
+            doc = child_doc
+            for prnt_doc in prnt_docs:
+                doc = self.style_func(prnt_doc, doc)
+            return doc
+
+        return self._memoized(
+            (self.style_func, prnt_docs, child_doc), prnt_docs + (child_doc,), fold
+        )
+
+    def _memoized(self, key, docs, merge):
+        doc = merge_cache.get(key, _MISSING)
+        if doc is not _MISSING:
+            return doc
+
+        shared = shared_cache
+        if shared is not None:
+            shared_key = shared.key(self.style_func, docs)
+            if shared_key is not None:
+                doc = shared.get(shared_key, _MISSING)
+                if doc is not _MISSING:
+                    merge_cache.put(key, doc)
+                    return doc
+
+        disk = disk_cache
+        disk_key = disk.key(self.style_func, docs) if disk is not None else None
+        if disk_key is not None:
+            doc = disk.get(disk_key, _MISSING)
+        if doc is _MISSING:
+            doc = merge()
+            if disk_key is not None:
+                disk.put(disk_key, doc)
+        merge_cache.put(key, doc)
+        return doc
@@ -1,3 +1,6 @@
+from . import _sidecar
+from ._metaclass_base import _passthrough_mode
+
 try:
     basestring
 except NameError:
@@ -20,7 +23,12 @@ class DocInheritDecorator(object):
     Notes
     -----
     When utilized as the inner-most decorator, this decorator can be used on functions decorated functions,
-    methods, properties, static methods, class methods, and their abstract counterparts."""
+    methods, properties, static methods, class methods, and their abstract counterparts.
+
+    If `passthrough` is True, the decorated function is returned as-is; see
+    `custom_inherit._metaclass_base._passthrough_mode`."""
+
+    passthrough = _passthrough_mode()
 
     def __init__(self, prnt_doc):
         """
@@ -32,6 +40,8 @@ class DocInheritDecorator(object):
         self.prnt_doc = (
             prnt_doc if isinstance(prnt_doc, basestring) else prnt_doc.__doc__
         )
+        # the object that the docstring is inherited from, if any
+        self._prnt = () if isinstance(prnt_doc, basestring) else (prnt_doc,)
 
     def __call__(self, func):
         """
@@ -45,7 +55,15 @@ class DocInheritDecorator(object):
         FunctionType
             The decorated function/method/property whose docstring is given by
             DocInheritDecorator.doc_merger(prnt_attr_doc, child_doc)"""
-        func.__doc__ = self.doc_merger(self.prnt_doc, func.__doc__)
+        if self.passthrough:
+            return func
+
+        # a docstring compiled ahead of time, by `python -m custom_inherit compile`, is used as-is
+        doc = _sidecar.compiled_doc(func)
+        if doc is _sidecar._MISSING:
+            doc = self.doc_merger(self.prnt_doc, func.__doc__)
+        func.__doc__ = doc
+        _sidecar.record(func, self._prnt)
         return func
 
     @staticmethod
@@ -0,0 +1,261 @@
+from __future__ import absolute_import
+
+import atexit
+import hashlib
+import os
+import sqlite3
+import threading
+
+from ._fingerprint import style_fingerprint, update_with_doc
+
+""" Exposes the persistent, on-disk cache of merged docstrings.
+
+    Merged docstrings are stored in a sqlite database, keyed by a hash of the version of
+    custom_inherit (and of the cache), the code of the style function, and the docstrings that
+    it merged.
+    Thus processes that merge the same docstrings - e.g. successive runs of a command-line tool,
+    or the workers of a test suite - need only merge them once.
+
+    The database is accessed in write-ahead-logging mode, so that concurrent processes can read
+    it while another writes to it; writes are buffered and committed in batches."""
+
+__all__ = ["DiskCache", "default_cache_dir", "style_fingerprint"]
+
+_MISSING = object()
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS docs (key TEXT PRIMARY KEY, doc TEXT)"
+
+
+def default_cache_dir():
+    """Returns the directory in which the disk cache is stored by default: the directory
+    named by the environment variable CUSTOM_INHERIT_CACHE_DIR, otherwise the directory
+    custom_inherit within the user's cache directory.
+
+    Returns
+    -------
+    str"""
+    cache_dir = os.environ.get("CUSTOM_INHERIT_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base_dir, "custom_inherit")
+
+
+class DiskCache(object):
+    """A persistent mapping of merged docstrings, which is safe to share between concurrent
+    processes and threads. Once it holds more than `max_entries` entries, the entries that
+    were written the longest ago are evicted.
+
+    The cache is best-effort: a database that cannot be read from or written to (e.g. as it
+    is locked for longer than `timeout`) simply results in cache misses."""
+
+    def __init__(
+        self, path, max_entries=100000, buffer_size=256, timeout=30.0, version=None
+    ):
+        """
+        Parameters
+        ----------
+        path : str
+            The path of the sqlite database; its directory is created as needed.
+
+        max_entries : int, optional (default: 100000)
+            The maximum number of entries held by the cache.
+
+        buffer_size : int, optional (default: 256)
+            The number of writes that are buffered before being committed to the database.
+            Buffered writes are also committed when the process exits.
+
+        timeout : float, optional (default: 30.0)
+            The number of seconds to wait for a concurrent writer to release the database.
+
+        version : Optional[str]
+            Salts the keys of the cache. As only the code of a style function is hashed (see
+            `style_fingerprint`), this must be changed once a helper function or a global that
+            a style uses is changed, so that the entries merged by its former version are not
+            used."""
+        self.path = path
+        self.max_entries = max_entries
+        self.buffer_size = buffer_size
+        self.timeout = timeout
+        self.version = version
+        self._salt = None  # resolved upon first use, as resolving the version is costly
+        self._fingerprints = {}
+        self._buffer = {}
+        self._writes = 0  # the number of writes since the buffer was last flushed
+        self._lock = threading.RLock()
+        self._conn = None
+        self._pid = None
+        self._at_exit = False  # whether `close` is registered to run at exit
+
+    def __repr__(self):
+        return "{}({!r}, max_entries={})".format(
+            type(self).__name__, self.path, self.max_entries
+        )
+
+    def __len__(self):
+        self.flush()
+        conn = self._connect()
+        with self._lock:
+            return conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def _connect(self):
+        # connections are not shared with a forked process
+        with self._lock:
+            if self._conn is None or self._pid != os.getpid():
+                cache_dir = os.path.dirname(os.path.abspath(self.path))
+                if not os.path.isdir(cache_dir):
+                    try:
+                        os.makedirs(cache_dir)
+                    except OSError:  # created concurrently
+                        pass
+                conn = sqlite3.connect(
+                    self.path,
+                    timeout=self.timeout,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(_SCHEMA)
+                if self._pid not in (None, os.getpid()):
+                    self._buffer.clear()  # the writes buffered by the parent process
+                self._conn = conn
+                self._pid = os.getpid()
+            return self._conn
+
+    def key(self, style_func, docs):
+        """Returns the key under which the docstring, merged by `style_func` from `docs`,
+        is cached.
+
+        Parameters
+        ----------
+        style_func : Callable[[Optional[str], Optional[str]], Optional[str]]
+        docs : Iterable[Optional[str]]
+            The docstrings that were merged.
+
+        Returns
+        -------
+        Optional[str]
+            None if the style cannot be cached on disk; see `style_fingerprint`."""
+        try:
+            fingerprint = self._fingerprints[style_func]
+        except KeyError:
+            fingerprint = self._fingerprints.setdefault(
+                style_func, style_fingerprint(style_func)
+            )
+        if fingerprint is None:
+            return None
+
+        if self._salt is None:
+            from . import __version__
+
+            salt = "custom_inherit {}".format(__version__)
+            if self.version is not None:
+                salt += " {}".format(self.version)
+            self._salt = salt.encode("utf-8")
+        sha = hashlib.sha1(self._salt)
+        sha.update(fingerprint.encode("utf-8"))
+        for doc in docs:
+            update_with_doc(sha, doc)
+        return sha.hexdigest()
+
+    def get(self, key, default=None):
+        """Return the docstring cached under `key`.
+
+        Parameters
+        ----------
+        key : str
+        default : Any, optional (default: None)
+            Returned if `key` is not cached.
+
+        Returns
+        -------
+        Any"""
+        with self._lock:
+            doc = self._buffer.get(key, _MISSING)
+            if doc is not _MISSING:
+                return doc
+            try:
+                row = (
+                    self._connect()
+                    .execute("SELECT doc FROM docs WHERE key = ?", (key,))
+                    .fetchone()
+                )
+            except sqlite3.Error:
+                return default
+        return default if row is None else row[0]
+
+    def put(self, key, doc):
+        """Cache `doc` under `key`. The write is committed once the buffer is full.
+
+        Parameters
+        ----------
+        key : str
+        doc : Optional[str]"""
+        with self._lock:
+            if not self._at_exit:
+                # commits the buffered writes; unregistered by `close`
+                atexit.register(self.close)
+                self._at_exit = True
+            self._buffer[key] = doc
+            self._writes += 1
+            if self._writes >= self.buffer_size:
+                self.flush()
+
+    def flush(self):
+        """Commit the buffered writes, and evict the oldest entries if the cache is full.
+        Writes that cannot be committed remain buffered."""
+        with self._lock:
+            self._writes = 0
+            if not self._buffer:
+                return
+            try:
+                conn = self._connect()
+                items = list(self._buffer.items())
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO docs (key, doc) VALUES (?, ?)", items
+                    )
+                    excess = (
+                        conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+                        - self.max_entries
+                    )
+                    if excess > 0:
+                        conn.execute(
+                            "DELETE FROM docs WHERE rowid IN "
+                            "(SELECT rowid FROM docs ORDER BY rowid LIMIT ?)",
+                            (excess,),
+                        )
+                    conn.execute("COMMIT")
+                    self._buffer.clear()
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error:
+                pass
+
+    def clear(self):
+        """ Remove all entries from the cache."""
+        with self._lock:
+            self._buffer.clear()
+            self._connect().execute("DELETE FROM docs")
+
+    def close(self):
+        """Commit the buffered writes and close the connection to the database. Unless some
+        writes could not be committed, the cache is no longer closed at exit."""
+        with self._lock:
+            if self._pid not in (None, os.getpid()):
+                # the connection was opened by the parent process
+                self._conn = None
+                return
+            self.flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            # `atexit.unregister` is not available on Python 2
+            if self._at_exit and not self._buffer and hasattr(atexit, "unregister"):
+                atexit.unregister(self.close)
+                self._at_exit = False
@@ -1,8 +1,11 @@
 from __future__ import absolute_import
 
-from .napoleon_parse_tools import merge_google_napoleon_docs, merge_numpy_napoleon_docs
-from .numpy_parse_tools import merge_numpy_docs
-from .rest_parse_tools import merge_rest_docs
+import sys as _sys
+
+""" The parse tools of the built-in styles.
+
+    The parse tools of each style are imported upon first use - e.g. the numpy parse tools are
+    not imported by an application that only merges reST docstrings."""
 
 __all__ = [
     "merge_numpy_docs",
@@ -10,3 +13,44 @@ __all__ = [
     "merge_numpy_napoleon_docs",
     "merge_google_napoleon_docs",
 ]
+
+# name -> the module, of this package, that defines it
+_LAZY_NAMES = {
+    "merge_numpy_docs": "numpy_parse_tools",
+    "merge_rest_docs": "rest_parse_tools",
+    "merge_numpy_napoleon_docs": "napoleon_parse_tools",
+    "merge_google_napoleon_docs": "napoleon_parse_tools",
+}
+
+
+def load(name):
+    """Returns the named parse tool, importing the module that defines it.
+
+    Parameters
+    ----------
+    name : str
+        One of `custom_inherit._doc_parse_tools.__all__`.
+
+    Returns
+    -------
+    Any"""
+    try:
+        return globals()[name]
+    except KeyError:
+        pass
+    try:
+        module = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    obj = globals()[name] = getattr(
+        __import__(module, globals(), None, [name], 1), name
+    )
+    return obj
+
+
+if _sys.version_info < (3, 7):  # module-level __getattr__ is unsupported (PEP 562)
+    for _name in _LAZY_NAMES:
+        globals()[_name] = load(_name)
+    del _name
+else:
+    __getattr__ = load
@@ -1,11 +1,21 @@
 from __future__ import absolute_import
 
 from collections import OrderedDict
-from inspect import cleandoc
 
+from .. import _cache
 from . import section_items
+from .section_scanner import SectionScanner, clean_doc
 
-__all__ = ["merge_google_napoleon_docs", "merge_numpy_napoleon_docs"]
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # for Python 2
+    from collections import Mapping
+
+__all__ = [
+    "merge_google_napoleon_docs",
+    "merge_numpy_napoleon_docs",
+]
 
 ALIASES = {
     "Args": "Parameters",
@@ -18,7 +28,35 @@ ALIASES = {
     "Example": "Examples",
 }
 
+_SECTIONS = (
+    "Short Summary",
+    "Attributes",
+    "Methods",
+    "Warning",
+    "Parameters",
+    "Other Parameters",
+    "Keyword Arguments",
+    "Returns",
+    "Yields",
+    "Raises",
+    "Notes",
+    "Warns",
+    "See Also",
+    "References",
+    "Todo",
+    "Examples",
+)
+
+# finds the headers of the sections (or of their aliases), including those of the sections
+# with items: underlined in numpy-style docstrings, followed by a colon in google-style ones
+_HEADERS = set(_SECTIONS) | section_items.SECTION_NAMES | set(ALIASES)
+_SCANNERS = {
+    "google": SectionScanner(_HEADERS, underlined=False, colon=True),
+    "numpy": SectionScanner(_HEADERS, underlined=True),
+}
+
 
+@_cache.cached_parse("napoleon")
 def parse_napoleon_doc(doc, style):
     """Extract the text from the various sections of a numpy-formatted docstring.
 
@@ -32,29 +70,12 @@ def parse_napoleon_doc(doc, style):
 
     Returns
     -------
-    OrderedDict[str, Union[None,str]]
-        The extracted numpy-styled docstring sections."""
-
-    napoleon_sections = [
-        "Short Summary",
-        "Attributes",
-        "Methods",
-        "Warning",
-        "Parameters",
-        "Other Parameters",
-        "Keyword Arguments",
-        "Returns",
-        "Yields",
-        "Raises",
-        "Notes",
-        "Warns",
-        "See Also",
-        "References",
-        "Todo",
-        "Examples",
-    ]
-
-    doc_sections = OrderedDict([(key, None) for key in napoleon_sections])
+    Mapping[str, Union[None, Span, Mapping[str, str]]]
+        The (read-only) extracted numpy-styled docstring sections. The text of a section is
+        held as a `section_scanner.Span` of the cleaned docstring, and is only copied out of it
+        once the section is rendered."""
+
+    doc_sections = OrderedDict([(key, None) for key in _SECTIONS])
 
     section_items.set_defaults(doc_sections)
 
@@ -63,57 +84,63 @@ def parse_napoleon_doc(doc, style):
 
     assert style in ("google", "numpy")
 
-    doc = cleandoc(doc)
-    lines = iter(doc.splitlines())
-
-    key = "Short Summary"
-    body = []
-    while True:
-        try:
-            line = next(lines).rstrip()
-            header = (
-                line
-                if style == "numpy"
-                else (line[:-1] if line.endswith(":") else line)
-            )
-            if header and (header in doc_sections or header in ALIASES):
-                doc_sections[ALIASES.get(key, key)] = (
-                    "\n".join(body).rstrip() if body else None
-                )
-                body = []
-                key = header
-                if style == "numpy":
-                    next(lines)  # skip section delimiter
-            else:
-                body.append(line)
-        except StopIteration:
-            doc_sections[ALIASES.get(key, key)] = "\n".join(body)
-            break
+    sections = _SCANNERS[style].split(clean_doc(doc))
+    for header, body in sections[:-1]:
+        key = header or "Short Summary"
+        doc_sections[ALIASES.get(key, key)] = None if body is None else body.rstrip()
+    header, body = sections[-1]
+    key = header or "Short Summary"
+    doc_sections[ALIASES.get(key, key)] = body
 
     section_items.parse(doc_sections)
 
     return doc_sections
 
 
-def merge_section(key, prnt_sec, child_sec, style, merge_within_sections=False):
+def merge_section(key, prnt_sec, child_sec, merge_within_sections=False):
     """Synthesize a output napoleon docstring section.
 
     Parameters
     ----------
     key: str
         The napoleon-section being merged.
-    prnt_sec: Optional[str]
+    prnt_sec: Union[None, str, Mapping[str, str]]
         The docstring section from the parent's attribute.
-    child_sec: Optional[str]
+    child_sec: Union[None, str, Mapping[str, str]]
         The docstring section from the child's attribute.
     Returns
     -------
-    Optional[str]
+    Union[None, str, Mapping[str, str]]
         The output docstring section."""
 
     if not prnt_sec and not child_sec:
         return None
 
+    if key in section_items.SECTION_NAMES:
+        return section_items.merge(prnt_sec, child_sec, merge_within_sections)
+    return prnt_sec if child_sec is None else child_sec
+
+
+def render_section(key, section, style):
+    """Render a napoleon docstring section, along with its header.
+
+    Parameters
+    ----------
+    key: str
+        The napoleon-section being rendered.
+    section: Union[None, str, Mapping[str, str]]
+        The body of the section.
+    style: str
+        'google' or 'numpy'
+
+    Returns
+    -------
+    Optional[str]
+        The rendered docstring section."""
+
+    if section is None:
+        return None
+
     assert style in ("google", "numpy")
 
     if key == "Short Summary":
@@ -124,47 +151,80 @@ def merge_section(key, prnt_sec, child_sec, style, merge_within_sections=False):
         else:
             header = "\n".join((key + ":", ""))
 
-    if key in section_items.SECTION_NAMES:
-        body = section_items.merge(prnt_sec, child_sec, merge_within_sections, style)
-    else:
-        body = prnt_sec if child_sec is None else child_sec
+    if isinstance(section, Mapping):
+        return header + section_items.render(section, style)
+    return header + section
 
-    return header + body
 
-
-def merge_all_sections(prnt_sctns, child_sctns, style, merge_within_sections=False):
-    """Merge the doc-sections of the parent's and child's attribute into a single docstring.
+def merge_sections(prnt_sctns, child_sctns, merge_within_sections=False):
+    """Merge the doc-sections of the parent's and child's attribute.
 
     Parameters
     ----------
-    prnt_sctns: OrderedDict[str, Union[None,str]]
-    child_sctns: OrderedDict[str, Union[None,str]]
+    prnt_sctns: Mapping[str, Union[None,str]]
+    child_sctns: Mapping[str, Union[None,str]]
 
     Returns
     -------
-    str
-        Output docstring of the merged docstrings."""
-    doc = []
-
+    OrderedDict[str, Union[None,str]]
+        The merged doc-sections."""
     prnt_only_raises = prnt_sctns["Raises"] and not (
         prnt_sctns["Returns"] or prnt_sctns["Yields"]
     )
-    if prnt_only_raises and (child_sctns["Returns"] or child_sctns["Yields"]):
-        prnt_sctns["Raises"] = None
+    skip_raises = prnt_only_raises and (child_sctns["Returns"] or child_sctns["Yields"])
 
-    for key in prnt_sctns:
-        sect = merge_section(
+    return OrderedDict(
+        (
             key,
-            prnt_sctns[key],
-            child_sctns[key],
-            style,
-            merge_within_sections=merge_within_sections,
+            merge_section(
+                key,
+                None if (skip_raises and key == "Raises") else prnt_sctns[key],
+                child_sctns[key],
+                merge_within_sections=merge_within_sections,
+            ),
         )
-        if sect is not None:
-            doc.append(sect)
+        for key in prnt_sctns
+    )
+
+
+def render_sections(doc_sections, style):
+    """Render doc-sections into a single docstring.
+
+    Parameters
+    ----------
+    doc_sections: Mapping[str, Union[None,str]]
+    style: str
+        'google' or 'numpy'
+
+    Returns
+    -------
+    Optional[str]
+        The rendered docstring."""
+    doc = [render_section(key, section, style) for key, section in doc_sections.items()]
+    doc = [sect for sect in doc if sect is not None]
     return "\n\n".join(doc) if doc else None
 
 
+def merge_all_sections(prnt_sctns, child_sctns, style, merge_within_sections=False):
+    """Merge the doc-sections of the parent's and child's attribute into a single docstring.
+
+    Parameters
+    ----------
+    prnt_sctns: Mapping[str, Union[None,str]]
+    child_sctns: Mapping[str, Union[None,str]]
+
+    Returns
+    -------
+    str
+        Output docstring of the merged docstrings."""
+    return render_sections(
+        merge_sections(
+            prnt_sctns, child_sctns, merge_within_sections=merge_within_sections
+        ),
+        style,
+    )
+
+
 def merge_numpy_napoleon_docs(
     prnt_doc=None, child_doc=None, merge_within_sections=False
 ):
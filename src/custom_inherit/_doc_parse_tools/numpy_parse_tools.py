@@ -1,13 +1,41 @@
 from __future__ import absolute_import
 
 from collections import OrderedDict
-from inspect import cleandoc
 
+from .. import _cache
 from . import section_items
+from .section_scanner import SectionScanner, clean_doc
 
-__all__ = ["merge_numpy_docs"]
+try:
+    from collections.abc import Mapping
+except ImportError:
+    # for Python 2
+    from collections import Mapping
 
+__all__ = ["merge_numpy_docs"]
 
+_SECTIONS = (
+    "Short Summary",
+    "Deprecation Warning",
+    "Attributes",
+    "Methods",
+    "Extended Summary",
+    "Parameters",
+    "Returns",
+    "Yields",
+    "Other Parameters",
+    "Raises",
+    "See Also",
+    "Notes",
+    "References",
+    "Examples",
+)
+
+# finds the (underlined) headers of the sections, including those of the sections with items
+_SCANNER = SectionScanner(set(_SECTIONS) | section_items.SECTION_NAMES, underlined=True)
+
+
+@_cache.cached_parse("numpy")
 def parse_numpy_doc(doc):
     """Extract the text from the various sections of a numpy-formatted docstring.
 
@@ -17,51 +45,25 @@ def parse_numpy_doc(doc):
 
     Returns
     -------
-    OrderedDict[str, Union[None,str]]
-        The extracted numpy-styled docstring sections."""
-
-    doc_sections = OrderedDict(
-        [
-            ("Short Summary", None),
-            ("Deprecation Warning", None),
-            ("Attributes", None),
-            ("Methods", None),
-            ("Extended Summary", None),
-            ("Parameters", None),
-            ("Returns", None),
-            ("Yields", None),
-            ("Other Parameters", None),
-            ("Raises", None),
-            ("See Also", None),
-            ("Notes", None),
-            ("References", None),
-            ("Examples", None),
-        ]
-    )
+    Mapping[str, Union[None, Span, Mapping[str, str]]]
+        The (read-only) extracted numpy-styled docstring sections. The text of a section is
+        held as a `section_scanner.Span` of the cleaned docstring, and is only copied out of it
+        once the section is rendered."""
+
+    doc_sections = OrderedDict([(key, None) for key in _SECTIONS])
 
     section_items.set_defaults(doc_sections)
 
     if not doc:
         return doc_sections
 
-    doc = cleandoc(doc)
-    lines = iter(doc.splitlines())
-
-    key = "Short Summary"
-    body = []
-    while True:
-        try:
-            line = next(lines).rstrip()
-            if line in doc_sections:
-                doc_sections[key] = "\n".join(body).rstrip() if body else None
-                body = []
-                key = line
-                next(lines)  # skip section delimiter
-            else:
-                body.append(line)
-        except StopIteration:
-            doc_sections[key] = "\n".join(body)
-            break
+    sections = _SCANNER.split(clean_doc(doc))
+    for header, body in sections[:-1]:
+        doc_sections[header or "Short Summary"] = (
+            None if body is None else body.rstrip()
+        )
+    header, body = sections[-1]
+    doc_sections[header or "Short Summary"] = body
 
     section_items.parse(doc_sections)
 
@@ -75,63 +77,117 @@ def merge_section(key, prnt_sec, child_sec, merge_within_sections=False):
     ----------
     key: str
         The numpy-section being merged.
-    prnt_sec: Optional[str]
+    prnt_sec: Union[None, str, Mapping[str, str]]
         The docstring section from the parent's attribute.
-    child_sec: Optional[str]
+    child_sec: Union[None, str, Mapping[str, str]]
         The docstring section from the child's attribute.
     Returns
     -------
-    Optional[str]
+    Union[None, str, Mapping[str, str]]
         The output docstring section."""
 
     if not prnt_sec and not child_sec:
         return None
 
+    if key in section_items.SECTION_NAMES:
+        return section_items.merge(prnt_sec, child_sec, merge_within_sections)
+    return prnt_sec if child_sec is None else child_sec
+
+
+def render_section(key, section):
+    """Render a numpy docstring section, along with its header.
+
+    Parameters
+    ----------
+    key: str
+        The numpy-section being rendered.
+    section: Union[None, str, Mapping[str, str]]
+        The body of the section.
+
+    Returns
+    -------
+    Optional[str]
+        The rendered docstring section."""
+
+    if section is None:
+        return None
+
     if key == "Short Summary":
         header = ""
     else:
         header = "\n".join((key, "".join("-" for i in range(len(key))), ""))
 
-    if key in section_items.SECTION_NAMES:
-        body = section_items.merge(prnt_sec, child_sec, merge_within_sections, "numpy")
-    else:
-        body = prnt_sec if child_sec is None else child_sec
-
-    return header + body
+    if isinstance(section, Mapping):
+        return header + section_items.render(section, "numpy")
+    return header + section
 
 
-def merge_all_sections(prnt_sctns, child_sctns, merge_within_sections=False):
-    """Merge the doc-sections of the parent's and child's attribute into a single docstring.
+def merge_sections(prnt_sctns, child_sctns, merge_within_sections=False):
+    """Merge the doc-sections of the parent's and child's attribute.
 
     Parameters
     ----------
-    prnt_sctns: OrderedDict[str, Union[None,str]]
-    child_sctns: OrderedDict[str, Union[None,str]]
+    prnt_sctns: Mapping[str, Union[None,str]]
+    child_sctns: Mapping[str, Union[None,str]]
 
     Returns
     -------
-    str
-        Output docstring of the merged docstrings."""
-    doc = []
-
+    OrderedDict[str, Union[None,str]]
+        The merged doc-sections."""
     prnt_only_raises = prnt_sctns["Raises"] and not (
         prnt_sctns["Returns"] or prnt_sctns["Yields"]
     )
-    if prnt_only_raises and (child_sctns["Returns"] or child_sctns["Yields"]):
-        prnt_sctns["Raises"] = None
+    skip_raises = prnt_only_raises and (child_sctns["Returns"] or child_sctns["Yields"])
 
-    for key in prnt_sctns:
-        sect = merge_section(
+    return OrderedDict(
+        (
             key,
-            prnt_sctns[key],
-            child_sctns[key],
-            merge_within_sections=merge_within_sections,
+            merge_section(
+                key,
+                None if (skip_raises and key == "Raises") else prnt_sctns[key],
+                child_sctns[key],
+                merge_within_sections=merge_within_sections,
+            ),
         )
-        if sect is not None:
-            doc.append(sect)
+        for key in prnt_sctns
+    )
+
+
+def render_sections(doc_sections):
+    """Render doc-sections into a single docstring.
+
+    Parameters
+    ----------
+    doc_sections: Mapping[str, Union[None,str]]
+
+    Returns
+    -------
+    Optional[str]
+        The rendered docstring."""
+    doc = [render_section(key, section) for key, section in doc_sections.items()]
+    doc = [sect for sect in doc if sect is not None]
     return "\n\n".join(doc) if doc else None
 
 
+def merge_all_sections(prnt_sctns, child_sctns, merge_within_sections=False):
+    """Merge the doc-sections of the parent's and child's attribute into a single docstring.
+
+    Parameters
+    ----------
+    prnt_sctns: Mapping[str, Union[None,str]]
+    child_sctns: Mapping[str, Union[None,str]]
+
+    Returns
+    -------
+    str
+        Output docstring of the merged docstrings."""
+    return render_sections(
+        merge_sections(
+            prnt_sctns, child_sctns, merge_within_sections=merge_within_sections
+        )
+    )
+
+
 def merge_numpy_docs(prnt_doc=None, child_doc=None, merge_within_sections=False):
     """Merge two numpy-style docstrings into a single docstring.
 
@@ -1,89 +1,130 @@
 from __future__ import absolute_import
 
+import re
 from collections import OrderedDict
-from inspect import cleandoc
 from string import punctuation
 
+from .. import _cache
+from .section_scanner import dedent_doc
+
 __all__ = ["merge_rest_docs"]
 
+# a line, but the first, that consists only of a single punctuation character, repeated
+_RE_DELIMITER = re.compile("\n([" + re.escape(punctuation) + r"])\1*(?=\n|\Z)")
+
+
+class Section(object):
+    """A section of a reST docstring.
+
+    Attributes
+    ----------
+    header: str
+        The title of the section, along with its underline and its overline (if any).
+    body: Optional[str]
+        The text of the section."""
+
+    __slots__ = ("header", "body")
 
-def is_delimiter(line):
-    """ True if a line consists only of a single punctuation character."""
-    return bool(line) and line[0] in punctuation and line[0] * len(line) == line
+    def __init__(self, header=None, body=None):
+        self.header = header
+        self.body = body
 
 
+@_cache.cached_parse("reST")
 def parse_rest_doc(doc):
     """Extract the headers, delimiters, and text from reST-formatted docstrings.
 
+    A section title is a line that is underlined by a delimiter - a line of a single
+    punctuation character - that is at least as long; and it may be overlined by an identical
+    delimiter. The underline of a title cannot be the title of another section.
+
     Parameters
     ----------
     doc: Union[str, None]
 
     Returns
     -------
-    Dict[str, Section]"""
-
-    class Section(object):
-        def __init__(self, header=None, body=None):
-            self.header = header  # str
-            self.body = body  # str
-
+    Mapping[str, Section]
+        The (read-only) extracted sections."""
     doc_sections = OrderedDict([("", Section(header=""))])
     if not doc:
         return doc_sections
 
-    doc = cleandoc(doc)
-    lines = iter(doc.splitlines())
+    doc = dedent_doc(doc)
 
+    # scans the delimiters, rather than each line, for the underlines of section titles
+    title = ""
     header = ""
-    body = []
-    section = Section(header=header)
-    line = ""
-    while True:
-        try:
-            prev_line = line
-            line = next(lines)
-            # section header encountered
-            if is_delimiter(line) and 0 < len(prev_line) <= len(line):
-                # prev-prev-line is overline
-                if (
-                    len(body) >= 2
-                    and len(body[-2]) == len(line)
-                    and body[-2][0] == line[0]
-                    and is_delimiter(body[-2])
-                ):
-                    lim = -2
-                else:
-                    lim = -1
-
-                section.body = "\n".join(body[:lim]).rstrip()
-                doc_sections.update([(header.strip(), section)])
-                section = Section(header="\n".join(body[lim:] + [line]))
-                header = prev_line
-                body = []
-                line = ""
-            else:
-                body.append(line)
-
-        except StopIteration:
-            section.body = "\n".join(body).rstrip()
-            doc_sections.update([(header.strip(), section)])
-            break
+    start = 0  # the start of the body of the current section
+    underline = -1  # the start of the underline of the current section's title
+    for match in _RE_DELIMITER.finditer(doc):
+        line_start, line_end = match.start() + 1, match.end()
+        # the title is the line that precedes the delimiter; which is not an underline itself
+        title_start = doc.rfind("\n", 0, line_start - 1) + 1
+        title_length = line_start - 1 - title_start
+        if title_start == underline or not 0 < title_length <= line_end - line_start:
+            continue
+
+        # the line that precedes the title (within the body) may be its overline
+        header_start = title_start
+        if title_start > start:
+            overline_start = doc.rfind("\n", 0, title_start - 1) + 1
+            overline = doc[overline_start : title_start - 1]
+            if overline == doc[line_start:line_end]:
+                header_start = overline_start
+
+        doc_sections[title.strip()] = Section(
+            header=header, body=doc[start : max(header_start - 1, start)].rstrip()
+        )
+        title = doc[title_start : line_start - 1]
+        header = doc[header_start:line_end]
+        start, underline = line_end + 1, line_start
+    doc_sections[title.strip()] = Section(header=header, body=doc[start:].rstrip())
     return doc_sections
 
 
-def merge_rest_docs(prnt_doc=None, child_doc=None):
-    """ See custom_inherit.style_store.reST for details. """
-    prnt_sections = parse_rest_doc(prnt_doc)
-    child_sections = parse_rest_doc(child_doc)
+def merge_sections(prnt_sections, child_sections):
+    """Merge the parent's and child's reST sections.
+
+    The child's sections take precedence over the parent's; the parent's front-matter is
+    retained unless the child provides its own.
+
+    Parameters
+    ----------
+    prnt_sections: Mapping[str, Section]
+    child_sections: Mapping[str, Section]
 
-    header = prnt_sections[""]
-    prnt_sections.update(child_sections)
+    Returns
+    -------
+    OrderedDict[str, Section]
+        The merged sections."""
+    doc_sections = prnt_sections.copy()
+    doc_sections.update(child_sections)
     if not child_sections[""].body:
-        prnt_sections[""] = header
-        if not header.body:
-            prnt_sections.popitem(last=False)
+        doc_sections[""] = prnt_sections[""]
+    return doc_sections
+
+
+def render_sections(doc_sections):
+    """Render reST sections into a single docstring.
+
+    Parameters
+    ----------
+    doc_sections: Mapping[str, Section]
 
+    Returns
+    -------
+    str
+        The rendered docstring."""
     return "\n\n".join(
-        ("\n".join((x.header, x.body)) for x in prnt_sections.values())
+        "\n".join((x.header, x.body))
+        for key, x in doc_sections.items()
+        if key or x.body
     ).lstrip()
+
+
+def merge_rest_docs(prnt_doc=None, child_doc=None):
+    """ See custom_inherit.style_store.reST for details. """
+    return render_sections(
+        merge_sections(parse_rest_doc(prnt_doc), parse_rest_doc(child_doc))
+    )
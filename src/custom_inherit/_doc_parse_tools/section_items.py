@@ -1,18 +1,21 @@
 """This module handles sections with items."""
 
-import inspect
 import re
 from collections import OrderedDict
 
-try:
-    from textwrap import indent
-except ImportError:
-    # for Python < 3.3
-    def indent(text, padding):
-        return "".join(padding + line for line in text.splitlines(True))
+from .section_scanner import Span, margin_of, remove_margin
 
+# the line feed (and the indentation) that precedes the name of an item, by indentation
+_RE_ITEM_BOUNDARIES = {0: re.compile(r"\n(?=\**\w)")}
+_RE_ITEM_NAME = re.compile(r"\**\w+")
+# the start of the first name in a text; a run of asterisks is only tried from its start
+_RE_ITEM_START = re.compile(r"(?<!\*)\*+\w|\w")
 
-_RE_PATTERN_ITEMS = re.compile(r"(\**\w+)(.*?)(?:$|(?=\n\**\w+))", flags=re.DOTALL)
+# the indentation of the first line, along with the empty lines that follow it
+_RE_LEADING = re.compile(r"[^\S\n]*\n*")
+# the start of each line that holds text; and a line that holds none
+_RE_TEXT_LINE = re.compile(r"^(?=[^\n]*\S)", flags=re.MULTILINE)
+_RE_BLANK_LINE = re.compile(r"\n[^\S\n]*(?:\n|$)")
 
 _STYLE_TO_PADDING = {
     "numpy": "",
@@ -31,12 +34,99 @@ SECTION_NAMES = {
 }
 
 
-def _render(body, style):
+def _item_boundary(margin):
+    try:
+        return _RE_ITEM_BOUNDARIES[margin]
+    except KeyError:
+        return _RE_ITEM_BOUNDARIES.setdefault(
+            margin, re.compile(r"\n[^\S\n]{%d}(?=\**\w)" % margin)
+        )
+
+
+def dedent(section):
+    """Remove the indentation of a section, as `inspect.cleandoc` does, given that the
+    section is taken from a docstring that was already cleaned (see `section_scanner.clean_doc`):
+    its tabs are expanded, and its lines hold no trailing whitespace. The lines of the section
+    are thus not split, scanned and joined again.
+
+    Parameters
+    ----------
+    section: Union[str, Span]
+
+    Returns
+    -------
+    Span
+        The section, without copying it out of the docstring that holds it.
+    """
+    span = section if isinstance(section, Span) else Span(section, 0, len(section))
+    doc, start, end = span.doc, span.start, span.end
+    margin = margin_of(doc, start, end) or 0
+
+    # strips the indentation of the first line, along with the leading and trailing empty lines
+    start = _RE_LEADING.match(doc, start, end).end()
+    if start > span.start and doc[start - 1] == "\n":
+        start = min(start + margin, end)
+    while end > start and doc[end - 1] == "\n":
+        end -= 1
+    return Span(doc, start, end, margin)
+
+
+def parse_items(section):
+    """Split a section into its items, in time linear in the length of the section.
+
+    An item starts with a line that starts with its name: a word, possibly prefixed by
+    asterisks (e.g. ``**kwargs``); its description runs up to the next such line. Any text
+    that precedes the first name is dropped.
+
+    Parameters
+    ----------
+    section: Union[str, Span]
+        A section; the lines of a span (but the first) are indented by its margin, which is
+        removed from the descriptions.
+
+    Returns
+    -------
+    List[Tuple[str, str]]
+        The name and the description of each item: the matches of the regex by which
+        sections were split before (see tests/section_items_test.py), found without its lazy
+        quantifier and lookahead being attempted at each position (which is quadratic on
+        malformed sections).
+    """
+    if isinstance(section, Span):
+        doc, start, end, margin = (
+            section.doc,
+            section.start,
+            section.end,
+            section.margin,
+        )
+    else:
+        # a trailing line feed is excluded from the description of the last item
+        doc, start, end, margin = section, 0, len(section) - section.endswith("\n"), 0
+
+    # only the first item may not start a line, as text may precede its name
+    first = _RE_ITEM_START.search(doc, start, end)
+    if first is None:
+        return []
+    starts = [first.start()]
+    ends = []
+    for boundary in _item_boundary(margin).finditer(doc, first.start(), end):
+        ends.append(boundary.start())
+        starts.append(boundary.end())
+    ends.append(end)
+
+    items = []
+    for start, end in zip(starts, ends):
+        name = _RE_ITEM_NAME.match(doc, start, end)
+        items.append((name.group(), remove_margin(doc[name.end() : end], margin)))
+    return items
+
+
+def render(body, style):
     """Render the items of a section.
 
     Parameters
     ----------
-    body: OrderedDict[str, Optional[str]]
+    body: Mapping[str, Optional[str]]
         The items of a section.
     style: str
         The doc style.
@@ -46,10 +136,17 @@ def _render(body, style):
     str
     """
     padding = _STYLE_TO_PADDING[style]
-    section = []
+    pieces = []
     for key, value in body.items():
-        section += [indent("{}{}".format(key, value), padding)]
-    return "\n".join(section)
+        pieces += [key, value, "\n"]
+    section = "".join(pieces[:-1])
+    if not (padding and section):
+        return section
+    # pads each line that holds text, as `textwrap.indent` does; the items are taken from
+    # docstrings cleaned by `section_scanner.clean_doc`, whose lines are split on line feeds only
+    if _RE_BLANK_LINE.search(section):
+        return _RE_TEXT_LINE.sub(padding, section)
+    return padding + section.replace("\n", "\n" + padding)
 
 
 def set_defaults(doc_sections):
@@ -68,38 +165,36 @@ def parse(doc_sections):
 
     Parameters
     ----------
-    doc_sections: OrderedDict[str, Optional[str]]
+    doc_sections: OrderedDict[str, Optional[Span]]
+        The sections of a docstring that was cleaned by `section_scanner.clean_doc`.
     """
     for section_name in SECTION_NAMES:
         section_content = doc_sections[section_name]
         if section_content:
             doc_sections[section_name] = OrderedDict(
-                _RE_PATTERN_ITEMS.findall(inspect.cleandoc(section_content))
+                parse_items(dedent(section_content))
             )
 
 
-def merge(prnt_sec, child_sec, merge_within_sections, style):
+def merge(prnt_sec, child_sec, merge_within_sections):
     """Merge the doc-sections of the parent's and child's attribute with items.
 
     Parameters
     ----------
-    prnt_sec: OrderedDict[str, str]
-    child_sec: OrderedDict[str, str]
+    prnt_sec: Mapping[str, str]
+    child_sec: Mapping[str, str]
     merge_within_sections: bool
         Wheter to merge the items.
-    style: str
-        The doc style.
 
     Returns
     -------
-    OrderedDict[str, str]
+    Mapping[str, str]
         The merged items.
     """
     if merge_within_sections:
-        body = prnt_sec.copy()
-        body.update(child_sec)
-        body = _render(body, style)
+        body = prnt_sec.copy() if prnt_sec else OrderedDict()
+        if child_sec:
+            body.update(child_sec)
     else:
         body = prnt_sec if not child_sec else child_sec
-        body = _render(body, style)
     return body
@@ -0,0 +1,295 @@
+"""This module splits docstrings into their sections."""
+
+import re
+from inspect import cleandoc
+
+__all__ = [
+    "SectionScanner",
+    "Span",
+    "clean_doc",
+    "dedent_doc",
+    "margin_of",
+    "remove_margin",
+]
+
+# the characters (other than the line feed) upon which `str.splitlines` splits lines, and the
+# ascii whitespace that may trail a line once its tabs are expanded
+_LINE_BOUNDARIES = ("\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e")
+_TRAILING_SPACE = (" \n", "\x1f\n")
+
+# the underline of a numpy-style section header; the adornments accepted by napoleon
+_UNDERLINE = r"[=\-`:'\"~^_*+#<>]{2,}"
+
+# the indentation of the first line, but the first, that holds text; a line whose indentation is
+# shallower than a margin (by the whitespace of its indentation); and the whitespace that trails
+# a line
+_RE_INDENT = re.compile(r"\n([^\S\n]*)\S")
+_SHALLOWER = r"\n(?![^\S\n]{%d})([^\S\n]*)\S"
+_SHALLOWER_SPACES = r"\n(?! {%d})( *)[^ \n]"
+_RE_TRAILING_SPACE = re.compile(r"[^\S\n]+$", flags=re.MULTILINE)
+
+# the ascii whitespace, other than the space and the line feed
+_NOT_SPACES = ("\t", "\x0b", "\x0c", "\r", "\x1c", "\x1d", "\x1e", "\x1f")
+
+
+def _isascii(doc):
+    try:
+        return doc.isascii()
+    except AttributeError:  # Python < 3.7
+        return False
+
+
+def _spaced(doc, start, end):
+    """Whether the only whitespace of ``doc[start:end]``, other than line feeds, are spaces;
+    which are matched faster than whitespace in general."""
+    return _isascii(doc) and all(
+        doc.find(char, start, end) == -1 for char in _NOT_SPACES
+    )
+
+
+def margin_of(doc, start=0, end=None):
+    """Returns the smallest indentation of the lines of ``doc[start:end]``, but the first, that
+    hold text; or None if none of them does.
+
+    Returns
+    -------
+    Optional[int]"""
+    end = len(doc) if end is None else end
+    match = _RE_INDENT.search(doc, start, end)
+    if match is None:
+        return None
+    # rather than measuring the indentation of every line, looks for a shallower one until
+    # there is none; which takes a pass or two over a docstring
+    shallower = _SHALLOWER_SPACES if _spaced(doc, start, end) else _SHALLOWER
+    margin = match.end(1) - match.start(1)
+    while margin:
+        match = re.compile(shallower % margin).search(doc, start, end)
+        if match is None:
+            break
+        margin = match.end(1) - match.start(1)
+    return margin
+
+
+def remove_margin(text, margin):
+    """Removes `margin` characters of indentation from each line of the text, but the first,
+    given that each line that holds text is indented by at least as much.
+
+    Returns
+    -------
+    str"""
+    if not margin or "\n" not in text:
+        return text
+    if _spaced(text, 0, len(text)):
+        return text.replace("\n" + " " * margin, "\n")
+    return re.sub("\n[^\\S\n]{%d}" % margin, "\n", text)
+
+
+def _is_emptied(line, first, margin):
+    """Whether `inspect.cleandoc` leaves a line of a docstring empty."""
+    if line.strip():
+        return False
+    # the first line is stripped; the others are stripped of the margin, if there is one
+    return first or (len(line) <= margin if margin is not None else not line)
+
+
+def _dedent_ascii(doc):
+    """`inspect.cleandoc` for an ascii docstring that holds no line boundary but the line feed:
+    the lines are neither split nor joined, such that the docstring is copied once or twice,
+    rather than once per line."""
+    if "\t" in doc:
+        doc = doc.expandtabs()
+    margin = margin_of(doc)
+
+    # removes the trailing, then the leading, lines that `cleandoc` leaves empty
+    end = len(doc)
+    while True:
+        start = doc.rfind("\n", 0, end) + 1
+        if not _is_emptied(doc[start:end], not start, margin):
+            break
+        if not start:
+            return ""
+        end = start - 1
+    start = 0
+    while True:
+        line_end = doc.find("\n", start, end)
+        line_end = end if line_end == -1 else line_end
+        if not _is_emptied(doc[start:line_end], not start, margin):
+            break
+        start = line_end + 1
+
+    if start:
+        start += margin or 0
+    else:
+        while doc[start].isspace():
+            start += 1
+    doc = doc[start:end]
+    if not margin or "\n" not in doc:
+        return doc
+    if _spaced(doc, 0, len(doc)) and " \n" not in doc:
+        return doc.replace("\n" + " " * margin, "\n")
+    # the lines of whitespace that are shallower than the margin are emptied too
+    return re.sub(r"\n[^\S\n]{0,%d}" % margin, "\n", doc)
+
+
+def _is_plain(doc):
+    """Whether the docstring is ascii, and holds no line boundary other than the line feed;
+    as most docstrings do."""
+    return _isascii(doc) and not any(char in doc for char in _LINE_BOUNDARIES)
+
+
+def dedent_doc(doc):
+    """Returns the docstring with its indentation removed, as `inspect.cleandoc` does, and with
+    its lines split on line feeds (see `str.splitlines`).
+
+    Parameters
+    ----------
+    doc: str
+
+    Returns
+    -------
+    str"""
+    if _is_plain(doc):
+        return _dedent_ascii(doc)
+    return "\n".join(cleandoc(doc).splitlines())
+
+
+def clean_doc(doc):
+    """Returns the docstring with its indentation removed (see `inspect.cleandoc`), and with
+    its lines split on line feeds and stripped of trailing whitespace.
+
+    Parameters
+    ----------
+    doc: str
+
+    Returns
+    -------
+    str"""
+    if _is_plain(doc):
+        doc = _dedent_ascii(doc)
+        if any(chars in doc for chars in _TRAILING_SPACE) or doc.endswith(
+            (" ", "\x1f")
+        ):
+            doc = _RE_TRAILING_SPACE.sub("", doc)
+        return doc
+    return "\n".join([line.rstrip() for line in cleandoc(doc).splitlines()])
+
+
+class Span(object):
+    """The text of a section (or of an item), held as its offsets in the docstring from which it
+    was parsed; the text is only copied out of the docstring once it is rendered (by `str`).
+
+    Spans compare, and hash, as their text.
+
+    Attributes
+    ----------
+    doc: str
+        The (cleaned) docstring.
+    start: int
+    end: int
+        The text is ``doc[start:end]``.
+    margin: int
+        The indentation that is removed from each line of the text, but the first."""
+
+    __slots__ = ("doc", "start", "end", "margin")
+
+    def __init__(self, doc, start, end, margin=0):
+        self.doc = doc
+        self.start = start
+        self.end = end
+        self.margin = margin
+
+    def __str__(self):
+        return remove_margin(self.doc[self.start : self.end], self.margin)
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __bool__(self):
+        return self.end > self.start
+
+    __nonzero__ = __bool__  # for Python 2
+
+    def __eq__(self, other):
+        return str(self) == (str(other) if isinstance(other, Span) else other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __add__(self, other):
+        return str(self) + other
+
+    def __radd__(self, other):
+        return other + str(self)
+
+    def rstrip(self):
+        """Returns the span without its trailing whitespace.
+
+        Returns
+        -------
+        Span"""
+        doc, end = self.doc, self.end
+        while end > self.start and doc[end - 1].isspace():
+            end -= 1
+        return Span(doc, self.start, end, self.margin)
+
+
+class SectionScanner(object):
+    """Finds the section headers of a docstring in a single pass over its text.
+
+    A header is a line that holds the name of a section; for numpy-style docstrings,
+    it must be followed by a line that underlines it, otherwise it is part of the
+    body of the current section."""
+
+    def __init__(self, headers, underlined, colon=False):
+        """
+        Parameters
+        ----------
+        headers: Iterable[str]
+            The names of the sections.
+        underlined: bool
+            Whether a header is underlined (numpy-style).
+        colon: bool, optional (default: False)
+            Whether a header may be followed by a colon (google-style)."""
+        names = "|".join(re.escape(name) for name in sorted(headers, key=len)[::-1])
+        pattern = "(" + names + ")"
+        if colon:
+            pattern += ":?"
+        if underlined:
+            pattern += "\n" + _UNDERLINE
+        pattern += r"(?=\n|\Z)"
+        # a header at the start of the docstring, and a header that follows a line feed
+        self._first = re.compile(pattern)
+        self._pattern = re.compile("\n" + pattern)
+
+    def split(self, doc):
+        """Splits a docstring into its sections, without copying their text.
+
+        Parameters
+        ----------
+        doc: str
+            The docstring, as returned by `clean_doc`.
+
+        Returns
+        -------
+        List[Tuple[Optional[str], Optional[Span]]]
+            The header and the body of each section - the header of the text that precedes the
+            first header is None. The body of a section, but the last, that holds no line
+            is None."""
+        sections = []
+        header, start = (
+            None,
+            0,
+        )  # the body starts after the line feed that ends its header
+        match = self._first.match(doc)
+        if match is not None:
+            sections.append((None, None))
+            header, start = match.group(1), match.end() + 1
+        for match in self._pattern.finditer(doc, max(start - 1, 0)):
+            body = None if match.start() < start else Span(doc, start, match.start())
+            sections.append((header, body))
+            header, start = match.group(1), match.end() + 1
+        sections.append((header, Span(doc, min(start, len(doc)), len(doc))))
+        return sections
@@ -0,0 +1,79 @@
+from __future__ import absolute_import
+
+import hashlib
+from types import CodeType
+
+""" Exposes the hashing of style functions and docstrings, by which the caches that are shared
+    across processes (see custom_inherit/_disk_cache.py and custom_inherit/_shared_cache.py) key
+    merged docstrings."""
+
+__all__ = ["style_fingerprint", "update_with_doc"]
+
+_PRIMITIVES = (type(None), bool, int, float, str, bytes)
+
+try:
+    _PRIMITIVES += (unicode, long)  # Python 2
+except NameError:
+    pass
+
+
+def _update_with_code(sha, code):
+    sha.update(code.co_code)
+    sha.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_with_code(sha, const)
+        else:
+            sha.update(repr(const).encode("utf-8"))
+
+
+def style_fingerprint(style_func):
+    """Returns a hash that identifies a style function by its qualified name, its compiled
+    code, and the primitive values that it closes over or takes as default arguments; so that
+    the entries cached for a style are invalidated once its code is changed.
+
+    Only the style function itself is hashed: the helper functions and the globals that it
+    uses are not. Once these change, the cache must be invalidated explicitly - e.g. by bumping
+    the `version` passed to `custom_inherit.enable_disk_cache`.
+
+    Parameters
+    ----------
+    style_func : Callable[[Optional[str], Optional[str]], Optional[str]]
+
+    Returns
+    -------
+    Optional[str]
+        None if the style cannot be identified reliably across processes: a callable object
+        or a bound method (whose state is not hashed), a builtin callable, or a function that
+        closes over, or defaults to, anything but primitive values."""
+    code = getattr(style_func, "__code__", None)
+    if code is None or getattr(style_func, "__self__", None) is not None:
+        return None
+
+    sha = hashlib.sha1()
+    name = getattr(style_func, "__qualname__", getattr(style_func, "__name__", ""))
+    sha.update(
+        "{}.{}".format(getattr(style_func, "__module__", ""), name).encode("utf-8")
+    )
+    _update_with_code(sha, code)
+    try:
+        cells = [cell.cell_contents for cell in style_func.__closure__ or ()]
+    except ValueError:  # an empty cell
+        return None
+    defaults = list(getattr(style_func, "__defaults__", None) or ())
+    kwdefaults = sorted((getattr(style_func, "__kwdefaults__", None) or {}).items())
+    values = cells + defaults + [value for _, value in kwdefaults]
+    if not all(isinstance(value, _PRIMITIVES) for value in values):
+        return None
+    sha.update(repr((cells, defaults, kwdefaults)).encode("utf-8"))
+    return sha.hexdigest()
+
+
+def update_with_doc(sha, doc):
+    """ Updates a hash with a docstring, such that sequences of docstrings hash unambiguously."""
+    if doc is None:
+        sha.update(b"\x00")
+    else:
+        doc = doc.encode("utf-8")
+        sha.update("{}:".format(len(doc)).encode("utf-8"))
+        sha.update(doc)
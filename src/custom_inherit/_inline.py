@@ -0,0 +1,114 @@
+from __future__ import absolute_import
+
+import ast
+import os
+import shutil
+import sys
+
+from ._static import StaticProject
+
+""" Exposes the rewriting of a project's sources, such that its inherited docstrings are inlined.
+
+    The docstrings are resolved statically (see custom_inherit/_static.py), and each class and
+    function definition whose resolved docstring differs from its own is rewritten to carry the
+    resolved docstring. The metaclasses and decorators of custom_inherit are left in place, but
+    are thereafter optional: the docstrings already hold what they would merge."""
+
+__all__ = ["inline_project"]
+
+
+def _doc_literal(doc, indent):
+    """Returns the source of a string literal holding the docstring, whose continuation
+    lines are indented to the level of the definition's body."""
+    if '"""' in doc or "\\" in doc or "\r" in doc or doc.endswith('"'):
+        return repr(doc)
+    lines = doc.split("\n")
+    lines[1:] = [indent + line if line.strip() else "" for line in lines[1:]]
+    if len(lines) > 1:
+        lines[-1] = lines[-1] or indent
+    return '"""' + "\n".join(lines) + '"""'
+
+
+def _line_offsets(source):
+    offsets = [0]
+    for line in source.splitlines(True):
+        offsets.append(offsets[-1] + len(line))
+    return offsets
+
+
+def _edit(node, doc, source, offsets):
+    """Returns the (start, end, replacement) edit of the source, in bytes, that sets the
+    docstring of a class or function definition."""
+    first = node.body[0]
+    start = offsets[first.lineno - 1] + first.col_offset
+    line = source[offsets[first.lineno - 1] : offsets[first.lineno]]
+    indent = line[: len(line) - len(line.lstrip())].decode("utf-8")
+
+    has_doc = isinstance(first, ast.Expr) and isinstance(
+        getattr(first.value, "value", getattr(first.value, "s", None)), str
+    )
+    if has_doc:
+        end = offsets[first.end_lineno - 1] + first.end_col_offset
+        return start, end, _doc_literal(doc, indent).encode("utf-8")
+
+    if line[: first.col_offset].strip():
+        # the body shares the line of the definition's header
+        indent += "    "
+        return start, start, (_doc_literal(doc, indent) + "; ").encode("utf-8")
+    return start, start, (_doc_literal(doc, indent) + "\n" + indent).encode("utf-8")
+
+
+def inline_project(root, output=None):
+    """Rewrites the sources of a project, such that each class and function definition carries
+    the docstring that custom_inherit would resolve for it upon import.
+
+    Parameters
+    ----------
+    root : str
+        The directory from which the project's modules are imported (i.e. an entry of `sys.path`).
+    output : Optional[str]
+        If specified, `root` is copied to this directory, which must not already hold
+        any file, and the copy is rewritten instead.
+
+    Returns
+    -------
+    Tuple[Dict[str, int], List[str]]
+        The number of docstrings inlined into each rewritten file, and a description of each
+        hierarchy or function whose docstrings could not be resolved statically."""
+    if sys.version_info < (3, 8):
+        raise RuntimeError("Inlining docstrings requires Python 3.8 or later")
+
+    project = StaticProject(root)
+    edits = {}
+    for module, node, doc in project.resolve():
+        if doc is None or doc == ast.get_docstring(node, clean=False):
+            continue
+        edits.setdefault(module, []).append((node, doc))
+
+    if output is not None:
+        if os.path.exists(output) and os.listdir(output):
+            raise ValueError("The output directory is not empty: {}".format(output))
+        if os.path.exists(output):
+            os.rmdir(output)
+        shutil.copytree(
+            project.root, output, ignore=shutil.ignore_patterns("__pycache__")
+        )
+
+    inlined = {}
+    for module, module_edits in edits.items():
+        source = module.source
+        offsets = _line_offsets(source)
+        # apply the edits from the end of the source, so that the offsets of the others hold
+        for start, end, replacement in sorted(
+            (_edit(node, doc, source, offsets) for node, doc in module_edits),
+            reverse=True,
+        ):
+            source = source[:start] + replacement + source[end:]
+
+        path = module.path
+        if output is not None:
+            path = os.path.join(output, os.path.relpath(path, project.root))
+        with open(path, "wb") as f:
+            f.write(source)
+        inlined[path] = len(module_edits)
+    return inlined, project.problems
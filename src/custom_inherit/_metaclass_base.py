@@ -1,8 +1,15 @@
 from __future__ import absolute_import
 
+import os
+import sys
+import weakref
 from abc import abstractproperty
+from collections import deque
+from threading import Lock, RLock
 from types import FunctionType, MethodType
 
+from . import _sidecar
+
 """ Exposes abstract base meta class to be inherited by inheritance-style meta classes.
 
     This metaclass merges the respective docstrings of a parent class and its child, and their
@@ -13,32 +20,114 @@ from types import FunctionType, MethodType
 
 __all__ = ["DocInheritorBase"]
 
+# the name under which a class created by a doc-inheriting metaclass records the
+# docstrings of its attributes
+_ATTR_DOCS = "_DocInheritorBase__attr_docs"
+
+_PENDING = object()
+
+# attributes that type.__new__ converts implicitly into static- or class-methods, thus these
+# cannot be stood in for by a descriptor
+_EAGER_ATTRS = frozenset(["__new__", "__init_subclass__", "__class_getitem__"])
+
+# guards the (recursive) resolution of lazy attribute docstrings
+_lazy_lock = RLock()
+
+# (weak references to) the classes created by lazy doc-inheriting metaclasses, whose docstrings
+# may be pending; these are resolved by `custom_inherit.warm_in_background`
+_lazy_classes = deque()
+_lazy_classes_lock = Lock()
+# the length of `_lazy_classes` at which the references to classes that no longer exist are
+# pruned; this is doubled along with the number of live references, to amortize the pruning
+_lazy_classes_prune_at = 64
+
+
+def _track_lazy_class(cls):
+    """ Records a lazy class, for `custom_inherit.warm_in_background` to resolve."""
+    global _lazy_classes_prune_at
+    with _lazy_classes_lock:
+        _lazy_classes.append(weakref.ref(cls))
+        if len(_lazy_classes) < _lazy_classes_prune_at:
+            return
+        # the references are pruned in place, as a background warmer may pop them meanwhile
+        for _ in range(len(_lazy_classes)):
+            try:
+                ref = _lazy_classes.popleft()
+            except IndexError:
+                break
+            if ref() is not None:
+                _lazy_classes.append(ref)
+        _lazy_classes_prune_at = max(64, 2 * len(_lazy_classes))
+
+
+def _passthrough_mode():
+    """Returns True if docstrings are not to be merged at all: by default, when Python runs
+    with `-OO` - which strips all docstrings, leaving nothing to merge. This is overridden by
+    the environment variable CUSTOM_INHERIT_PASSTHROUGH: "0" disables the mode, and any other
+    (non-empty) value enables it.
+
+    Returns
+    -------
+    bool"""
+    flag = os.environ.get("CUSTOM_INHERIT_PASSTHROUGH", "")
+    if flag:
+        return flag != "0"
+    return sys.flags.optimize >= 2
+
 
 class DocInheritorBase(type):
     """A metaclass that merges the respective docstrings of a parent class and of its child, along with their
     properties, methods (including classmethod, staticmethod, decorated methods).
 
     This merge-style must be implemented via the static methods `class_doc_inherit`
-    and `attr_doc_inherit`, which are set within `custom_inherit.DocInheritMeta`."""
+    and `attr_doc_inherit`, which are set within `custom_inherit.DocInheritMeta`.
+
+    If `incremental` is True, the docstring of a class is merged from the (already merged)
+    docstrings of those of its ancestors that were created by a doc-inheriting metaclass,
+    rather than from the docstrings of every class in its mro.
+
+    If `lazy` is True, the docstrings of a class and of its attributes are merged when they are
+    first accessed, rather than when the class is created.
+
+    If `passthrough` is True, classes are created as-is, without any docstring being merged;
+    see `_passthrough_mode`."""
 
     include_special_methods = False
+    incremental = False
+    lazy = False
+    passthrough = _passthrough_mode()
 
     def __new__(mcs, class_name, class_bases, class_dict):
-        # inherit class docstring: the docstring is constructed by traversing
-        # the mro for the class and merging their docstrings, with each next
-        # docstring as serving as the 'parent', and the accumulated docstring
-        # serving as the 'child'
-        this_doc = class_dict.get("__doc__", None)
-        for mro_cls in (mro_cls for base in class_bases for mro_cls in base.mro()):
-            prnt_cls_doc = mro_cls.__doc__
-            if prnt_cls_doc is not None:
-                if prnt_cls_doc == "The most base type":
-                    prnt_cls_doc = None
-            this_doc = mcs.class_doc_inherit(prnt_cls_doc, this_doc)
-
-        class_dict["__doc__"] = this_doc
-
-        # inherit docstring for method, static-method, class-method, abstract-method, decorated-method, and property
+        if mcs.passthrough:
+            return type.__new__(mcs, class_name, class_bases, class_dict)
+
+        # the docstrings compiled ahead of time, by `python -m custom_inherit compile`, are used as-is
+        # (these are keyed by qualified name, which Python 2 lacks)
+        qualname = class_dict.get("__qualname__")
+        compiled = None
+        if qualname is not None:
+            compiled = _sidecar.compiled_docs(class_dict.get("__module__"))
+        if compiled is not None and qualname not in compiled:
+            compiled = None
+        lazy = mcs.lazy and compiled is None
+        # the mro of the class, excluding itself; computed once, if needed
+        prnt_mro = None
+
+        if compiled is not None:
+            class_dict["__doc__"] = compiled[qualname]
+        elif lazy:
+            class_doc = _LazyClassDoc(class_dict.get("__doc__", None))
+            class_dict["__doc__"] = class_doc
+        else:
+            prnt_mro = _linearize(class_bases)
+            class_dict["__doc__"] = _inherit_class_doc(
+                mcs, prnt_mro, class_dict.get("__doc__", None)
+            )
+
+        # inherit docstring for method, static-method, class-method, abstract-method, decorated-method, and property;
+        # the nearest parent docstring is looked up in the namespaces along the mro, by a dict lookup
+        prnt_attr_docs = None
+        lazy_attrs = []
         for attr, attribute in class_dict.items():
             is_doc_type = isinstance(
                 attribute,
@@ -51,43 +140,41 @@ class DocInheritorBase(type):
             ) or not is_doc_type:
                 continue
 
-            is_static_or_class = isinstance(attribute, (staticmethod, classmethod))
-            child_attr = attribute if not is_static_or_class else attribute.__func__
-
-            prnt_attr_doc = None
-            for mro_cls in (
-                mro_cls
-                for base in class_bases
-                for mro_cls in base.mro()
-                if hasattr(mro_cls, attr)
-            ):
-                prnt_attr_doc = getattr(mro_cls, attr).__doc__
+            if compiled is not None:
+                doc = compiled.get(qualname + "." + attr, _PENDING)
+                if doc is not _PENDING:
+                    class_dict[attr] = _set_attr_doc(attribute, doc)
+                continue
 
-                if prnt_attr_doc is not None:
-                    break
+            if lazy and attr not in _EAGER_ATTRS and _is_lazy_type(attribute):
+                lazy_attrs.append(_LazyAttrDoc(attr, attribute))
+                continue
 
+            if prnt_attr_docs is None:
+                if prnt_mro is None:
+                    prnt_mro = _linearize(class_bases)
+                prnt_attr_docs = _prnt_attr_docs(prnt_mro)
+            prnt_attr_doc = _nearest_attr_doc(prnt_attr_docs, attr)
             if prnt_attr_doc is None:
                 continue
 
-            doc = mcs.attr_doc_inherit(prnt_attr_doc, child_attr.__doc__)
-            try:
-                child_attr.__doc__ = doc
-            # property.__doc__ is read-only in Python 2 (TypeError), 3.3 - 3.4 (AttributeError)
-            except (TypeError, AttributeError) as err:
-                if type(child_attr) in (property, abstractproperty):
-                    new_prop = property(
-                        fget=child_attr.fget,
-                        fset=child_attr.fset,
-                        fdel=child_attr.fdel,
-                        doc=doc,
-                    )
-                    if isinstance(child_attr, abstractproperty):
-                        new_prop = abstractproperty(new_prop)
-                    class_dict[attr] = new_prop
-                else:
-                    raise type(err)(err)
-
-        return type.__new__(mcs, class_name, class_bases, class_dict)
+            class_dict[attr] = _inherit_attr_doc(mcs, attribute, prnt_attr_doc)
+
+        attr_docs = _index_attr_docs(class_dict)
+        for lazy_attr in lazy_attrs:
+            # the docstrings of these attributes are pending until they are first accessed
+            attr_docs[lazy_attr.attr] = lazy_attr
+            class_dict[lazy_attr.attr] = lazy_attr.descriptor()
+        class_dict[_ATTR_DOCS] = attr_docs
+
+        cls = type.__new__(mcs, class_name, class_bases, class_dict)
+        if lazy:
+            class_doc.owner = cls
+            for lazy_attr in lazy_attrs:
+                lazy_attr.owner = cls
+            _track_lazy_class(cls)
+        _sidecar.record(cls, cls.__mro__[1:])
+        return cls
 
     @staticmethod
     def class_doc_inherit(prnt_cls_doc, child_doc):
@@ -122,3 +209,489 @@ class DocInheritorBase(type):
         This works for properties, methods, static methods, class methods, and
         decorated methods/properties."""
         raise NotImplementedError
+
+
+def _inherit_class_doc(mcs, prnt_mro, child_doc):
+    """Merges the docstring of a class with the docstrings of its ancestors.
+
+    The docstring is constructed by traversing the mro for the class and merging
+    their docstrings, with each next docstring as serving as the 'parent', and the
+    accumulated docstring serving as the 'child'.
+
+    Parameters
+    ----------
+    mcs : DocInheritorBase
+        The doc-inheriting metaclass of the class.
+    prnt_mro : Sequence[type]
+        The mro of the class, excluding the class itself.
+    child_doc : Optional[str]
+        The class' own docstring.
+
+    Returns
+    -------
+    Optional[str]"""
+    prnt_cls_docs = []
+    for mro_cls in _class_doc_parents(prnt_mro, mcs.incremental):
+        # the docstring of `object` describes no class of interest
+        prnt_cls_docs.append(mro_cls.__doc__ if mro_cls is not object else None)
+    return _fold_docs(mcs.class_doc_inherit, prnt_cls_docs, child_doc)
+
+
+class _LazyClassDoc(object):
+    """Stands in for the docstring of a class, in its namespace, until the docstring is
+    first accessed; the docstring is then merged and replaces this descriptor."""
+
+    __slots__ = ("child_doc", "owner", "doc")
+
+    def __init__(self, child_doc):
+        self.child_doc = child_doc
+        self.owner = None  # set once the class is created
+        self.doc = _PENDING
+
+    def __get__(self, instance, owner=None):
+        if self.doc is _PENDING:
+            if owner is None:
+                owner = type(instance)
+            cls = owner if self.owner is None else self.owner
+            self.doc = _inherit_class_doc(type(cls), cls.__mro__[1:], self.child_doc)
+            try:
+                type.__setattr__(cls, "__doc__", self.doc)
+            # the docstring of a class is read-only in Python 2
+            except (AttributeError, TypeError):
+                pass
+        return self.doc
+
+
+class _MetaclassDoc(object):
+    # Stands for the `__doc__` of a lazy doc-inheriting metaclass. Being a data descriptor, it takes
+    # precedence over the namespace of a class when the class' docstring is accessed; the namespace,
+    # which holds the pending docstring, is read directly by e.g. `object.__getattribute__` (pydoc).
+
+    __slots__ = ()
+
+    def __get__(self, cls, mcs):
+        if cls is None:
+            return None
+        doc = cls.__dict__.get("__doc__", None)
+        if isinstance(doc, _LazyClassDoc):
+            doc = doc.__get__(None, cls)
+        return doc
+
+    def __set__(self, cls, value):
+        type.__dict__["__doc__"].__set__(cls, value)
+
+
+def _inherit_attr_doc(mcs, attribute, prnt_attr_doc):
+    """Merges the docstring of a method, static-method, class-method, abstract-method,
+    decorated-method, or property with the docstring of the corresponding parent attribute.
+
+    Parameters
+    ----------
+    mcs : DocInheritorBase
+        The doc-inheriting metaclass of the class that defines the attribute.
+    attribute : Union[FunctionType, MethodType, classmethod, staticmethod, property]
+        The attribute as stored in the namespace of the class.
+    prnt_attr_doc : str
+
+    Returns
+    -------
+    Union[FunctionType, MethodType, classmethod, staticmethod, property]
+        The attribute, bearing the merged docstring. A property whose docstring
+        is read-only is rebuilt."""
+    is_static_or_class = isinstance(attribute, (staticmethod, classmethod))
+    child_attr = attribute if not is_static_or_class else attribute.__func__
+    return _set_attr_doc(
+        attribute, mcs.attr_doc_inherit(prnt_attr_doc, child_attr.__doc__)
+    )
+
+
+def _set_attr_doc(attribute, doc):
+    """Sets the docstring of a method, static-method, class-method, abstract-method,
+    decorated-method, or property.
+
+    Parameters
+    ----------
+    attribute : Union[FunctionType, MethodType, classmethod, staticmethod, property]
+        The attribute as stored in the namespace of a class.
+    doc : Optional[str]
+
+    Returns
+    -------
+    Union[FunctionType, MethodType, classmethod, staticmethod, property]
+        The attribute, bearing the docstring. A property whose docstring is
+        read-only is rebuilt."""
+    is_static_or_class = isinstance(attribute, (staticmethod, classmethod))
+    child_attr = attribute if not is_static_or_class else attribute.__func__
+    try:
+        child_attr.__doc__ = doc
+    # property.__doc__ is read-only in Python 2 (TypeError), 3.3 - 3.4 (AttributeError)
+    except (TypeError, AttributeError) as err:
+        if type(child_attr) in (property, abstractproperty):
+            new_prop = property(
+                fget=child_attr.fget,
+                fset=child_attr.fset,
+                fdel=child_attr.fdel,
+                doc=doc,
+            )
+            if isinstance(child_attr, abstractproperty):
+                new_prop = abstractproperty(new_prop)
+            return new_prop
+        else:
+            raise type(err)(err)
+    return attribute
+
+
+def _is_lazy_type(attribute):
+    return isinstance(attribute, (FunctionType, classmethod, staticmethod, property))
+
+
+class _LazyAttrDoc(object):
+    """Records what is needed to merge the docstring of an attribute of a class once it
+    is first accessed: the docstring is then merged, and the attribute replaces the
+    descriptor that stood in for it in the class' namespace."""
+
+    __slots__ = ("attr", "attribute", "owner", "doc")
+
+    def __init__(self, attr, attribute):
+        self.attr = attr
+        self.attribute = attribute
+        self.owner = None  # set once the class is created
+        self.doc = _PENDING
+
+    def descriptor(self):
+        """ Returns the descriptor that stands in for the attribute."""
+        if isinstance(self.attribute, property):
+            return _LazyDataAttribute(self)
+        return _LazyAttribute(self)
+
+    def resolve(self, owner=None):
+        """Merges the docstring of the attribute, if it is still pending, and restores the
+        attribute in the namespace of the class.
+
+        Parameters
+        ----------
+        owner : Optional[type]
+            The class that defines the attribute; only needed if it is accessed before
+            the class is created (e.g. by `__init_subclass__`).
+
+        Returns
+        -------
+        Optional[str]
+            The docstring of the attribute."""
+        with _lazy_lock:
+            if self.doc is _PENDING:
+                cls = self.owner if self.owner is not None else owner
+                attribute = self.attribute
+                prnt_attr_doc = _nearest_attr_doc(
+                    _prnt_attr_docs(cls.__mro__[1:]), self.attr
+                )
+                if prnt_attr_doc is not None:
+                    attribute = _inherit_attr_doc(type(cls), attribute, prnt_attr_doc)
+                type.__setattr__(cls, self.attr, attribute)
+                self.attribute = attribute
+                self.doc = _attr_doc(attribute)
+                cls.__dict__[_ATTR_DOCS][self.attr] = self.doc
+        return self.doc
+
+
+class _LazyAttribute(object):
+    # Stands in for an attribute, in the namespace of a class, until the attribute is accessed.
+    # Accessing the attribute, or the docstring of this descriptor, resolves the attribute's docstring.
+
+    __slots__ = ("_lazy_attr",)
+
+    def __init__(self, lazy_attr):
+        self._lazy_attr = lazy_attr
+
+    def __get__(self, instance, owner=None):
+        # as per the descriptor protocol, the owner may be omitted when an instance is given
+        if owner is None:
+            owner = type(instance)
+        self._lazy_attr.resolve(owner)
+        return self._lazy_attr.attribute.__get__(instance, owner)
+
+    @property
+    def __doc__(self):
+        return self._lazy_attr.resolve()
+
+    @property
+    def __isabstractmethod__(self):
+        # read by ABCMeta while the class is created, thus before the docstring can be resolved
+        return getattr(self._lazy_attr.attribute, "__isabstractmethod__", False)
+
+    def __getattr__(self, name):
+        if self._lazy_attr.owner is not None:
+            self._lazy_attr.resolve()
+        return getattr(self._lazy_attr.attribute, name)
+
+
+class _LazyDataAttribute(_LazyAttribute):
+    # Stands in for a property, which is a data descriptor.
+
+    __slots__ = ()
+
+    __doc__ = _LazyAttribute.__doc__
+
+    def __set__(self, instance, value):
+        self._lazy_attr.resolve(type(instance))
+        self._lazy_attr.attribute.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self._lazy_attr.resolve(type(instance))
+        self._lazy_attr.attribute.__delete__(instance)
+
+
+def _resolve_pending(cls):
+    """Resolves the pending docstrings of a class created by a lazy doc-inheriting metaclass,
+    and of its attributes.
+
+    Parameters
+    ----------
+    cls : type
+
+    Returns
+    -------
+    int
+        The number of docstrings that were resolved."""
+    resolved = 0
+    namespace = cls.__dict__
+    class_doc = namespace.get("__doc__")
+    if isinstance(class_doc, _LazyClassDoc):
+        class_doc.__get__(None, cls)
+        resolved += 1
+    for attribute in list(namespace.values()):
+        if (
+            isinstance(attribute, _LazyAttribute)
+            and attribute._lazy_attr.doc is _PENDING
+        ):
+            attribute._lazy_attr.resolve(cls)
+            resolved += 1
+    return resolved
+
+
+def _merge_mros(mros):
+    """Merges the mros of a class' bases (C3), each of which starts with its base.
+
+    Parameters
+    ----------
+    mros : Sequence[Sequence[Hashable]]
+
+    Returns
+    -------
+    Optional[List[Hashable]]
+        None if the mros do not admit a consistent merge."""
+    seqs = [list(mro) for mro in mros] + [[mro[0] for mro in mros]]
+    mro = []
+    while True:
+        seqs = [seq for seq in seqs if seq]
+        if not seqs:
+            return mro
+        for seq in seqs:
+            head = seq[0]
+            if not any(head in other[1:] for other in seqs):
+                break
+        else:
+            return None
+        mro.append(head)
+        for seq in seqs:
+            if seq[0] is head:
+                del seq[0]
+
+
+def _linearize(class_bases):
+    """Computes the C3 linearization of the specified bases, i.e. the mro of a class
+    with these bases, excluding the class itself.
+
+    Parameters
+    ----------
+    class_bases : Tuple[type, ...]
+
+    Returns
+    -------
+    List[type]
+
+    Raises
+    ------
+    TypeError
+        The bases do not admit a consistent mro."""
+    if len(class_bases) == 1:
+        return list(class_bases[0].__mro__)
+    mro = _merge_mros([base.__mro__ for base in class_bases])
+    if mro is None:
+        raise TypeError(
+            "Cannot create a consistent method resolution order (MRO) for bases "
+            + ", ".join(base.__name__ for base in class_bases)
+        )
+    return mro
+
+
+def _inherited_mro(mro_cls):
+    # the ancestors whose docstrings are merged into those of a doc-inheriting class
+    return mro_cls.__mro__[1:] if isinstance(mro_cls, DocInheritorBase) else None
+
+
+def _class_doc_parents(prnt_mro, incremental=False, inherited_mro=_inherited_mro):
+    """Yields the classes whose docstrings are merged into the docstring of a class,
+    in the order in which they are merged.
+
+    Parameters
+    ----------
+    prnt_mro : Sequence[type]
+        The mro of the class, excluding the class itself.
+    incremental : bool, optional (default: False)
+        If True, the ancestors of a class created by a doc-inheriting metaclass are skipped, as
+        their docstrings have already been merged into that class' docstring.
+    inherited_mro : Callable[[type], Optional[Sequence[type]]], optional
+        Returns the ancestors of a class of the mro whose docstrings are merged into its own;
+        None if it is not created by a doc-inheriting metaclass.
+
+    Returns
+    -------
+    Generator[type, None, None]"""
+    if not incremental:
+        for mro_cls in prnt_mro:
+            yield mro_cls
+        return
+
+    merged = set()
+    for mro_cls in prnt_mro:
+        if mro_cls in merged:
+            continue
+        yield mro_cls
+        ancestors = inherited_mro(mro_cls)
+        if ancestors is not None:
+            merged.update(ancestors)
+
+
+def _attr_doc(attribute):
+    """Returns the docstring that an attribute, as stored in a class' namespace, contributes
+    to the corresponding attribute of a subclass; None if it is not a documented callable
+    or descriptor.
+
+    Parameters
+    ----------
+    attribute : Any
+
+    Returns
+    -------
+    Optional[str]"""
+    if isinstance(attribute, (staticmethod, classmethod)):
+        return attribute.__func__.__doc__
+    if callable(attribute) or hasattr(type(attribute), "__get__"):
+        return getattr(attribute, "__doc__", None)
+    return None
+
+
+def _index_attr_docs(namespace):
+    """Builds the index of the docstrings of the documented attributes in a class' namespace.
+
+    Parameters
+    ----------
+    namespace : Mapping[str, Any]
+
+    Returns
+    -------
+    Dict[str, str]
+        Maps attribute names to their docstrings."""
+    attr_docs = {}
+    for attr, attribute in namespace.items():
+        if attr == "__doc__":
+            continue
+        doc = _attr_doc(attribute)
+        if doc is not None:
+            attr_docs[attr] = doc
+    return attr_docs
+
+
+def _prnt_attr_docs(prnt_mro):
+    """Returns the namespaces, and the attribute-docstring indexes, of the classes in the mro of
+    a class, excluding the class itself.
+
+    Parameters
+    ----------
+    prnt_mro : Sequence[type]
+
+    Returns
+    -------
+    List[Tuple[Mapping[str, Any], Mapping[str, Union[str, _LazyAttrDoc]]]]
+        The index of a class that is not created by a doc-inheriting metaclass is empty."""
+    return [
+        (mro_cls.__dict__, mro_cls.__dict__.get(_ATTR_DOCS) or {})
+        for mro_cls in prnt_mro
+    ]
+
+
+def _nearest_attr_doc(prnt_attr_docs, attr):
+    """Returns the first docstring, of the attribute `attr`, found along the specified
+    namespaces; pending docstrings are resolved along the way.
+
+    The index of a namespace is recorded when its class is created, whereas the namespace
+    may be altered afterwards (e.g. by `A.f = f`, or by `A.f.__doc__ = "..."`): the docstring
+    of the attribute that is in the namespace at present prevails. The index only serves to
+    resolve the pending docstrings of lazy attributes.
+
+    Parameters
+    ----------
+    prnt_attr_docs : Iterable[Tuple[Mapping[str, Any], Dict[str, Union[str, _LazyAttrDoc]]]]
+    attr : str
+
+    Returns
+    -------
+    Optional[str]"""
+    for namespace, attr_docs in prnt_attr_docs:
+        attribute = namespace.get(attr, _PENDING)
+        if attribute is _PENDING:
+            continue
+
+        prnt_attr_doc = attr_docs.get(attr)
+        if isinstance(prnt_attr_doc, _LazyAttrDoc) and (
+            isinstance(attribute, _LazyAttribute)
+            and attribute._lazy_attr is prnt_attr_doc
+        ):
+            prnt_attr_doc = prnt_attr_doc.resolve()
+        else:
+            prnt_attr_doc = _attr_doc(attribute)
+
+        if prnt_attr_doc is not None:
+            return prnt_attr_doc
+    return None
+
+
+def _attr_docs(cls):
+    """Returns the index of the docstrings of the attributes defined by `cls` itself. This is
+    recorded by the classes created by a doc-inheriting metaclass, and is built from the
+    `__dict__` of any other class.
+
+    Parameters
+    ----------
+    cls : type
+
+    Returns
+    -------
+    Mapping[str, str]"""
+    attr_docs = cls.__dict__.get(_ATTR_DOCS)
+    if attr_docs is None:
+        attr_docs = _index_attr_docs(cls.__dict__)
+    return attr_docs
+
+
+def _fold_docs(merge_func, prnt_docs, child_doc):
+    """Merge the child's docstring with each of the parents' docstrings in turn, with the
+    accumulated docstring serving as the 'child' for each subsequent merge.
+
+    Parameters
+    ----------
+    merge_func : Callable[[Optional[str], Optional[str]], Optional[str]]
+    prnt_docs : Sequence[Optional[str]]
+    child_doc : Optional[str]
+
+    Returns
+    -------
+    Optional[str]"""
+    fold = getattr(merge_func, "fold", None)
+    if fold is not None:
+        return fold(prnt_docs, child_doc)
+
+    for prnt_doc in prnt_docs:
+        child_doc = merge_func(prnt_doc, child_doc)
+    return child_doc
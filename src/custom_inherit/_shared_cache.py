@@ -0,0 +1,267 @@
+from __future__ import absolute_import
+
+import atexit
+import hashlib
+import struct
+import threading
+
+from ._fingerprint import style_fingerprint, update_with_doc
+
+""" Exposes the read-only table of merged docstrings that is shared, through shared memory,
+    between a parent process and the worker processes that it spawns.
+
+    The parent publishes the docstrings held by `custom_inherit.merge_cache` into a block of shared
+    memory, laid out as an open-addressing hash table:
+
+        header: magic, format version, number of slots, number of entries, offset of the docstrings
+        slots:  the (sha1) key of an entry, along with the offset and the length of its docstring
+        data:   the utf-8 encoded docstrings
+
+    Workers attach to the block by its name, and look up a docstring by probing the slots for
+    its key, decoding only the docstring that is found; nothing is copied or deserialized upon
+    attaching. Keys hash the version of custom_inherit, the code of the style function, and the
+    docstrings that it merged - as the keys of the disk cache do."""
+
+__all__ = ["SharedDocTable", "ENV_VAR"]
+
+# names the block of shared memory that the processes spawned by a publishing process attach to
+ENV_VAR = "CUSTOM_INHERIT_SHARED_CACHE"
+
+_MAGIC = b"CIDT"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sIIIQ")  # magic, version, n_slots, n_entries, data offset
+_SLOT = struct.Struct("<20sQI")  # key, docstring offset, docstring length
+_EMPTY_KEY = b"\x00" * 20
+_NONE_LENGTH = 0xFFFFFFFF  # marks a docstring that is None
+
+_MISSING = object()
+
+# serializes the patching of `resource_tracker.register`, which is global to the process
+_register_lock = threading.Lock()
+
+
+def _shared_memory(name, create=False, size=0):
+    """Creates, or attaches to, a block of shared memory. Only the creating process tracks the
+    block, such that it is destroyed once that process exits - rather than once any attached
+    process exits."""
+    from multiprocessing import shared_memory
+
+    if create:
+        return shared_memory.SharedMemory(name, create=True, size=size)
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:  # Python < 3.13 tracks every attached block
+        from multiprocessing import resource_tracker
+
+        with _register_lock:
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+            try:
+                return shared_memory.SharedMemory(name)
+            finally:
+                resource_tracker.register = register
+
+
+class SharedDocTable(object):
+    """A read-only mapping of merged docstrings, held in a block of shared memory.
+
+    Create the table with `SharedDocTable.publish`, and attach to it, from another process,
+    with `SharedDocTable.attach`."""
+
+    def __init__(self, shm, owner=False):
+        self._shm = shm
+        self._buf = shm.buf
+        self._owner = owner
+        self._keyer = _Keyer()
+        self._lock = threading.Lock()
+
+        magic, version, n_slots, n_entries, data_offset = _HEADER.unpack_from(
+            self._buf, 0
+        )
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            self.close()
+            raise ValueError(
+                "{!r} does not hold a table of shared docstrings".format(shm.name)
+            )
+        self._mask = n_slots - 1
+        self._n_entries = n_entries
+        self._data_offset = data_offset
+
+    def __repr__(self):
+        return "{}({!r}, entries={})".format(
+            type(self).__name__, self.name, self._n_entries
+        )
+
+    def __len__(self):
+        return self._n_entries
+
+    @property
+    def name(self):
+        """ The name of the block of shared memory that holds the table."""
+        return self._shm.name
+
+    @classmethod
+    def publish(cls, entries, name=None):
+        """Writes a table of merged docstrings into a new block of shared memory. The block is
+        destroyed once the publishing process exits, or upon `unlink()`.
+
+        Parameters
+        ----------
+        entries : Iterable[Tuple[Callable, Sequence[Optional[str]], Optional[str]]]
+            The style functions, the docstrings that they merged, and the merged docstrings.
+            Entries whose style cannot be identified across processes are skipped.
+        name : Optional[str]
+            The name of the block; a unique name is generated by default.
+
+        Returns
+        -------
+        SharedDocTable"""
+        keyer = _Keyer()
+        keyed = {}
+        for style_func, docs, doc in entries:
+            key = keyer.key(style_func, docs)
+            if key is not None and (doc is None or isinstance(doc, str)):
+                keyed[key] = doc
+
+        n_slots = 8
+        while n_slots < 2 * len(keyed):  # keeps the load factor below 1/2
+            n_slots *= 2
+        data_offset = _HEADER.size + n_slots * _SLOT.size
+        encoded = [
+            (key, None if doc is None else doc.encode("utf-8", "surrogatepass"))
+            for key, doc in keyed.items()
+        ]
+        size = data_offset + sum(len(doc) for _, doc in encoded if doc is not None)
+
+        shm = _shared_memory(name, create=True, size=size)
+        buf = shm.buf
+        _HEADER.pack_into(
+            buf, 0, _MAGIC, _FORMAT_VERSION, n_slots, len(keyed), data_offset
+        )
+        mask = n_slots - 1
+        offset = 0
+        for key, doc in encoded:
+            index = int.from_bytes(key[:8], "little") & mask
+            while bytes(buf[_slot(index) : _slot(index) + 20]) != _EMPTY_KEY:
+                index = (index + 1) & mask
+            if doc is None:
+                _SLOT.pack_into(buf, _slot(index), key, 0, _NONE_LENGTH)
+            else:
+                start = data_offset + offset
+                buf[start : start + len(doc)] = doc
+                _SLOT.pack_into(buf, _slot(index), key, offset, len(doc))
+                offset += len(doc)
+
+        table = cls(shm, owner=True)
+        atexit.register(table.unlink)
+        return table
+
+    @classmethod
+    def attach(cls, name):
+        """Attaches to a table that was published by another process.
+
+        Parameters
+        ----------
+        name : str
+
+        Returns
+        -------
+        SharedDocTable"""
+        return cls(_shared_memory(name))
+
+    def key(self, style_func, docs):
+        """Returns the key under which the docstring, merged by `style_func` from `docs`,
+        is held by the table.
+
+        Returns
+        -------
+        Optional[bytes]
+            None if the style cannot be identified across processes."""
+        return self._keyer.key(style_func, docs)
+
+    def get(self, key, default=None):
+        """Return the docstring held under `key`.
+
+        Parameters
+        ----------
+        key : bytes
+        default : Any, optional (default: None)
+            Returned if `key` is not held by the table.
+
+        Returns
+        -------
+        Any
+            `default` once the table is closed."""
+        # the buffer cannot be released by `close` while it is read
+        with self._lock:
+            buf = self._buf
+            if buf is None:
+                return default
+            mask = self._mask
+            index = int.from_bytes(key[:8], "little") & mask
+            while True:
+                start = _slot(index)
+                slot_key = bytes(buf[start : start + 20])
+                if slot_key == key:
+                    break
+                if slot_key == _EMPTY_KEY:
+                    return default
+                index = (index + 1) & mask
+            _, offset, length = _SLOT.unpack_from(buf, start)
+            if length == _NONE_LENGTH:
+                return None
+            start = self._data_offset + offset
+            doc = bytes(buf[start : start + length])
+        return doc.decode("utf-8", "surrogatepass")
+
+    def close(self):
+        """ Detach from the block of shared memory."""
+        with self._lock:
+            if self._buf is not None:
+                self._buf.release()
+                self._buf = None
+                self._shm.close()
+
+    def unlink(self):
+        """ Detach from, and destroy, the block of shared memory (if this process published it)."""
+        self.close()
+        if self._owner:
+            self._owner = False
+            try:
+                self._shm.unlink()
+            except (OSError, IOError):  # already destroyed
+                pass
+
+
+def _slot(index):
+    return _HEADER.size + index * _SLOT.size
+
+
+class _Keyer(object):
+    # computes the keys of entries, memoizing the fingerprints of style functions
+
+    def __init__(self):
+        # resolved upon first use, as resolving the version is costly; a table is attached to
+        # upon import (see `custom_inherit.attach_shared_cache`)
+        self._salt = None
+        self._fingerprints = {}
+
+    def key(self, style_func, docs):
+        try:
+            fingerprint = self._fingerprints[style_func]
+        except KeyError:
+            fingerprint = self._fingerprints.setdefault(
+                style_func, style_fingerprint(style_func)
+            )
+        if fingerprint is None:
+            return None
+
+        if self._salt is None:
+            from . import __version__
+
+            self._salt = "custom_inherit {} shared".format(__version__).encode("utf-8")
+        sha = hashlib.sha1(self._salt)
+        sha.update(fingerprint.encode("utf-8"))
+        for doc in docs:
+            update_with_doc(sha, doc)
+        return sha.digest()
@@ -0,0 +1,297 @@
+from __future__ import absolute_import
+
+import importlib
+import os
+import sys
+from threading import RLock
+from types import FunctionType, MethodType
+
+""" Exposes the docstrings that are compiled ahead of time into a package's sidecar module.
+
+    `python -m custom_inherit compile <package>` imports the package, and writes the docstrings
+    resolved by the doc-inheriting metaclasses and decorators, keyed by module and qualified name,
+    into the generated module <package>._custom_inherit_docs. Upon import, the metaclasses and
+    decorators use these docstrings instead of merging docstrings - as long as the sources of the
+    package, the sources of the modules outside of it that its docstrings are inherited from (e.g.
+    the base classes of another library), and the version of custom_inherit, are those that the
+    docstrings were compiled from.
+
+    Objects are identified by their `__qualname__`; under Python 2, which lacks it, docstrings are
+    neither compiled nor looked up."""
+
+__all__ = ["SIDECAR", "compile_package", "compiled_doc", "compiled_docs", "record"]
+
+SIDECAR = "_custom_inherit_docs"
+
+_MISSING = object()
+
+# top-level package -> Optional[Dict[module-name, Dict[qualname, docstring]]]; None records
+# that the package has no (valid) sidecar, such that its absence is looked up only once
+_sidecars = {}
+_lock = RLock()
+
+# the classes and decorated objects created while a package is being compiled, along with the
+# objects that their docstrings are inherited from
+_recorded = None
+
+
+def _target(obj):
+    """ Returns the function that identifies a decorated object by its module and qualified name."""
+    if isinstance(obj, property):
+        return obj.fget
+    if isinstance(obj, (staticmethod, classmethod)):
+        return obj.__func__
+    return obj
+
+
+def _qualname(obj):
+    # the names of nested classes and of methods are ambiguous without a qualified name
+    return getattr(obj, "__qualname__", None)
+
+
+def _hash_file(path):
+    import hashlib
+
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _source_hashes(package_dir):
+    """ Maps the path of each source file of a package, relative to its directory, to its hash."""
+    source_hashes = {}
+    for dir_path, dir_names, file_names in os.walk(package_dir):
+        dir_names[:] = sorted(name for name in dir_names if name != "__pycache__")
+        for file_name in sorted(file_names):
+            if file_name.endswith(".py") and file_name != SIDECAR + ".py":
+                path = os.path.join(dir_path, file_name)
+                rel_path = os.path.relpath(path, package_dir).replace(os.sep, "/")
+                source_hashes[rel_path] = _hash_file(path)
+    return source_hashes
+
+
+def _external_hashes(package_name, parents):
+    """Maps the names of the modules outside of a package, which define the objects that its
+    docstrings are inherited from, to the hashes of their sources."""
+    external_hashes = {}
+    for parent in parents:
+        module_name = getattr(_target(parent), "__module__", None) or ""
+        if module_name.partition(".")[0] in (
+            package_name,
+            "",
+            "builtins",
+            "__builtin__",
+        ):
+            continue
+        if module_name not in external_hashes:
+            path = getattr(sys.modules.get(module_name), "__file__", None)
+            if path is not None:
+                external_hashes[module_name] = _hash_file(path)
+    return external_hashes
+
+
+def _external_sources_changed(external_hashes):
+    for module_name, sha in external_hashes.items():
+        try:
+            module = importlib.import_module(module_name)
+            if _hash_file(module.__file__) != sha:
+                return True
+        except (ImportError, IOError, OSError, AttributeError):
+            return True
+    return False
+
+
+def _load(package):
+    """Returns the docstrings compiled into the sidecar module of `package`, or None if there
+    is no such module, or if the package, the modules that it inherits docstrings from, or
+    custom_inherit have changed since it was compiled."""
+    top = sys.modules.get(package)
+    if top is not None and not hasattr(top, "__path__"):
+        return None  # a top-level module, rather than a package, has no sidecar
+
+    try:
+        sidecar = importlib.import_module(package + "." + SIDECAR)
+    except ImportError:
+        return None
+
+    from . import __version__
+
+    if getattr(sidecar, "CUSTOM_INHERIT_VERSION", None) != __version__:
+        return None
+
+    package_dir = os.path.dirname(os.path.abspath(sidecar.__file__))
+    try:
+        if _source_hashes(package_dir) != sidecar.SOURCE_HASHES:
+            return None
+        if _external_sources_changed(sidecar.EXTERNAL_HASHES):
+            return None
+    except (IOError, OSError, AttributeError):
+        return None
+    return sidecar.DOCS
+
+
+def compiled_docs(module_name):
+    """Returns the docstrings compiled for the classes and functions of a module.
+
+    Parameters
+    ----------
+    module_name : Optional[str]
+
+    Returns
+    -------
+    Optional[Dict[str, Optional[str]]]
+        Maps the qualified names of the module's classes, of their attributes, and of its
+        decorated functions to their docstrings. None if nothing is compiled for the module."""
+    if _recorded is not None or not module_name:
+        return None
+
+    package = module_name.partition(".")[0]
+    try:
+        docs = _sidecars[package]
+    except KeyError:
+        with _lock:
+            if package not in _sidecars:
+                _sidecars[package] = _load(package)
+            docs = _sidecars[package]
+    return None if docs is None else docs.get(module_name)
+
+
+def compiled_doc(obj):
+    """Returns the docstring compiled for a decorated function, method, or property.
+
+    Parameters
+    ----------
+    obj : Any
+
+    Returns
+    -------
+    Union[Optional[str], object]
+        The sentinel `_MISSING` if no docstring is compiled for the object."""
+    target = _target(obj)
+    qualname = _qualname(target)
+    if qualname is None:
+        return _MISSING
+    docs = compiled_docs(getattr(target, "__module__", None))
+    if docs is None:
+        return _MISSING
+    return docs.get(qualname, _MISSING)
+
+
+def record(obj, parents=()):
+    """Records a class, or decorated object, whose docstrings are to be compiled.
+
+    Parameters
+    ----------
+    obj : Any
+    parents : Iterable[Any]
+        The objects that the docstrings of `obj` are inherited from (e.g. the classes of its mro)."""
+    if _recorded is not None:
+        _recorded.append((obj, tuple(parents)))
+
+
+def _resolved_docs(obj):
+    """ Yields the qualified names and (resolved) docstrings of a recorded object and its attributes."""
+    from ._metaclass_base import _attr_doc, _LazyAttribute
+
+    if not isinstance(obj, type):
+        yield _qualname(_target(obj)), _attr_doc(obj)
+        return
+
+    qualname = _qualname(obj)
+    yield qualname, obj.__doc__
+    for attr, attribute in sorted(vars(obj).items()):
+        if isinstance(attribute, _LazyAttribute):
+            yield qualname + "." + attr, attribute.__doc__
+        elif isinstance(
+            attribute, (FunctionType, MethodType, classmethod, staticmethod, property)
+        ):
+            yield qualname + "." + attr, _attr_doc(attribute)
+
+
+def compile_package(package_name):
+    """Imports a package, along with all of its modules, and writes the docstrings resolved by
+    its doc-inheriting metaclasses and decorators into its sidecar module.
+
+    Parameters
+    ----------
+    package_name : str
+
+    Returns
+    -------
+    Tuple[str, int]
+        The path of the sidecar module, and the number of docstrings compiled into it.
+
+    Raises
+    ------
+    ValueError
+        `package_name` does not name a top-level package."""
+    import pkgutil
+
+    from . import __version__
+
+    if "." in package_name:
+        raise ValueError(
+            "Only top-level packages can be compiled, got: {!r}".format(package_name)
+        )
+
+    global _recorded
+    with _lock:
+        _recorded = []
+        try:
+            package = importlib.import_module(package_name)
+            if not hasattr(package, "__path__"):
+                raise ValueError("{!r} is not a package".format(package_name))
+            for _, module_name, _ in pkgutil.walk_packages(
+                package.__path__, package.__name__ + "."
+            ):
+                if module_name.rpartition(".")[2] != SIDECAR:
+                    importlib.import_module(module_name)
+            recorded = _recorded
+        finally:
+            _recorded = None
+
+    docs = {}
+    parents = []
+    for obj, obj_parents in recorded:
+        module_name = getattr(_target(obj), "__module__", None) or ""
+        if module_name.partition(".")[0] != package_name:
+            continue
+        if _qualname(_target(obj)) is None:
+            continue
+        docs.setdefault(module_name, {}).update(_resolved_docs(obj))
+        parents.extend(obj_parents)
+
+    package_dir = os.path.dirname(os.path.abspath(package.__file__))
+    path = os.path.join(package_dir, SIDECAR + ".py")
+    lines = [
+        '""" Generated by `python -m custom_inherit compile {}`; do not edit."""'.format(
+            package_name
+        ),
+        "",
+        "CUSTOM_INHERIT_VERSION = {!r}".format(__version__),
+        "",
+        "SOURCE_HASHES = {",
+    ]
+    source_hashes = _source_hashes(package_dir)
+    lines.extend(
+        "    {!r}: {!r},".format(*item) for item in sorted(source_hashes.items())
+    )
+    lines.extend(["}", "", "EXTERNAL_HASHES = {"])
+    external_hashes = _external_hashes(package_name, parents)
+    lines.extend(
+        "    {!r}: {!r},".format(*item) for item in sorted(external_hashes.items())
+    )
+    lines.extend(["}", "", "DOCS = {"])
+    for module_name, module_docs in sorted(docs.items()):
+        lines.append("    {!r}: {{".format(module_name))
+        lines.extend(
+            "        {!r}: {!r},".format(*item) for item in sorted(module_docs.items())
+        )
+        lines.append("    },")
+    lines.extend(["}", ""])
+
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+
+    with _lock:
+        _sidecars.pop(package_name, None)
+    return path, sum(len(module_docs) for module_docs in docs.values())
@@ -0,0 +1,577 @@
+from __future__ import absolute_import
+
+import ast
+import os
+from collections import OrderedDict
+
+from ._metaclass_base import _attr_docs, _class_doc_parents, _fold_docs, _merge_mros
+
+""" Exposes the static (import-free) resolution of the docstrings inherited within a project.
+
+    The sources of a project are parsed with `ast`; the classes that derive from a metaclass
+    returned by `DocInheritMeta`, and the functions decorated by `doc_inherit`, are resolved
+    across the project's modules, and their docstrings are merged by the same style functions,
+    and along the same mros, as `DocInheritorBase` would merge them upon import.
+
+    Anything whose docstring depends on code that cannot be evaluated statically - e.g. a base
+    class that is defined outside of the project, or a style that is not named by a literal - is
+    reported as a problem, and left as-is."""
+
+__all__ = ["StaticProject"]
+
+_MISSING = object()
+
+# the static stand-in for `object`, the root of every mro
+_OBJECT = "object"
+
+# decorators that leave the docstring of the decorated function in place
+_DOC_DECORATORS = frozenset(
+    [
+        "staticmethod",
+        "classmethod",
+        "property",
+        "abstractmethod",
+        "abstractproperty",
+        "abstractclassmethod",
+        "abstractstaticmethod",
+    ]
+)
+
+# the positional parameters of `DocInheritMeta`
+_META_PARAMS = (
+    "style",
+    "abstract_base_class",
+    "include_special_methods",
+    "incremental",
+    "lazy",
+)
+
+_FUNCTION_DEFS = (ast.FunctionDef, getattr(ast, "AsyncFunctionDef", ast.FunctionDef))
+
+
+def _dotted(node):
+    """ Returns 'a.b.c' for the expression `a.b.c`; None for any other expression."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return _MISSING
+
+
+def _call_args(call, params):
+    """ Maps the parameter names of a call to the (literal values of its) arguments."""
+    args = dict(zip(params, call.args))
+    args.update((kwarg.arg, kwarg.value) for kwarg in call.keywords if kwarg.arg)
+    return args
+
+
+def _is_call_to(node, name):
+    return (
+        isinstance(node, ast.Call)
+        and (_dotted(node.func) or "").rpartition(".")[2] == name
+    )
+
+
+def _bound_names(stmts):
+    """ Returns the names that are bound by statements (and by the statements that they hold)."""
+    names = []
+    for stmt in stmts:
+        if isinstance(stmt, _FUNCTION_DEFS + (ast.ClassDef,)):
+            names.append(stmt.name)
+            continue
+        targets = getattr(stmt, "targets", None) or [getattr(stmt, "target", None)]
+        if isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            for target in targets:
+                names.extend(
+                    node.id for node in ast.walk(target) if isinstance(node, ast.Name)
+                )
+        for field in ("body", "orelse", "finalbody"):
+            names.extend(_bound_names(getattr(stmt, field, None) or []))
+        for handler in getattr(stmt, "handlers", None) or []:
+            names.extend(_bound_names(handler.body))
+    return names
+
+
+def _raw_doc(node):
+    """ Returns the docstring of a class or function definition, as Python would store it."""
+    if node.body and isinstance(node.body[0], ast.Expr):
+        doc = _literal(node.body[0].value)
+        if isinstance(doc, str):
+            return doc
+    return None
+
+
+class StaticMeta(object):
+    """ The (literal) options of a `DocInheritMeta(...)` call."""
+
+    __slots__ = ("style", "include_special_methods", "incremental", "merge_func")
+
+    def __init__(self, style, include_special_methods, incremental, merge_func):
+        self.style = style
+        self.include_special_methods = include_special_methods
+        self.incremental = incremental
+        self.merge_func = merge_func
+
+    def key(self):
+        return self.style, self.include_special_methods, self.incremental
+
+
+class StaticModule(object):
+    """ A parsed source module of the project, and the names bound at its top level."""
+
+    def __init__(self, name, path, is_package):
+        self.name = name
+        self.path = path
+        self.is_package = is_package
+        with open(path, "rb") as f:
+            self.source = f.read()
+        self.tree = ast.parse(self.source, path)
+        self.imports = {}  # local name -> dotted name of the imported module or object
+        self.assigns = {}  # local name -> assigned expression
+        self.classes = OrderedDict()  # qualname -> StaticClass
+        self.functions = OrderedDict()  # qualname -> function definition
+        self._collect()
+
+    def _absolute(self, module, level):
+        if not level:
+            return module
+        package = self.name.split(".")
+        if not self.is_package:
+            package = package[:-1]
+        if level > 1:
+            package = package[: -(level - 1)]
+        return ".".join(package + ([module] if module else []))
+
+    def _collect(self):
+        for stmt in self.tree.body:
+            if isinstance(stmt, ast.Import):
+                for alias in stmt.names:
+                    if alias.asname:
+                        self.imports[alias.asname] = alias.name
+                    else:
+                        head = alias.name.partition(".")[0]
+                        self.imports[head] = head
+            elif isinstance(stmt, ast.ImportFrom):
+                module = self._absolute(stmt.module, stmt.level)
+                for alias in stmt.names:
+                    self.imports[alias.asname or alias.name] = module + "." + alias.name
+            elif isinstance(stmt, ast.Assign):
+                for target in stmt.targets:
+                    if isinstance(target, ast.Name):
+                        self.assigns[target.id] = stmt.value
+            elif isinstance(stmt, ast.ClassDef):
+                self._collect_class(stmt, stmt.name)
+            elif isinstance(stmt, _FUNCTION_DEFS):
+                self.functions[stmt.name] = stmt
+
+    def _collect_class(self, node, qualname):
+        self.classes[qualname] = StaticClass(self, qualname, node)
+        for stmt in node.body:
+            if isinstance(stmt, ast.ClassDef):
+                self._collect_class(stmt, qualname + "." + stmt.name)
+
+
+class StaticClass(object):
+    """ A class definition of the project, along with its (statically) resolved docstrings."""
+
+    def __init__(self, module, qualname, node):
+        self.module = module
+        self.qualname = qualname
+        self.node = node
+        self.methods = OrderedDict()  # name -> function definition
+        # name -> why the docstring of the member cannot be resolved statically
+        self.unknown = OrderedDict()
+        self.meta_node = None
+        self.mro = None  # resolved lazily, along with the following
+        self.meta = None
+        self.doc = None
+        self.attr_docs = None
+
+        for kwarg in node.keywords if hasattr(node, "keywords") else ():
+            if kwarg.arg == "metaclass":
+                self.meta_node = kwarg.value
+        for decorator in node.decorator_list:
+            if _is_call_to(decorator, "add_metaclass") and decorator.args:
+                self.meta_node = decorator.args[0]
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "__metaclass__"
+                for target in stmt.targets
+            ):
+                self.meta_node = stmt.value
+            elif isinstance(stmt, _FUNCTION_DEFS):
+                names = [
+                    _dotted(getattr(d, "func", d)) or "" for d in stmt.decorator_list
+                ]
+                if any(
+                    name.rpartition(".")[2] in ("setter", "getter", "deleter")
+                    for name in names
+                ):
+                    continue  # the property, and its docstring, are defined by its getter
+                if all(
+                    name.rpartition(".")[2] in _DOC_DECORATORS | {"doc_inherit"}
+                    for name in names
+                ):
+                    # a later definition of the name replaces any earlier binding of it
+                    self.unknown.pop(stmt.name, None)
+                    self.methods[stmt.name] = stmt
+                else:
+                    self._unknown(stmt.name, "has decorators that cannot be evaluated")
+            elif isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                # e.g. an alias of a method, or `property(getter)`; but not a literal
+                value = stmt.value
+                if value is not None and _literal(value) is _MISSING:
+                    for name in _bound_names([stmt]):
+                        self._unknown(name, "is bound to an expression")
+            elif not isinstance(stmt, (ast.ClassDef, ast.Expr, ast.Pass)):
+                # e.g. methods defined within an `if` or a `try` statement
+                for name in _bound_names([stmt]):
+                    self._unknown(
+                        name,
+                        "is bound within a block of `{}`".format(
+                            type(stmt).__name__.lower()
+                        ),
+                    )
+
+    def _unknown(self, name, reason):
+        self.methods.pop(name, None)
+        self.unknown.setdefault(name, reason)
+
+    def __repr__(self):
+        return "StaticClass({}.{})".format(self.module.name, self.qualname)
+
+
+class StaticProject(object):
+    """The modules of a project, within which inherited docstrings are resolved statically.
+
+    Attributes
+    ----------
+    modules : Dict[str, StaticModule]
+    problems : List[str]
+        Describes everything whose docstring could not be resolved statically."""
+
+    def __init__(self, root, store=None):
+        """
+        Parameters
+        ----------
+        root : str
+            The directory from which the project's modules are imported (i.e. an entry of
+            `sys.path`); every .py file beneath it is parsed.
+        store : Optional[custom_inherit._Store]
+            The style store; `custom_inherit.store` by default."""
+        if store is None:
+            from . import store
+
+        self.root = os.path.abspath(root)
+        self.store = store
+        self.modules = OrderedDict()
+        self.problems = []
+        self._reported = set()
+        self._function_docs = {}
+
+        for dir_path, dir_names, file_names in os.walk(self.root):
+            dir_names[:] = sorted(
+                name for name in dir_names if not name.startswith((".", "__pycache__"))
+            )
+            for file_name in sorted(file_names):
+                if not file_name.endswith(".py"):
+                    continue
+                path = os.path.join(dir_path, file_name)
+                parts = os.path.relpath(path, self.root)[:-3].split(os.sep)
+                is_package = parts[-1] == "__init__"
+                if is_package:
+                    parts = parts[:-1]
+                if not parts:
+                    continue
+                name = ".".join(parts)
+                try:
+                    self.modules[name] = StaticModule(name, path, is_package)
+                except SyntaxError as err:
+                    self._problem(path, "cannot be parsed: {}".format(err))
+
+    def _problem(self, where, message):
+        if isinstance(where, StaticClass):
+            where = "{}:{}: {}.{}".format(
+                where.module.path, where.node.lineno, where.module.name, where.qualname
+            )
+        problem = "{}: {}".format(where, message)
+        if problem not in self._reported:
+            self._reported.add(problem)
+            self.problems.append(problem)
+
+    # Resolving names
+
+    def lookup(self, module, dotted, depth=0):
+        """Resolves a dotted name, as it is bound within `module`.
+
+        Returns
+        -------
+        Union[StaticClass, StaticModule, ast.AST, Tuple[StaticModule, str], str, None]
+            A class, a module, an assigned expression, a (module, qualname) function,
+            `_OBJECT`, or None if the name cannot be resolved within the project."""
+        if dotted is None or depth > 20:
+            return None
+        head, _, rest = dotted.partition(".")
+        if head in module.classes:
+            return self._lookup_member(module, head, rest)
+        if head in module.functions and not rest:
+            return module, head
+        if head in module.imports:
+            target = module.imports[head] + ("." + rest if rest else "")
+            return self.lookup_global(target, depth + 1)
+        if head in module.assigns and not rest:
+            value = module.assigns[head]
+            if isinstance(value, (ast.Name, ast.Attribute)):
+                return self.lookup(module, _dotted(value), depth + 1)
+            return value
+        if dotted == "object":
+            return _OBJECT
+        return None
+
+    def _lookup_member(self, module, qualname, rest):
+        for name in rest.split(".") if rest else ():
+            if qualname + "." + name in module.classes:
+                qualname += "." + name
+            elif name in module.classes[qualname].methods:
+                return module, qualname + "." + name
+            else:
+                return None
+        return module.classes[qualname]
+
+    def lookup_global(self, dotted, depth=0):
+        """ Resolves an absolute dotted name within the project."""
+        parts = dotted.split(".")
+        for n in range(len(parts), 0, -1):
+            module = self.modules.get(".".join(parts[:n]))
+            if module is not None:
+                if n == len(parts):
+                    return module
+                return self.lookup(module, ".".join(parts[n:]), depth + 1)
+        return None
+
+    # Resolving classes
+
+    def _meta(self, cls):
+        """Returns the StaticMeta of a class' own metaclass: None if it specifies no metaclass,
+        `_OBJECT` if it specifies another metaclass, and `_MISSING` if the options of
+        DocInheritMeta cannot be evaluated."""
+        node = cls.meta_node
+        if node is None:
+            return None
+        if isinstance(node, (ast.Name, ast.Attribute)):
+            node = self.lookup(cls.module, _dotted(node))
+        if not _is_call_to(node, "DocInheritMeta"):
+            return _OBJECT
+
+        args = _call_args(node, _META_PARAMS)
+        options = dict(style="parent", include_special_methods=False, incremental=False)
+        for name in options:
+            if name in args:
+                options[name] = _literal(args[name])
+                if options[name] is _MISSING:
+                    self._problem(
+                        cls, "DocInheritMeta's {} is not a literal".format(name)
+                    )
+                    return _MISSING
+        try:
+            merge_func = self.store.get_merger(options["style"])
+        except TypeError:
+            self._problem(cls, "{!r} is not a stored style".format(options["style"]))
+            return _MISSING
+        return StaticMeta(merge_func=merge_func, **options)
+
+    def resolve_class(self, cls):
+        """Resolves the mro, the metaclass, and the docstrings of a class.
+
+        Returns
+        -------
+        bool
+            False if these cannot be resolved statically."""
+        if cls.mro is not None:
+            return cls.mro is not _MISSING
+        cls.mro = _MISSING  # guards against cyclic bases
+
+        bases = []
+        for base_node in cls.node.bases:
+            base = self.lookup(cls.module, _dotted(base_node))
+            if base is _OBJECT or (
+                isinstance(base, StaticClass) and self.resolve_class(base)
+            ):
+                bases.append(base)
+            else:
+                self._problem(
+                    cls,
+                    "its base {!r} cannot be resolved statically".format(
+                        _dotted(base_node) or ast.dump(base_node)
+                    ),
+                )
+                return False
+
+        meta = self._meta(cls)
+        if meta is _MISSING:
+            return False
+        if meta is _OBJECT:
+            if any(base is not _OBJECT and base.meta is not None for base in bases):
+                self._problem(cls, "its metaclass cannot be resolved statically")
+                return False
+            meta = None
+        for base in bases:
+            base_meta = base.meta if base is not _OBJECT else None
+            if meta is None:
+                meta = base_meta
+            elif base_meta is not None and base_meta.key() != meta.key():
+                self._problem(cls, "its bases have conflicting metaclasses")
+                return False
+
+        mro = _merge_mros(
+            [base.mro if base is not _OBJECT else [_OBJECT] for base in bases]
+        )
+        if mro is None:
+            self._problem(cls, "its bases do not admit a consistent mro")
+            return False
+
+        cls.mro = [cls] + (mro or [_OBJECT])
+        cls.meta = meta
+        self._resolve_docs(cls)
+        return True
+
+    def _resolve_docs(self, cls):
+        meta = cls.meta
+        prnt_mro = cls.mro[1:]
+        doc = _raw_doc(cls.node)
+        if meta is not None:
+            prnt_docs = [
+                None if mro_cls is _OBJECT else mro_cls.doc
+                for mro_cls in _class_doc_parents(
+                    prnt_mro, meta.incremental, _inherited_mro
+                )
+            ]
+            doc = _fold_docs(meta.merge_func, prnt_docs, doc)
+        cls.doc = doc
+
+        for name, reason in cls.unknown.items():
+            self._problem(cls, "the docstring of {!r} {}".format(name, reason))
+
+        attr_docs = OrderedDict()
+        for name, node in cls.methods.items():
+            doc = self._decorated_doc(cls.module, node)
+            is_special = name.startswith("__") and name.endswith("__")
+            if meta is not None and (meta.include_special_methods or not is_special):
+                for mro_cls in prnt_mro:
+                    if mro_cls is not _OBJECT and name in mro_cls.unknown:
+                        prnt_doc = _MISSING
+                    else:
+                        prnt_doc = (
+                            _attr_docs(object)
+                            if mro_cls is _OBJECT
+                            else mro_cls.attr_docs
+                        ).get(name)
+                    if prnt_doc is _MISSING or doc is _MISSING:
+                        self._problem(
+                            cls,
+                            "{!r} inherits a docstring that cannot be resolved "
+                            "statically".format(name),
+                        )
+                        doc = _MISSING
+                        break
+                    if prnt_doc is not None:
+                        doc = meta.merge_func(prnt_doc, doc)
+                        break
+            attr_docs[name] = doc
+        cls.attr_docs = attr_docs
+
+    # Resolving functions
+
+    def _decorated_doc(self, module, node):
+        """ Returns the docstring of a function, once it is decorated by `doc_inherit`."""
+        doc = _raw_doc(node)
+        # decorators are applied from the innermost (the last) outwards
+        for decorator in reversed(node.decorator_list):
+            if not _is_call_to(decorator, "doc_inherit"):
+                continue
+            args = _call_args(decorator, ("parent", "style"))
+            style = _literal(args["style"]) if "style" in args else "parent"
+            parent = _literal(args["parent"]) if "parent" in args else _MISSING
+            if parent is _MISSING and "parent" in args:
+                parent = self._doc_of(module, args["parent"])
+            if parent is _MISSING or style is _MISSING:
+                self._problem(
+                    "{}:{}".format(module.path, node.lineno),
+                    "the arguments of doc_inherit cannot be evaluated",
+                )
+                continue
+            try:
+                doc = self.store.get_merger(style)(parent, doc)
+            except TypeError:
+                self._problem(
+                    "{}:{}".format(module.path, node.lineno),
+                    "{!r} is not a stored style".format(style),
+                )
+        return doc
+
+    def _doc_of(self, module, node):
+        """ Returns the (resolved) docstring of the object that an expression refers to."""
+        target = self.lookup(module, _dotted(node))
+        if isinstance(target, StaticClass):
+            return target.doc if self.resolve_class(target) else _MISSING
+        if isinstance(target, tuple):
+            return self.function_doc(*target)
+        return _MISSING
+
+    def function_doc(self, module, qualname):
+        """Returns the resolved docstring of a function or method.
+
+        Returns
+        -------
+        Union[Optional[str], object]
+            `_MISSING` if it cannot be resolved statically."""
+        cls_name, _, name = qualname.rpartition(".")
+        if cls_name:
+            cls = module.classes[cls_name]
+            return cls.attr_docs[name] if self.resolve_class(cls) else _MISSING
+
+        key = (module.name, qualname)
+        if key not in self._function_docs:
+            self._function_docs[key] = _MISSING  # guards against cyclic references
+            self._function_docs[key] = self._decorated_doc(
+                module, module.functions[qualname]
+            )
+        return self._function_docs[key]
+
+    def resolve(self):
+        """Resolves every class and function of the project.
+
+        Returns
+        -------
+        Generator[Tuple[StaticModule, ast.AST, Optional[str]], None, None]
+            Each class or function definition whose docstring is inherited, along with its
+            module and its resolved docstring."""
+        for module in self.modules.values():
+            for qualname, node in module.functions.items():
+                doc = self.function_doc(module, qualname)
+                if doc is not _MISSING:
+                    yield module, node, doc
+            for cls in module.classes.values():
+                if not self.resolve_class(cls):
+                    continue
+                yield module, cls.node, cls.doc
+                for name, node in cls.methods.items():
+                    if cls.attr_docs[name] is not _MISSING:
+                        yield module, node, cls.attr_docs[name]
+
+
+def _inherited_mro(mro_cls):
+    # the static counterpart of `custom_inherit._metaclass_base._inherited_mro`
+    if mro_cls is not _OBJECT and mro_cls.meta is not None:
+        return mro_cls.mro[1:]
+    return None
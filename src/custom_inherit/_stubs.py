@@ -0,0 +1,294 @@
+from __future__ import absolute_import
+
+import ast
+import copy
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+from ._static import _FUNCTION_DEFS, _MISSING, StaticProject, _raw_doc
+
+""" Exposes the generation of type stubs (.pyi files) that carry a project's inherited docstrings.
+
+    The docstrings are resolved statically (see custom_inherit/_static.py), so that IDEs and
+    language servers can read the merged docstrings from the stubs, without importing - and thus
+    without merging the docstrings of - the project's modules.
+
+    A manifest of the generated stubs records, for each module, a hash of the sources that its
+    docstrings are resolved from: the module itself, along with the project's modules that it
+    imports, transitively. Only the stubs of the modules whose hash has changed are regenerated."""
+
+__all__ = ["generate_stubs"]
+
+MANIFEST = ".custom_inherit_stubs.json"
+
+
+def _hash_source(source):
+    return hashlib.sha1(source).hexdigest()
+
+
+def _doc_node(doc, depth):
+    """ Returns the docstring statement of a body, indented `depth` levels deep."""
+    indent = "    " * depth
+    lines = inspect.cleandoc(doc).split("\n")
+    lines[1:] = [indent + line if line.strip() else "" for line in lines[1:]]
+    if len(lines) > 1:
+        lines[-1] = lines[-1] or indent
+    return ast.Expr(ast.Constant("\n".join(lines)))
+
+
+def _body(doc, stmts, depth):
+    body = [] if doc is None else [_doc_node(doc, depth)]
+    body.extend(stmts)
+    return body or [ast.Expr(ast.Constant(Ellipsis))]
+
+
+def _declaration(stmt, keep_value=False):
+    """ Returns the stub declarations of the names bound by an assignment."""
+    if keep_value:
+        return [stmt]
+    if isinstance(stmt, ast.AnnAssign):
+        stub = copy.copy(stmt)
+        stub.value = None
+        return [stub]
+    if isinstance(stmt, ast.AugAssign):
+        return []  # the name is declared where it is first bound
+    return [
+        ast.AnnAssign(
+            target=ast.Name(target.id, ast.Store()),
+            annotation=ast.Name("Any", ast.Load()),
+            value=None,
+            simple=1,
+        )
+        for target in stmt.targets
+        if isinstance(target, ast.Name)
+    ]
+
+
+# the compound statements whose blocks are kept in a stub, e.g. `try: ... except ImportError: ...`
+_BLOCKS = (ast.If, ast.Try) + ((ast.TryStar,) if hasattr(ast, "TryStar") else ())
+
+
+class _ModuleStub(object):
+    """ Builds the stub of a module, carrying the resolved docstrings of its classes and functions."""
+
+    def __init__(self, project, module):
+        self.project = project
+        self.module = module
+
+    def function(self, node, static_cls, depth):
+        # only the definitions that the static resolver collected carry a resolved docstring;
+        # those bound within a block, or rebound later on, keep their own
+        doc = _MISSING
+        if static_cls is not None:
+            if static_cls.methods.get(node.name) is node:
+                doc = static_cls.attr_docs.get(node.name, _MISSING)
+        elif self.module.functions.get(node.name) is node:
+            doc = self.project.function_doc(self.module, node.name)
+
+        stub = copy.copy(node)
+        stub.body = _body(_raw_doc(node) if doc is _MISSING else doc, [], depth + 1)
+        return stub
+
+    def cls(self, node, qualname, depth):
+        static_cls = self.module.classes.get(qualname)
+        if static_cls is None or static_cls.node is not node:
+            static_cls = None  # e.g. a class defined within an `if` block
+        elif not self.project.resolve_class(static_cls):
+            static_cls = None
+
+        stub = copy.copy(node)
+        stub.body = _body(
+            _raw_doc(node) if static_cls is None else static_cls.doc,
+            self.block(node.body, depth + 1, qualname, static_cls),
+            depth + 1,
+        )
+        return stub
+
+    def block(self, stmts, depth, qualname=None, static_cls=None):
+        """Returns the stubs of the statements of a module's, or of a class', body.
+
+        Parameters
+        ----------
+        stmts : List[ast.stmt]
+        depth : int
+            The indentation level of the statements.
+        qualname : Optional[str]
+            The qualified name of the class whose body this is; None for a module's body.
+        static_cls : Optional[StaticClass]
+            The class whose body this is, if its docstrings were resolved.
+
+        Returns
+        -------
+        List[ast.stmt]"""
+        stubs = []
+        for stmt in stmts:
+            if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                stubs.append(stmt)
+            elif isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+                # the names of a module are kept as they are bound, those of a class are declared
+                stubs.extend(_declaration(stmt, keep_value=qualname is None))
+            elif isinstance(stmt, ast.ClassDef):
+                name = stmt.name if qualname is None else qualname + "." + stmt.name
+                stubs.append(self.cls(stmt, name, depth))
+            elif isinstance(stmt, _FUNCTION_DEFS):
+                stubs.append(self.function(stmt, static_cls, depth))
+            elif isinstance(stmt, _BLOCKS):
+                stub = copy.copy(stmt)
+                for field in ("body", "orelse", "finalbody"):
+                    body = getattr(stmt, field, None)
+                    if body:
+                        setattr(stub, field, self._sub_block(body, depth, qualname))
+                if getattr(stmt, "handlers", None):
+                    stub.handlers = []
+                    for handler in stmt.handlers:
+                        handler = copy.copy(handler)
+                        handler.body = self._sub_block(handler.body, depth, qualname)
+                        stub.handlers.append(handler)
+                stubs.append(stub)
+        return stubs
+
+    def _sub_block(self, stmts, depth, qualname):
+        # the definitions within a block are bound conditionally, and thus keep their own docstrings
+        return self.block(stmts, depth + 1, qualname) or [
+            ast.Expr(ast.Constant(Ellipsis))
+        ]
+
+    def build(self):
+        """Returns the source of the stub.
+
+        Returns
+        -------
+        str"""
+        tree = self.module.tree
+        stmts = self.block(tree.body, 0)
+        source = ast.unparse(ast.Module(body=stmts, type_ignores=[]))
+        if "Any" not in self.module.imports and any(
+            isinstance(node, ast.Name) and node.id == "Any"
+            for node in ast.walk(ast.Module(body=stmts, type_ignores=[]))
+        ):
+            source = "from typing import Any\n" + source
+
+        doc = ast.get_docstring(tree, clean=False)
+        if doc is not None:
+            source = ast.unparse(_doc_node(doc, 0)) + "\n" + source
+        return source + "\n"
+
+
+def _dependencies(project, module):
+    """ Returns the names of the project's modules that `module` imports, transitively."""
+    deps = set()
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        if current.name in deps:
+            continue
+        deps.add(current.name)
+        for dotted in current.imports.values():
+            parts = dotted.split(".")
+            for n in range(len(parts), 0, -1):
+                dep = project.modules.get(".".join(parts[:n]))
+                if dep is not None:
+                    pending.append(dep)
+                    break
+    return sorted(deps)
+
+
+def _stub_path(output, module):
+    parts = module.name.split(".")
+    if module.is_package:
+        parts.append("__init__")
+    return os.path.join(output, *parts) + ".pyi"
+
+
+def generate_stubs(root, output, force=False):
+    """Writes a type stub (.pyi file), carrying the docstrings that custom_inherit would
+    resolve upon import, for each module of a project.
+
+    Parameters
+    ----------
+    root : str
+        The directory from which the project's modules are imported (i.e. an entry of `sys.path`).
+    output : str
+        The directory into which the stubs are written. It must not be `root`: a stub beside its
+        module would take precedence over the module's own annotations, and would be packaged
+        along with it.
+    force : bool, optional (default: False)
+        If True, every stub is regenerated, instead of only those whose module, or whose
+        imported modules, have changed since the stubs were last generated.
+
+    Returns
+    -------
+    Tuple[List[str], List[str]]
+        The paths of the stubs that were (re)generated, and a description of each hierarchy or
+        function whose docstrings could not be resolved statically."""
+    if sys.version_info < (3, 9):
+        raise RuntimeError("Generating stubs requires Python 3.9 or later")
+
+    from . import __version__
+
+    project = StaticProject(root)
+    output = os.path.abspath(output)
+    if output == project.root:
+        raise ValueError(
+            "The stubs must be written into a directory other than the project's: {}".format(
+                output
+            )
+        )
+    manifest_path = os.path.join(output, MANIFEST)
+
+    manifest = {}
+    if os.path.isfile(manifest_path):
+        with open(manifest_path) as f:
+            try:
+                manifest = json.load(f)
+            except ValueError:
+                manifest = {}
+    if manifest.get("custom_inherit_version") != __version__:
+        manifest = {}
+    old_keys = manifest.get("modules", {})
+
+    hashes = {
+        name: _hash_source(module.source) for name, module in project.modules.items()
+    }
+    keys = {}
+    written = []
+    for name, module in project.modules.items():
+        sha = hashlib.sha1()
+        for dep in _dependencies(project, module):
+            sha.update("{}:{}\n".format(dep, hashes[dep]).encode("utf-8"))
+        keys[name] = sha.hexdigest()
+
+        path = _stub_path(output, module)
+        if not force and old_keys.get(name) == keys[name] and os.path.isfile(path):
+            continue
+
+        source = _ModuleStub(project, module).build()
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "w") as f:
+            f.write(source)
+        written.append(path)
+
+    # remove the stubs of the modules that no longer exist
+    for name in set(old_keys) - set(keys):
+        parts = name.split(".")
+        for path in (
+            os.path.join(output, *parts) + ".pyi",
+            os.path.join(output, *(parts + ["__init__"])) + ".pyi",
+        ):
+            if os.path.isfile(path):
+                os.remove(path)
+
+    if not os.path.isdir(output):
+        os.makedirs(output)
+    with open(manifest_path, "w") as f:
+        json.dump(
+            {"custom_inherit_version": __version__, "modules": keys},
+            f,
+            indent=1,
+            sort_keys=True,
+        )
+    return written, project.problems
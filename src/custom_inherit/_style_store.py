@@ -1,11 +1,6 @@
 from __future__ import absolute_import
 
-from ._doc_parse_tools import (
-    merge_google_napoleon_docs,
-    merge_numpy_docs,
-    merge_numpy_napoleon_docs,
-    merge_rest_docs,
-)
+from ._doc_parse_tools import load
 
 """ Docstring inheritance-style implementations.
 
@@ -28,6 +23,9 @@ from ._doc_parse_tools import (
     and log this using `custom_inherit.add_style(your_style)`. To permanently save your function,
     define your function within custom_inherit/_style_store.py, and log it in custom_inherit.style_store.__all__.
     Your style will then be available as 'your_style' (i.e. whatever you named the function).
+
+    The parse tools of the built-in styles are imported upon a style's first merge, rather than
+    upon importing custom_inherit.
 """
 
 # All built-in styles must be logged in the __all__ field.
@@ -114,7 +112,7 @@ def numpy(prnt_doc, child_doc):
                 Notes
                 -----
                 notes blah blah'''"""
-    return merge_numpy_docs(prnt_doc, child_doc)
+    return load("merge_numpy_docs")(prnt_doc, child_doc)
 
 
 def reST(prnt_doc, child_doc):
@@ -165,7 +163,7 @@ def reST(prnt_doc, child_doc):
                    ~~~~~~~~~
                    content for NewHeader '''
     """
-    return merge_rest_docs(prnt_doc, child_doc)
+    return load("merge_rest_docs")(prnt_doc, child_doc)
 
 
 def numpy_napoleon(prnt_doc, child_doc):
@@ -222,7 +220,7 @@ def numpy_napoleon(prnt_doc, child_doc):
                 -----
                 notes blah blah'''
     """
-    return merge_numpy_napoleon_docs(prnt_doc, child_doc)
+    return load("merge_numpy_napoleon_docs")(prnt_doc, child_doc)
 
 
 def google(prnt_doc, child_doc):
@@ -285,7 +283,7 @@ def google(prnt_doc, child_doc):
                 Notes:
                     notes blah blah'''
     """
-    return merge_google_napoleon_docs(prnt_doc, child_doc)
+    return load("merge_google_napoleon_docs")(prnt_doc, child_doc)
 
 
 def google_with_merge(prnt_doc, child_doc):
@@ -351,7 +349,9 @@ def google_with_merge(prnt_doc, child_doc):
                 Notes:
                     notes blah blah'''
     """
-    return merge_google_napoleon_docs(prnt_doc, child_doc, merge_within_sections=True)
+    return load("merge_google_napoleon_docs")(
+        prnt_doc, child_doc, merge_within_sections=True
+    )
 
 
 def numpy_napoleon_with_merge(prnt_doc, child_doc):
@@ -430,7 +430,9 @@ def numpy_napoleon_with_merge(prnt_doc, child_doc):
                 >>> child_func(x=3, y=None, z=4)
                 7'''
     """
-    return merge_numpy_napoleon_docs(prnt_doc, child_doc, merge_within_sections=True)
+    return load("merge_numpy_napoleon_docs")(
+        prnt_doc, child_doc, merge_within_sections=True
+    )
 
 
 def numpy_with_merge(prnt_doc, child_doc):
@@ -511,4 +513,4 @@ def numpy_with_merge(prnt_doc, child_doc):
                 >>> child_func(x=3, y=None, z=4)
                 7'''
     """
-    return merge_numpy_docs(prnt_doc, child_doc, merge_within_sections=True)
+    return load("merge_numpy_docs")(prnt_doc, child_doc, merge_within_sections=True)
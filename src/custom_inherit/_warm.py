@@ -0,0 +1,214 @@
+from __future__ import absolute_import
+
+import gc
+import sys
+import threading
+import time
+from collections import namedtuple
+from types import ModuleType
+
+from . import _cache, _metaclass_base
+from ._metaclass_base import DocInheritorBase, _resolve_pending
+
+""" Exposes the warm-up of doc-inheriting classes, e.g. before a pre-fork server forks.
+
+    A worker process that resolves a pending (lazy) docstring, or that reorders a cache upon a
+    lookup, writes to pages of memory that it shares with its parent; the pages are then copied.
+    Warming classes up in the parent process, before it forks, leaves nothing to be written.
+
+    Alternatively, the pending docstrings of all lazy classes can be resolved by a background
+    thread, which moves the cost of merging them off of an application's startup."""
+
+__all__ = ["BackgroundWarmer", "WarmInfo", "warm", "warm_in_background"]
+
+WarmInfo = namedtuple("WarmInfo", ["classes", "resolved"])
+
+
+def _module_classes(module):
+    """ Yields the classes defined in a module, and in its submodules that are already imported."""
+    prefix = module.__name__ + "."
+    modules = [module] + [
+        mod
+        for name, mod in sorted(sys.modules.items())
+        if name.startswith(prefix) and isinstance(mod, ModuleType)
+    ]
+    for mod in modules:
+        for obj in list(vars(mod).values()):
+            if isinstance(obj, type) and obj.__module__ == mod.__name__:
+                yield obj
+
+
+def _doc_inheriting_classes(cls, seen):
+    """ Yields a class, if it is created by a doc-inheriting metaclass, and its nested classes."""
+    if cls in seen:
+        return
+    seen.add(cls)
+    if isinstance(cls, DocInheritorBase):
+        yield cls
+    for obj in list(vars(cls).values()):
+        if isinstance(obj, type) and obj.__module__ == cls.__module__:
+            for nested in _doc_inheriting_classes(obj, seen):
+                yield nested
+
+
+def warm(targets, freeze_gc=False):
+    """Resolves every pending docstring of the doc-inheriting classes among `targets`, and
+    freezes the caches of parsed and merged docstrings (see `custom_inherit.parse_cache.freeze`).
+
+    Call this in the master process of a pre-fork server (e.g. gunicorn, uWSGI), once the
+    application is imported and before the workers are forked, so that the workers share -
+    rather than copy - the memory that holds the docstrings and the caches.
+
+    Parameters
+    ----------
+    targets : Union[ModuleType, type, Iterable[Union[ModuleType, type]]]
+        Modules, whose classes (and the classes of their already-imported submodules) are
+        warmed up, and classes, which are warmed up along with their nested classes.
+
+    freeze_gc : bool, optional (default: False)
+        If True, `gc.freeze()` (Python 3.7+) moves every object that is tracked by the garbage
+        collector into a permanent generation, which the collector of a worker leaves untouched.
+
+    Returns
+    -------
+    WarmInfo
+        The number of doc-inheriting classes that were visited, and the number of pending
+        docstrings that were resolved."""
+    if isinstance(targets, (ModuleType, type)):
+        targets = [targets]
+
+    seen = set()
+    classes = resolved = 0
+    for target in targets:
+        if isinstance(target, ModuleType):
+            candidates = _module_classes(target)
+        elif isinstance(target, type):
+            candidates = [target]
+        else:
+            raise TypeError(
+                "`targets` must be modules or classes, got: {!r}".format(target)
+            )
+        for candidate in candidates:
+            for cls in _doc_inheriting_classes(candidate, seen):
+                classes += 1
+                resolved += _resolve_pending(cls)
+
+    _cache.parse_cache.freeze()
+    _cache.merge_cache.freeze()
+    if _cache.disk_cache is not None:
+        # writes buffered by the master process are dropped by its workers
+        _cache.disk_cache.flush()
+
+    if freeze_gc and hasattr(gc, "freeze"):
+        gc.collect()
+        gc.freeze()
+    return WarmInfo(classes, resolved)
+
+
+class BackgroundWarmer(object):
+    """A handle on the daemon thread, started by `custom_inherit.warm_in_background`, that
+    resolves the pending docstrings of the classes created by lazy doc-inheriting metaclasses.
+
+    Attributes
+    ----------
+    classes : int
+        The number of classes that the thread has visited so far.
+    resolved : int
+        The number of pending docstrings that the thread has resolved so far."""
+
+    def __init__(self, time_slice=0.002, pause=0.002):
+        """
+        Parameters
+        ----------
+        time_slice : float, optional (default: 0.002)
+            The number of seconds for which the thread resolves docstrings at a time.
+        pause : float, optional (default: 0.002)
+            The number of seconds for which the thread then sleeps, releasing the GIL."""
+        self.time_slice = time_slice
+        self.pause = pause
+        self.classes = 0
+        self.resolved = 0
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="custom_inherit-warmer")
+        self._thread.daemon = True
+
+    def __repr__(self):
+        return "{}(classes={}, resolved={}, pending={}, done={})".format(
+            type(self).__name__, self.classes, self.resolved, self.pending, self.done
+        )
+
+    @property
+    def pending(self):
+        """ The number of lazy classes that are still to be visited."""
+        return len(_metaclass_base._lazy_classes)
+
+    @property
+    def done(self):
+        """ Whether the thread has stopped: it ran out of classes to visit, or was cancelled."""
+        return self._thread.ident is not None and not self._thread.is_alive()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """ Stop the thread once it has resolved the docstrings of the class at hand."""
+        self._cancelled.set()
+
+    def wait(self, timeout=None):
+        """Wait for the thread to stop.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            The maximum number of seconds to wait.
+
+        Returns
+        -------
+        bool
+            True if the thread has stopped."""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self):
+        lazy_classes = _metaclass_base._lazy_classes
+        timer = getattr(time, "perf_counter", time.time)
+        while not self._cancelled.is_set():
+            deadline = timer() + self.time_slice
+            while timer() < deadline:
+                try:
+                    cls = lazy_classes.popleft()()
+                except IndexError:
+                    return
+                if cls is not None:
+                    self.resolved += _resolve_pending(cls)
+                    self.classes += 1
+                if self._cancelled.is_set():
+                    return
+            self._cancelled.wait(self.pause)
+
+
+def warm_in_background(time_slice=0.002, pause=0.002):
+    """Starts a daemon thread that resolves the pending docstrings of every class created by
+    a lazy doc-inheriting metaclass (see `DocInheritMeta(lazy=True)`): those pending when it
+    starts, plus those created before it first runs out of classes to visit, at which point it
+    stops; call it again to warm the classes created afterwards. It works in time slices,
+    between which it sleeps, so as to leave the GIL to the application's own threads for most
+    of the time.
+
+    The docstrings are resolved exactly as they would be upon first access; thus `help()` and
+    other introspection are unaffected, other than becoming quick.
+
+    Parameters
+    ----------
+    time_slice : float, optional (default: 0.002)
+        The number of seconds for which the thread resolves docstrings at a time.
+    pause : float, optional (default: 0.002)
+        The number of seconds for which the thread then sleeps.
+
+    Returns
+    -------
+    BackgroundWarmer
+        A handle with which the thread can be waited on (`wait()`) or cancelled (`cancel()`),
+        and that reports its progress (`classes`, `resolved`, `pending`)."""
+    return BackgroundWarmer(time_slice=time_slice, pause=pause).start()
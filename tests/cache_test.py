@@ -0,0 +1,120 @@
+""" Tests behavior of custom_inherit._cache """
+
+from pytest import raises
+
+import custom_inherit
+from custom_inherit._cache import BoundedCache, ReadOnlyDict
+from custom_inherit._doc_parse_tools.napoleon_parse_tools import parse_napoleon_doc
+from custom_inherit._doc_parse_tools.numpy_parse_tools import parse_numpy_doc
+from custom_inherit._doc_parse_tools.rest_parse_tools import parse_rest_doc
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    cache = BoundedCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used entry
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.get("b", "missing") == "missing"
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (3, 1, 2, 2)
+
+    cache.maxsize = 1
+    assert len(cache) == 1 and "c" in cache
+
+    cache.clear()
+    assert cache.info() == (0, 0, 1, 0)
+
+    with raises(ValueError):
+        BoundedCache(maxsize=-1)
+
+
+def test_parse_cache():
+    doc = """Summary.
+
+    Parameters
+    ----------
+    x : int
+    y : float"""
+    assert custom_inherit.parse_cache is custom_inherit._cache.parse_cache
+    custom_inherit.parse_cache.clear()
+
+    first = parse_numpy_doc(doc)
+    assert custom_inherit.parse_cache.info().misses == 1
+    assert parse_numpy_doc(doc) is first
+    assert custom_inherit.parse_cache.info().hits == 1
+
+    # the same text parsed under a different style is cached separately
+    assert parse_napoleon_doc(doc, "numpy") is not first
+    assert parse_napoleon_doc(doc, "google") is not parse_napoleon_doc(doc, "numpy")
+    assert parse_rest_doc(doc) is parse_rest_doc(doc)
+
+    custom_inherit.parse_cache.clear()
+    assert parse_numpy_doc(doc) is not first
+    assert parse_numpy_doc(doc) == first
+
+
+def test_parsed_sections_are_read_only():
+    sections = parse_numpy_doc("Summary.\n\nParameters\n----------\nx : int")
+    assert isinstance(sections, ReadOnlyDict)
+    assert isinstance(sections["Parameters"], ReadOnlyDict)
+    assert list(sections["Parameters"].items()) == [("x", " : int")]
+
+    with raises(TypeError):
+        sections["Short Summary"] = None
+
+    with raises(TypeError):
+        sections["Parameters"]["y"] = ""
+
+    assert isinstance(parse_rest_doc("text"), ReadOnlyDict)
+
+
+def test_merges_do_not_corrupt_cached_sections():
+    prnt = "Parameters\n----------\nx : int\n\nRaises\n------\nValueError"
+    child = "Returns\n-------\nint"
+
+    for style in ("numpy", "numpy_with_merge", "numpy_napoleon"):
+        merge = custom_inherit.store[style]
+        out = merge(prnt, child)
+        assert "Raises" not in out
+        assert merge(prnt, child) == out
+        assert "Raises" in merge(prnt, None)
+
+    rest_prnt = "Header\n------\nparent"
+    rest_child = "child"
+    out = custom_inherit.store["reST"](rest_prnt, rest_child)
+    assert custom_inherit.store["reST"](rest_prnt, rest_child) == out
+    assert custom_inherit.store["reST"](rest_prnt, None) == "Header\n------\nparent"
+
+
+def test_bounded_cache_fifo_policy():
+    cache = BoundedCache(maxsize=2, policy="fifo")
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # lookups do not affect the order of eviction
+    cache.put("c", 3)
+    assert "a" not in cache
+    assert "b" in cache and "c" in cache
+
+    cache.policy = "lru"
+    assert cache.policy == "lru"
+
+    with raises(ValueError):
+        cache.policy = "random"
+
+
+def test_merge_cache():
+    prnt = "Parameters\n----------\nx : int"
+    child = "Returns\n-------\nint"
+    merger = custom_inherit.store.get_merger("numpy")
+    assert merger is not custom_inherit.store["numpy"]
+
+    custom_inherit.merge_cache.clear()
+    out = merger(prnt, child)
+    assert out == custom_inherit.store["numpy"](prnt, child)
+    assert merger(prnt, child) == out
+    assert custom_inherit.merge_cache.info()[:2] == (1, 1)
@@ -0,0 +1,179 @@
+""" Tests `python -m custom_inherit compile` """
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import custom_inherit
+
+BASE = '''
+from custom_inherit import DocInheritMeta, doc_inherit
+from six import add_metaclass
+
+
+@add_metaclass(DocInheritMeta(style="numpy"))
+class Base(object):
+    """Base.
+
+    Parameters
+    ----------
+    x : int"""
+
+    def method(self):
+        """Method.
+
+        Returns
+        -------
+        int"""
+
+    @property
+    def prop(self):
+        """Prop.
+
+        Returns
+        -------
+        int"""
+
+
+def parent():
+    """Parent.
+
+    Returns
+    -------
+    int"""
+'''
+
+CHILD = '''
+from custom_inherit import doc_inherit
+
+from .base import Base, parent
+
+
+class Child(Base):
+    """Parameters
+    ----------
+    y : int"""
+
+    def method(self):
+        """Parameters
+        ----------
+        a : int"""
+
+    @property
+    def prop(self):
+        pass
+
+
+@doc_inherit(parent, style="numpy")
+def child():
+    """Parameters
+    ----------
+    b : int"""
+'''
+
+REPORT = """
+import json
+import custom_inherit
+misses = custom_inherit.parse_cache.info().misses
+from pkg.child import Child, child
+
+print(json.dumps(dict(
+    docs=[Child.__doc__, Child.method.__doc__, Child.prop.__doc__, child.__doc__],
+    misses=custom_inherit.parse_cache.info().misses - misses,
+)))
+"""
+
+
+def _run(tmp_path, *args):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(tmp_path), os.path.dirname(os.path.dirname(custom_inherit.__file__))]
+    )
+    return subprocess.check_output([sys.executable] + list(args), env=env).decode()
+
+
+def test_compiled_docstrings_are_used(tmp_path):
+    import json
+
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text(u"")
+    (pkg / "base.py").write_text(textwrap.dedent(BASE))
+    (pkg / "child.py").write_text(textwrap.dedent(CHILD))
+
+    dynamic = json.loads(_run(tmp_path, "-c", REPORT))
+    assert dynamic["misses"] > 0
+
+    out = _run(tmp_path, "-m", "custom_inherit", "compile", "pkg")
+    assert "_custom_inherit_docs.py" in out
+    assert (pkg / "_custom_inherit_docs.py").exists()
+
+    compiled = json.loads(_run(tmp_path, "-c", REPORT))
+    assert compiled["docs"] == dynamic["docs"]
+    assert compiled["misses"] == 0  # nothing is parsed
+
+    # a change to any source of the package reverts to resolving docstrings dynamically
+    with (pkg / "base.py").open("a") as f:
+        f.write(u"\n# changed\n")
+    stale = json.loads(_run(tmp_path, "-c", REPORT))
+    assert stale["docs"] == dynamic["docs"]
+    assert stale["misses"] > 0
+
+
+EXTERNAL = '''
+class External(object):
+    """External.
+
+    Notes
+    -----
+    {}"""
+'''
+
+EXT_CHILD = '''
+from six import add_metaclass
+
+from custom_inherit import DocInheritMeta
+from ext import External
+
+
+@add_metaclass(DocInheritMeta(style="numpy"))
+class Child(External):
+    """Parameters
+    ----------
+    y : int"""
+'''
+
+
+def test_changes_to_external_bases_invalidate(tmp_path):
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text(u"")
+    (pkg / "child.py").write_text(textwrap.dedent(EXT_CHILD))
+    (tmp_path / "ext.py").write_text(textwrap.dedent(EXTERNAL).format("Before."))
+    report = "from pkg.child import Child; print(Child.__doc__)"
+
+    _run(tmp_path, "-m", "custom_inherit", "compile", "pkg")
+    assert "'ext': " in (pkg / "_custom_inherit_docs.py").read_text()
+    assert "Before." in _run(tmp_path, "-c", report)
+
+    # the sources of the package are unchanged, but those of its base are not
+    (tmp_path / "ext.py").write_text(textwrap.dedent(EXTERNAL).format("Since changed."))
+    assert "Since changed." in _run(tmp_path, "-c", report)
+
+
+def test_missing_sidecars_are_looked_up_once(monkeypatch):
+    from custom_inherit import _sidecar
+
+    loads = []
+
+    def load(package):
+        loads.append(package)
+        return None
+
+    monkeypatch.setattr(_sidecar, "_load", load)
+    monkeypatch.setattr(_sidecar, "_sidecars", {})
+    assert _sidecar.compiled_docs("no_sidecar.module") is None
+    assert _sidecar.compiled_docs("no_sidecar.other") is None
+    assert loads == ["no_sidecar"]
+    assert _sidecar._sidecars == {"no_sidecar": None}
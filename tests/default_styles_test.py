@@ -1,4 +1,7 @@
+import pytest
+
 import custom_inherit
+from custom_inherit._doc_parse_tools.rest_parse_tools import parse_rest_doc
 
 
 def test_parent():
@@ -127,6 +130,27 @@ def test_reST():
     assert custom_inherit.store["reST"](prnt2.__doc__, child2.__doc__) == reST_out
 
 
+def test_reST_section_titles():
+    # an overlined title; an underline that is too short; an underline that cannot be a title
+    prnt = "Front\n\n=====\nTitle\n=====\nbody\n\nShort\n---\nnot a section\n\nA\n-\n-\nB\n--"
+    sections = parse_rest_doc(prnt)
+    assert [(key, x.header, x.body) for key, x in sections.items()] == [
+        ("", "", "Front"),
+        ("Title", "=====\nTitle\n=====", "body\n\nShort\n---\nnot a section"),
+        ("A", "A\n-", "-"),
+        ("B", "B\n--", ""),
+    ]
+
+    child = "Title\n=====\nchild\n\nA\n=\nchild's A"
+    assert custom_inherit.store["reST"](prnt, child) == (
+        "Front\n\nTitle\n=====\nchild\n\nA\n=\nchild's A\n\nB\n--\n"
+    )
+    assert (
+        custom_inherit.store["reST"]("Front\r\nT\r\n---\r\n  body  \r\n", None)
+        == "Front\n\nT\n---\n  body"
+    )
+
+
 def test_numpy_napoleon():
     def prnt():
         """Parent's short summary
@@ -647,3 +671,53 @@ def test_numpy_napoleon_with_merge():
         custom_inherit.store["numpy_napoleon_with_merge"](prnt.__doc__, child.__doc__)
         == out
     )
+
+
+def test_numpy_header_requires_underline():
+    # a section's name, on a line of its own, is a header only if it is underlined
+    prnt = "Summary.\n\nReturns\nint, the parent's value\n\nNotes\n=====\nnote"
+    child = "Returns\n-------\nfloat"
+    out = "Summary.\n\nReturns\nint, the parent's value\n\nReturns\n-------\nfloat\n\nNotes\n-----\nnote"
+    assert custom_inherit.store["numpy"](prnt, child) == out
+    assert custom_inherit.store["numpy_napoleon"](prnt, child) == out
+
+
+def test_headers_of_docstrings_with_other_line_boundaries():
+    prnt = "Summary.\r\n\r\nParameters  \r\n----------\r\nx : int\r\n\r\nReturns\r\n-------\r\nint"
+    child = "Parameters\n----------\ny : int"
+    out = "Summary.\n\nParameters\n----------\ny : int\n\nReturns\n-------\nint"
+    assert custom_inherit.store["numpy"](prnt, child) == out
+    assert custom_inherit.store["numpy_napoleon"](prnt, child) == out
+
+    prnt = "Summary.\r\n\r\nArgs:\r\n    x (int)\r\n\r\nReturns:  \r\n    int"
+    child = "Args:\n    y (int)"
+    out = "Summary.\n\nParameters:\n    y (int)\n\nReturns:\n    int"
+    assert custom_inherit.store["google"](prnt, child) == out
+
+
+@pytest.mark.parametrize(
+    "style, prnt_doc",
+    [
+        ("numpy", "A.\n\n    Parameters\n    ----------\n    x : int\n        The x."),
+        ("numpy_with_merge", "A.\n\n    Parameters\n    ----------\n    x : int"),
+        ("numpy_napoleon", "A.\n\n    Returns\n    -------\n    int"),
+        ("google", "A.\n\n    Args:\n        x (int): The x.\n            More."),
+        ("google_with_merge", "A.\n\n    Args:\n        x (int): The x."),
+        ("reST", "A.\n\n    Header\n    ------\n    content\n        - indented"),
+    ],
+)
+def test_deep_hierarchies_match_successive_merges(style, prnt_doc):
+    # the docstrings along the mro are merged successively: re-parsing a merged docstring
+    # normalizes its whitespace (e.g. the trailing indentation of a docstring whose closing
+    # quotes are on their own line)
+    merge = custom_inherit.store[style]
+
+    Meta = custom_inherit.DocInheritMeta(style=style)
+    A = Meta("A", (object,), {"__doc__": prnt_doc})
+    B = Meta("B", (A,), {"__doc__": "B.\n    "})
+    C = Meta("C", (B,), {"__doc__": "C.\n    "})
+
+    expected = "C.\n    "
+    for doc in ("B.\n    ", prnt_doc, None):  # the docstrings of B, A and object
+        expected = merge(doc, expected)
+    assert C.__doc__ == expected
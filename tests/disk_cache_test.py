@@ -0,0 +1,213 @@
+""" Tests behavior of custom_inherit._disk_cache """
+
+import gc
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import weakref
+
+import pytest
+
+import custom_inherit
+from custom_inherit._disk_cache import DiskCache, style_fingerprint
+
+calls = []
+
+
+def counting_style(prnt_doc, child_doc):
+    calls.append((prnt_doc, child_doc))
+    return "{}|{}".format(prnt_doc, child_doc)
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    custom_inherit.add_style("disk_cached", counting_style)
+    cache = custom_inherit.enable_disk_cache(str(tmp_path / "docs.sqlite3"))
+    custom_inherit.merge_cache.clear()
+    del calls[:]
+    yield cache
+    custom_inherit.disable_disk_cache()
+    custom_inherit.remove_style("disk_cached")
+    custom_inherit.merge_cache.clear()
+
+
+def test_merges_are_persisted(disk_cache):
+    merge = custom_inherit.store.get_merger("disk_cached")
+    assert merge("parent", "child") == "parent|child"
+    assert calls == [("parent", "child")]
+
+    # a new process: nothing is cached in memory, and a new connection is made
+    custom_inherit.merge_cache.clear()
+    custom_inherit.enable_disk_cache(disk_cache.path)
+    assert merge("parent", "child") == "parent|child"
+    assert merge(None, "child") == "None|child"
+    assert calls == [("parent", "child"), (None, "child")]
+
+
+def test_class_docstrings_are_persisted(disk_cache):
+    Meta = custom_inherit.DocInheritMeta(style="disk_cached")
+    Parent = Meta("Parent", (object,), dict(__doc__="parent"))
+    Meta("Child", (Parent,), dict(__doc__="child"))
+    n_calls = len(calls)
+
+    custom_inherit.merge_cache.clear()
+    custom_inherit.enable_disk_cache(disk_cache.path)
+    Parent = Meta("Parent", (object,), dict(__doc__="parent"))
+    Child = Meta("Child", (Parent,), dict(__doc__="child"))
+    assert len(calls) == n_calls
+    assert Child.__doc__ == "None|None|parent|child"
+
+
+def test_style_changes_invalidate(tmp_path):
+    def style(prnt_doc, child_doc):
+        return prnt_doc
+
+    first = style_fingerprint(style)
+
+    def style(prnt_doc, child_doc):
+        return child_doc
+
+    assert style_fingerprint(style) != first
+
+    cache = DiskCache(str(tmp_path / "docs.sqlite3"))
+    assert cache.key(counting_style, ("a", "b")) != cache.key(style, ("a", "b"))
+    assert cache.key(style, ("a", "b")) != cache.key(style, ("b", "a"))
+    assert cache.key(style, (None, "b")) != cache.key(style, ("", "b"))
+
+    # closures over arbitrary objects cannot be identified across processes
+    obj = object()
+    assert style_fingerprint(lambda prnt_doc, child_doc: obj) is None
+    assert cache.key(lambda prnt_doc, child_doc: obj, ("a", "b")) is None
+
+
+class Joiner(object):
+    def __init__(self, sep):
+        self.sep = sep
+
+    def __call__(self, prnt_doc, child_doc):
+        return "{}{}{}".format(prnt_doc, self.sep, child_doc)
+
+    def join(self, prnt_doc, child_doc):
+        return self(prnt_doc, child_doc)
+
+
+def test_styles_with_unhashed_state_are_not_persisted(tmp_path):
+    # the state of callable objects and of bound methods is not part of their code
+    assert style_fingerprint(Joiner(" + ")) is None
+    assert style_fingerprint(Joiner(" + ").join) is None
+
+    def make_style(sep):
+        def style(prnt_doc, child_doc, sep=sep):
+            return prnt_doc + sep + child_doc
+
+        return style
+
+    plus, minus = make_style(" + "), make_style(" - ")
+    assert None not in (style_fingerprint(plus), style_fingerprint(minus))
+    assert style_fingerprint(plus) != style_fingerprint(minus)
+    assert style_fingerprint(make_style([])) is None
+
+    custom_inherit.add_style("joined", Joiner(" + "))
+    try:
+        custom_inherit.enable_disk_cache(str(tmp_path / "docs.sqlite3"))
+        custom_inherit.merge_cache.clear()
+        merge = custom_inherit.store.get_merger("joined")
+        assert merge("parent", "child") == "parent + child"
+        custom_inherit.disable_disk_cache()
+        assert len(DiskCache(str(tmp_path / "docs.sqlite3"))) == 0
+    finally:
+        custom_inherit.disable_disk_cache()
+        custom_inherit.remove_style("joined")
+        custom_inherit.merge_cache.clear()
+
+
+def test_version_invalidates(tmp_path):
+    path = str(tmp_path / "docs.sqlite3")
+    key = DiskCache(path).key(counting_style, ("a", "b"))
+    assert DiskCache(path, version="1").key(counting_style, ("a", "b")) != key
+    assert DiskCache(path, version="1").key(counting_style, ("a", "b")) == (
+        DiskCache(path, version="1").key(counting_style, ("a", "b"))
+    )
+
+
+def test_eviction(tmp_path):
+    cache = DiskCache(str(tmp_path / "docs.sqlite3"), max_entries=3, buffer_size=2)
+    for n in range(7):
+        cache.put(str(n), "doc{}".format(n))
+    assert len(cache) == 3
+    assert cache.get("0") is None
+    assert cache.get("6") == "doc6"
+
+    cache.put("none", None)
+    cache.flush()
+    assert cache.get("none", "missing") is None
+    assert cache.get("absent", "missing") == "missing"
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_failed_writes_remain_buffered(tmp_path, monkeypatch):
+    path = str(tmp_path / "docs.sqlite3")
+    cache = DiskCache(path, buffer_size=2)
+
+    def locked():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache, "_connect", locked)
+    cache.put("a", "doc")
+    cache.put("b", "doc")
+    assert cache.get("a") == "doc"
+
+    monkeypatch.undo()
+    cache.close()
+    assert DiskCache(path).get("b") == "doc"
+
+
+@pytest.mark.skipif(sys.version_info < (3,), reason="requires atexit.unregister")
+def test_closed_caches_are_released(tmp_path):
+    cache = DiskCache(str(tmp_path / "docs.sqlite3"))
+    cache.put("a", "doc")
+    ref = weakref.ref(cache)
+    cache.close()
+    del cache
+    gc.collect()
+    assert ref() is None
+
+
+def test_concurrent_writers(tmp_path):
+    path = str(tmp_path / "docs.sqlite3")
+
+    def write(n):
+        cache = DiskCache(path, buffer_size=10)
+        for i in range(100):
+            cache.put("{}-{}".format(n, i), str(i))
+        cache.close()
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    script = (
+        "from custom_inherit._disk_cache import DiskCache\n"
+        "cache = DiskCache({!r}, buffer_size=10)\n"
+        "for i in range(100): cache.put('proc-{{}}'.format(i), str(i))\n"
+    ).format(path)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(custom_inherit.__file__))]
+        + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    )
+    procs = [
+        subprocess.Popen([sys.executable, "-c", script], env=env) for _ in range(2)
+    ]
+    assert all(proc.wait() == 0 for proc in procs)
+
+    cache = DiskCache(path)
+    assert len(cache) == 500
+    assert cache.get("3-99") == "99"
+    assert cache.get("proc-42") == "42"
@@ -0,0 +1,63 @@
+""" Pins what `import custom_inherit` imports, as reported by `python -X importtime` """
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import custom_inherit
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="-X importtime requires Python 3.7"
+)
+
+# the modules of custom_inherit that a bare import is expected to import
+BARE_IMPORT = {
+    "custom_inherit",
+    "custom_inherit._cache",
+    "custom_inherit._decorator_base",
+    "custom_inherit._doc_parse_tools",
+    "custom_inherit._metaclass_base",
+    "custom_inherit._sidecar",
+    "custom_inherit._style_store",
+    "custom_inherit._warm",
+}
+
+
+def _imported_modules(code):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(custom_inherit.__file__))
+    env.pop("CUSTOM_INHERIT_CACHE_DIR", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    modules = set()
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and "|" in line:
+            name = line.rpartition("|")[2].strip()
+            if name.startswith("custom_inherit"):
+                modules.add(name)
+    return modules
+
+
+def test_bare_import():
+    modules = _imported_modules("import custom_inherit")
+    assert modules == BARE_IMPORT
+
+
+def test_parse_tools_are_imported_upon_first_use():
+    modules = _imported_modules(
+        "import custom_inherit; "
+        "custom_inherit.store['numpy']('Parameters\\n----------\\nx : int', None)"
+    )
+    assert modules - BARE_IMPORT == {
+        "custom_inherit._doc_parse_tools.numpy_parse_tools",
+        "custom_inherit._doc_parse_tools.section_items",
+        "custom_inherit._doc_parse_tools.section_scanner",
+    }
@@ -0,0 +1,290 @@
+""" Tests `python -m custom_inherit inline` """
+
+import ast
+import importlib
+import inspect
+import sys
+import textwrap
+
+import pytest
+
+from custom_inherit._inline import inline_project
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="inlining requires Python 3.8"
+)
+
+BASE = '''
+from abc import abstractmethod
+
+from custom_inherit import DocInheritMeta
+
+Meta = DocInheritMeta(style="numpy", abstract_base_class=True)
+
+
+class Base(metaclass=Meta):
+    """Base.
+
+    Parameters
+    ----------
+    x : int"""
+
+    def method(self):
+        """Method.
+
+        Returns
+        -------
+        int"""
+
+    @property
+    def prop(self):
+        """Prop.
+
+        Returns
+        -------
+        int"""
+
+    @prop.setter
+    def prop(self, value):
+        pass
+
+    @abstractmethod
+    def absmthd(self):
+        """Abstract.
+
+        Raises
+        ------
+        ValueError"""
+
+
+def parent():
+    """Parent.
+
+    Returns
+    -------
+    int"""
+'''
+
+CHILD = '''
+import json
+
+from custom_inherit import doc_inherit
+
+from . import base
+from .base import parent
+
+
+class Mixin(object):
+    """Mixin.
+
+    Notes
+    -----
+    Mixed in."""
+
+    def mixed(self):
+        """Mixed.
+
+        Returns
+        -------
+        str"""
+
+
+class Child(Mixin, base.Base):
+    """Parameters
+    ----------
+    y : int"""
+
+    def method(self):
+        """Parameters
+        ----------
+        a : int"""
+
+    @property
+    def prop(self):
+        return 1
+
+    def absmthd(self): pass
+
+    def mixed(self):
+        pass
+
+
+class External(json.JSONEncoder, base.Base):
+    pass
+
+
+@doc_inherit(parent, style="numpy")
+def child():
+    """Parameters
+    ----------
+    b : int"""
+
+
+@doc_inherit(Child.method, style="numpy")
+def child2():
+    pass
+'''
+
+NAMES = [
+    ("base", "Base"),
+    ("base", "Base.method"),
+    ("child", "Child"),
+    ("child", "Child.method"),
+    ("child", "Child.prop"),
+    ("child", "Child.absmthd"),
+    ("child", "Child.mixed"),
+    ("child", "child"),
+    ("child", "child2"),
+]
+
+
+def _write_project(root):
+    pkg = root / "inline_pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    (pkg / "base.py").write_text(textwrap.dedent(BASE))
+    (pkg / "child.py").write_text(textwrap.dedent(CHILD))
+
+
+def _runtime_doc(module_name, qualname):
+    obj = importlib.import_module("inline_pkg." + module_name)
+    for name in qualname.split("."):
+        obj = inspect.getattr_static(obj, name)
+    return inspect.cleandoc(obj.__doc__)
+
+
+def _static_doc(root, module_name, qualname):
+    node = ast.parse((root / "inline_pkg" / (module_name + ".py")).read_text())
+    for name in qualname.split("."):
+        node = next(n for n in node.body if getattr(n, "name", None) == name)
+    return ast.get_docstring(node)
+
+
+def test_inlined_docstrings_match_runtime(tmp_path, monkeypatch):
+    _write_project(tmp_path / "src")
+    inlined, problems = inline_project(
+        str(tmp_path / "src"), output=str(tmp_path / "build")
+    )
+    assert sum(inlined.values()) == 8
+    assert len(problems) == 1
+    assert "inline_pkg.child.External" in problems[0]
+    assert "json.JSONEncoder" in problems[0]
+
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    try:
+        for module_name, qualname in NAMES:
+            assert _static_doc(
+                tmp_path / "build", module_name, qualname
+            ) == _runtime_doc(module_name, qualname)
+    finally:
+        for name in list(sys.modules):
+            if name.startswith("inline_pkg"):
+                del sys.modules[name]
+
+    # a second pass over the rewritten sources leaves their docstrings as they are
+    build = tmp_path / "build"
+    expected = [_static_doc(build, *name) for name in NAMES]
+    inline_project(str(build))
+    assert [_static_doc(build, *name) for name in NAMES] == expected
+
+
+def test_output_must_be_empty(tmp_path):
+    _write_project(tmp_path / "src")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "keep.txt").write_text("")
+    with pytest.raises(ValueError):
+        inline_project(str(tmp_path / "src"), output=str(tmp_path / "build"))
+
+
+EXTRA = '''
+from custom_inherit import doc_inherit
+
+from . import base
+from .base import parent
+
+
+def other():
+    """Other.
+
+    Notes
+    -----
+    Other notes."""
+
+
+@doc_inherit(other, style="numpy")
+@doc_inherit(parent, style="numpy")
+def stacked():
+    """Parameters
+    ----------
+    c : int"""
+
+
+class Odd(base.Base):
+    def _method(self):
+        pass
+
+    method = _method
+    absmthd = property(_method)
+
+    if True:
+
+        def prop(self):
+            pass
+'''
+
+
+def test_stacked_doc_inherit_is_applied_bottom_up(tmp_path, monkeypatch):
+    _write_project(tmp_path / "src")
+    (tmp_path / "src" / "inline_pkg" / "extra.py").write_text(textwrap.dedent(EXTRA))
+    inline_project(str(tmp_path / "src"), output=str(tmp_path / "build"))
+
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    try:
+        expected = _runtime_doc("extra", "stacked")
+    finally:
+        for name in list(sys.modules):
+            if name.startswith("inline_pkg"):
+                del sys.modules[name]
+    # the innermost decorator is applied first, so its parent provides the summary
+    assert expected.startswith("Parent.") and "Other notes." in expected
+    assert _static_doc(tmp_path / "build", "extra", "stacked") == expected
+
+
+def test_members_not_bound_by_a_def_are_reported(tmp_path):
+    _write_project(tmp_path / "src")
+    (tmp_path / "src" / "inline_pkg" / "extra.py").write_text(textwrap.dedent(EXTRA))
+    _, problems = inline_project(str(tmp_path / "src"), output=str(tmp_path / "build"))
+    problems = [problem for problem in problems if "inline_pkg.extra.Odd" in problem]
+    assert len(problems) == 3
+    assert "'method' is bound to an expression" in problems[0]
+    assert "'absmthd' is bound to an expression" in problems[1]
+    assert "'prop' is bound within a block of `if`" in problems[2]
+
+    # members that cannot be resolved statically are left as they are
+    node = ast.parse((tmp_path / "build" / "inline_pkg" / "extra.py").read_text())
+    odd = next(n for n in node.body if getattr(n, "name", None) == "Odd")
+    assert ast.get_docstring(odd.body[-1].body[0]) is None
+
+
+LOOKALIKES = '''
+from .base import parent
+
+
+def not_doc_inherit(prnt, style):
+    return lambda func: func
+
+
+@not_doc_inherit(parent, style="numpy")
+def impostor():
+    """Impostor."""
+'''
+
+
+def test_names_ending_like_doc_inherit_are_not_applied(tmp_path):
+    _write_project(tmp_path / "src")
+    (tmp_path / "src" / "inline_pkg" / "extra.py").write_text(
+        textwrap.dedent(LOOKALIKES)
+    )
+    _, problems = inline_project(str(tmp_path / "src"), output=str(tmp_path / "build"))
+    assert _static_doc(tmp_path / "build", "extra", "impostor") == "Impostor."
+    assert not [problem for problem in problems if "inline_pkg.extra" in problem]
@@ -6,7 +6,7 @@ import pytest
 from six import add_metaclass
 
 from custom_inherit import DocInheritMeta
-from custom_inherit._doc_parse_tools.section_items import _RE_PATTERN_ITEMS
+from custom_inherit._doc_parse_tools import section_items
 
 try:
     from inspect import signature
@@ -322,4 +322,495 @@ def test_special_method3():
     ),
 )
 def test_regex(section_content, expected):
-    assert _RE_PATTERN_ITEMS.findall(section_content) == expected
+    assert section_items.parse_items(section_content) == expected
+
+
+""" Incremental option"""
+
+
+def _numpy_chain(depth, incremental, lazy=False):
+    @add_metaclass(
+        DocInheritMeta(style="numpy_with_merge", incremental=incremental, lazy=lazy)
+    )
+    class Base(object):
+        """Base.
+
+        Parameters
+        ----------
+        x0 : int
+        """
+
+    classes = [Base]
+    for n in range(1, depth):
+        doc = "Parameters\n----------\nx{} : int\n".format(n) if n % 3 else None
+        classes.append(
+            type(classes[-1])("Level{}".format(n), (classes[-1],), dict(__doc__=doc))
+        )
+    return classes
+
+
+def test_incremental_chain_matches_full_mro():
+    full = _numpy_chain(10, incremental=False)
+    incremental = _numpy_chain(10, incremental=True)
+    assert [getdoc(cls) for cls in full] == [getdoc(cls) for cls in incremental]
+    assert getdoc(incremental[-1]).startswith(
+        "Base.\n\nParameters\n----------\nx0 : int\nx1 : int"
+    )
+
+
+def test_incremental_merges_once_per_base():
+    calls = []
+
+    def counting_style(prnt_doc, child_doc):
+        calls.append(prnt_doc)
+        return child_doc if child_doc is not None else prnt_doc
+
+    @add_metaclass(DocInheritMeta(style=counting_style, incremental=True))
+    class GrandParent(object):
+        """GrandParent."""
+
+    class Parent(GrandParent):
+        pass
+
+    class Mixin(object):
+        """Mixin."""
+
+    del calls[:]
+
+    class Child(Parent, Mixin):
+        pass
+
+    # Parent's docstring already accounts for GrandParent and object
+    assert calls == [Parent.__doc__, Mixin.__doc__]
+    assert Child.__doc__ == "GrandParent."
+
+
+def test_incremental_class_docstring():
+    @add_metaclass(DocInheritMeta(style="numpy", incremental=True))
+    class Parent(object):
+        """
+        Parent class.
+
+        Returns
+        -------
+        foo
+        """
+
+    class Mixin(object):
+        """
+        This is mixin which does something.
+
+        """
+
+    class Child(Mixin, Parent):
+        """
+        Attributes
+        ----------
+        bar
+        """
+
+    assert (
+        getdoc(Child)
+        == "This is mixin which does something.\n\nAttributes\n----------\nbar\n\nReturns\n-------\nfoo"
+    )
+
+
+""" Metaclass caching"""
+
+
+def test_metaclasses_are_cached():
+    assert DocInheritMeta(style="numpy") is DocInheritMeta(style="numpy")
+    assert DocInheritMeta(style=style) is DocInheritMeta(style=style)
+    assert DocInheritMeta(style="numpy", abstract_base_class=True) is DocInheritMeta(
+        style="numpy", abstract_base_class=True
+    )
+
+    assert DocInheritMeta(style="numpy") is not DocInheritMeta(style="google")
+
+    # a built-in style is the same style whether it is named or passed as a function
+    import custom_inherit
+
+    assert DocInheritMeta(style="numpy") is DocInheritMeta(style=custom_inherit.numpy)
+    assert DocInheritMeta(style="reST", lazy=True) is DocInheritMeta(
+        style=custom_inherit.reST, lazy=True
+    )
+    assert DocInheritMeta(style="numpy") is not DocInheritMeta(
+        style="numpy", abstract_base_class=True
+    )
+    assert DocInheritMeta(style="numpy") is not DocInheritMeta(
+        style="numpy", include_special_methods=True
+    )
+    assert DocInheritMeta(style="numpy") is not DocInheritMeta(
+        style="numpy", incremental=True
+    )
+
+
+def test_cached_metaclass_tracks_style_registration():
+    from custom_inherit import add_style, remove_style
+
+    add_style("cached_meta_style", lambda prnt_doc, child_doc: "first")
+    try:
+        first = DocInheritMeta(style="cached_meta_style")
+        assert first is DocInheritMeta(style="cached_meta_style")
+        add_style("cached_meta_style", lambda prnt_doc, child_doc: "second")
+        second = DocInheritMeta(style="cached_meta_style")
+        assert second is not first
+        assert second.class_doc_inherit("", "") == "second"
+    finally:
+        remove_style("cached_meta_style")
+
+
+def test_bases_from_separate_metaclass_calls_can_be_mixed():
+    @add_metaclass(DocInheritMeta(style="numpy"))
+    class PluginA(object):
+        """Plugin A."""
+
+    @add_metaclass(DocInheritMeta(style="numpy"))
+    class PluginB(object):
+        """
+        Returns
+        -------
+        int"""
+
+    class Combined(PluginA, PluginB):
+        pass
+
+    assert getdoc(Combined) == "Plugin A.\n\nReturns\n-------\nint"
+
+
+""" Attribute-docstring index"""
+
+
+def test_attr_docs_are_looked_up_without_running_descriptors():
+    class Guarded(object):
+        """A descriptor that must not be accessed through the class."""
+
+        def __get__(self, instance, owner):
+            raise AssertionError("the descriptor must not be evaluated")
+
+    class Parent(object):
+        value = Guarded()
+
+        def method(self):
+            """Parent method."""
+
+    @add_metaclass(DocInheritMeta(style="numpy"))
+    class Kid(Parent):
+        def value(self):
+            pass
+
+        def method(self):
+            pass
+
+    assert Kid.__dict__["value"].__doc__ == Guarded.__doc__
+    assert Kid.method.__doc__ == "Parent method."
+
+
+def test_attr_docs_index_nearest_documented_parent():
+    @add_metaclass(DocInheritMeta(style="numpy"))
+    class Parent(object):
+        def method(self):
+            """Parent method."""
+
+        @classmethod
+        def cmethod(cls):
+            """Parent classmethod."""
+
+        value = 1
+
+    class Middle(Parent):
+        def method(self):
+            pass
+
+    class Kid(Middle):
+        def method(self):
+            pass
+
+        def cmethod(self):
+            pass
+
+        def value(self):
+            pass
+
+    assert Middle.method.__doc__ == "Parent method."
+    assert Kid.method.__doc__ == "Parent method."
+    assert Kid.cmethod.__doc__ == "Parent classmethod."
+    assert Kid.value.__doc__ is None
+
+
+""" Linearized mro"""
+
+
+def test_linearize_matches_mro():
+    from custom_inherit._metaclass_base import _linearize
+
+    class Base(object):
+        pass
+
+    class Left(Base):
+        pass
+
+    class Right(Base):
+        pass
+
+    class Diamond(Left, Right):
+        pass
+
+    assert _linearize((Left, Right)) == list(Diamond.__mro__[1:])
+    assert _linearize(()) == []
+    with pytest.raises(TypeError):
+        _linearize((Base, Left))
+
+
+def test_diamond_merges_shared_base_once():
+    merged = []
+
+    def record(prnt_doc, child_doc):
+        merged.append(prnt_doc)
+        return child_doc
+
+    Meta = DocInheritMeta(style=record)
+    Base = Meta("Base", (object,), dict(__doc__="base"))
+    Left = Meta("Left", (Base,), dict(__doc__="left"))
+    Right = Meta("Right", (Base,), dict(__doc__="right"))
+
+    del merged[:]
+    Meta("Diamond", (Left, Right), dict(__doc__="diamond"))
+    assert merged == ["left", "right", "base", None]
+
+
+def test_diamond_merge_within_sections_has_no_duplicates():
+    Meta = DocInheritMeta(style="numpy_with_merge")
+    Base = Meta(
+        "Base",
+        (object,),
+        dict(__doc__="Parameters\n----------\nx : int\n    The base parameter."),
+    )
+    mixins = tuple(
+        Meta(
+            "Mixin{}".format(n),
+            (Base,),
+            dict(
+                __doc__="Parameters\n----------\ny{0} : int\n    Mixin {0}.".format(n)
+            ),
+        )
+        for n in range(3)
+    )
+    Wide = Meta("Wide", mixins, {})
+    assert Wide.__doc__.count("x : int") == 1
+    assert all(Wide.__doc__.count("y{} : int".format(n)) == 1 for n in range(3))
+    assert "The base class of the class hierarchy" not in Wide.__doc__
+
+
+""" Lazy class docstrings"""
+
+
+def test_lazy_class_doc_is_merged_on_first_access():
+    merged = []
+
+    def record(prnt_doc, child_doc):
+        merged.append(prnt_doc)
+        return child_doc if prnt_doc is None else prnt_doc + "|" + child_doc
+
+    Meta = DocInheritMeta(style=record, lazy=True)
+    del merged[:]  # the style is validated by a trial merge
+    Parent = Meta("Parent", (object,), dict(__doc__="parent"))
+    Child = Meta("Child", (Parent,), dict(__doc__="child"))
+    assert merged == []
+
+    assert Child.__doc__ == "parent|child"
+    assert merged == [None, "parent", None]  # Parent.__doc__ is merged in turn
+    assert Child.__dict__["__doc__"] == "parent|child"
+
+    # the merged docstring is cached
+    assert Child().__doc__ == "parent|child"
+    assert getdoc(Child) == "parent|child"
+    assert merged == [None, "parent", None]  # Parent.__doc__ is merged in turn
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_lazy_class_doc_matches_eager(incremental):
+    eager = _numpy_chain(6, incremental)
+    lazy = _numpy_chain(6, incremental, lazy=True)
+    # resolve the deepest class first, which resolves its ancestors' docstrings in turn
+    assert [getdoc(cls) for cls in lazy[::-1]] == [getdoc(cls) for cls in eager[::-1]]
+
+
+""" Lazy attribute docstrings"""
+
+
+def _documented_hierarchy(**meta_kwargs):
+    @add_metaclass(DocInheritMeta(style="numpy", **meta_kwargs))
+    class Parent(object):
+        """Parent.
+
+        Parameters
+        ----------
+        x : int"""
+
+        def method(self):
+            """Method.
+
+            Returns
+            -------
+            int"""
+
+        @staticmethod
+        def static():
+            """Static.
+
+            Returns
+            -------
+            int"""
+
+        @classmethod
+        def clsmthd(cls):
+            """Class.
+
+            Returns
+            -------
+            int"""
+
+        @property
+        def prop(self):
+            """Prop.
+
+            Returns
+            -------
+            int"""
+            return self._prop
+
+        @prop.setter
+        def prop(self, value):
+            self._prop = value
+
+        @abstractmethod
+        def absmthd(self):
+            """Abstract.
+
+            Returns
+            -------
+            int"""
+
+    class Kid(Parent):
+        def method(self):
+            """Parameters
+            ----------
+            a : int"""
+
+        @staticmethod
+        def static():
+            pass
+
+        @classmethod
+        def clsmthd(cls):
+            pass
+
+        @property
+        def prop(self):
+            return 1
+
+        def absmthd(self):
+            pass
+
+    class GrandKid(Kid):
+        def method(self):
+            pass
+
+    return Parent, Kid, GrandKid
+
+
+@pytest.mark.parametrize("abstract_base_class", [False, True])
+def test_lazy_attr_docs_match_eager(abstract_base_class):
+    import pydoc
+    import re
+
+    def render(cls):
+        # drop the memory addresses of the class' attributes
+        return re.sub(r" at 0x\w+", "", pydoc.render_doc(cls, renderer=pydoc.plaintext))
+
+    eager = _documented_hierarchy(abstract_base_class=abstract_base_class)
+    lazy = _documented_hierarchy(abstract_base_class=abstract_base_class, lazy=True)
+    for eager_cls, lazy_cls in zip(eager[::-1], lazy[::-1]):
+        assert render(lazy_cls) == render(eager_cls)
+        for attr in ("method", "static", "clsmthd", "prop", "absmthd"):
+            assert getdoc(getattr(lazy_cls, attr)) == getdoc(getattr(eager_cls, attr))
+
+
+def test_lazy_attr_docs_are_merged_on_first_access():
+    Parent, Kid, GrandKid = _documented_hierarchy(lazy=True)
+    pending = type(Kid.__dict__["method"])
+    assert not isinstance(Kid.__dict__["method"], FunctionType)
+
+    # accessing the descriptor's docstring resolves the attribute
+    assert Kid.__dict__["method"].__doc__ == (
+        "Method.\n\nParameters\n----------\na : int\n\nReturns\n-------\nint"
+    )
+    assert isinstance(Kid.__dict__["method"], FunctionType)
+
+    # resolving an attribute resolves the parents' attribute in turn
+    assert isinstance(GrandKid.__dict__["method"], pending)
+    assert isinstance(Parent.__dict__["static"], pending)
+    assert getdoc(GrandKid.method) == getdoc(Kid.method)
+    assert isinstance(Parent.__dict__["method"], FunctionType)
+    assert getdoc(Kid.static) == "Static.\n\nReturns\n-------\nint"
+    assert isinstance(Parent.__dict__["static"], staticmethod)
+
+
+def test_lazy_attributes_are_bound_without_owner():
+    Parent, Kid, GrandKid = _documented_hierarchy(lazy=True)
+    kid = Kid()
+    # the owner is optional in the descriptor protocol
+    bound = Kid.__dict__["method"].__get__(kid)
+    assert bound.__self__ is kid
+    assert getdoc(bound) == getdoc(Kid.method)
+    assert Kid.__dict__["prop"].__get__(kid) == 1
+
+
+def test_lazy_property_and_abstract_methods():
+    Parent, Kid, GrandKid = _documented_hierarchy(lazy=True, abstract_base_class=True)
+    assert Parent.__abstractmethods__ == frozenset(["absmthd"])
+    with pytest.raises(TypeError):
+        Parent()
+
+    kid = Kid()
+    assert kid.prop == 1
+
+    class Settable(Kid):
+        @property
+        def prop(self):
+            return self._prop
+
+        @prop.setter
+        def prop(self, value):
+            self._prop = value
+
+    settable = Settable()
+    settable.prop = 2  # the pending property is a data descriptor
+    assert settable.prop == 2
+    assert "prop" not in vars(settable)
+    assert Settable.prop.__doc__ == "Prop.\n\nReturns\n-------\nint"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_parent_attributes_altered_after_creation(lazy):
+    @add_metaclass(DocInheritMeta(style="numpy", lazy=lazy))
+    class A(object):
+        def f(self):
+            """f doc"""
+
+    def g(self):
+        """g doc"""
+
+    A.g = g
+    A.f.__doc__ = "patched f"
+
+    class B(A):
+        def f(self):
+            pass
+
+        def g(self):
+            pass
+
+    assert B.g.__doc__ == "g doc"
+    assert B.f.__doc__ == "patched f"
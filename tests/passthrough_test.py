@@ -0,0 +1,64 @@
+""" Tests the pass-through mode of DocInheritMeta and doc_inherit, which merge nothing """
+
+import os
+import subprocess
+import sys
+
+import custom_inherit
+
+CODE = """
+import abc
+import custom_inherit
+from custom_inherit import DocInheritMeta, doc_inherit
+
+Meta = DocInheritMeta(style="numpy", abstract_base_class=True, lazy=True)
+Parent = Meta("Parent", (object,), dict(__doc__="Parent.", method=lambda self: None))
+Parent.method.__doc__ = "Method."
+Child = Meta("Child", (Parent,), dict(method=lambda self: None))
+
+def func():
+    pass
+
+decorated = doc_inherit(Parent, style="numpy")(func)
+
+assert isinstance(Child, abc.ABCMeta)
+assert decorated is func
+print(
+    custom_inherit._DocInheritorBase.passthrough,
+    Child.__doc__ is None and Child.method.__doc__ is None and func.__doc__ is None,
+    custom_inherit.merge_cache.info().misses,
+    custom_inherit.parse_cache.info().misses,
+)
+"""
+
+
+def _run(flags=(), passthrough=None):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(custom_inherit.__file__))
+    env.pop("CUSTOM_INHERIT_CACHE_DIR", None)
+    env.pop("CUSTOM_INHERIT_PASSTHROUGH", None)
+    if passthrough is not None:
+        env["CUSTOM_INHERIT_PASSTHROUGH"] = passthrough
+    out = subprocess.check_output(
+        [sys.executable] + list(flags) + ["-c", CODE], env=env
+    )
+    return out.decode("utf-8").split()
+
+
+def test_passthrough_under_optimize_2():
+    assert _run(["-OO"]) == ["True", "True", "0", "0"]
+
+
+def test_passthrough_forced_by_environment():
+    assert _run(passthrough="1") == ["True", "True", "0", "0"]
+
+
+def test_passthrough_disabled_by_environment():
+    passthrough, unmerged, merge_misses, _ = _run(["-OO"], passthrough="0")
+    assert (passthrough, unmerged) == ("False", "False")
+    assert int(merge_misses) > 0
+
+
+def test_merges_by_default():
+    passthrough, unmerged, _, _ = _run()
+    assert (passthrough, unmerged) == ("False", "False")
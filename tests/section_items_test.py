@@ -0,0 +1,97 @@
+""" Tests behavior of custom_inherit._doc_parse_tools.section_items """
+
+import inspect
+import random
+import re
+import textwrap
+from collections import OrderedDict
+
+import pytest
+
+from custom_inherit._doc_parse_tools.section_items import dedent, parse_items, render
+
+# the regex by which sections were split into their items, before `parse_items`
+RE_PATTERN_ITEMS = re.compile(r"(\**\w+)(.*?)(?:$|(?=\n\**\w+))", flags=re.DOTALL)
+
+# the pieces from which sections are drawn: names, asterisks, line feeds, indentation, etc.
+PIECES = (
+    "x",
+    "y_1",
+    "*",
+    "**",
+    "\n",
+    "\n",
+    "  ",
+    "\t",
+    " : int",
+    ":",
+    "-",
+    "é",
+    "²",
+    "\r",
+)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parse_items_matches_regex(seed):
+    rng = random.Random(seed)
+    for _ in range(5000):
+        section = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 20)))
+        assert parse_items(section) == RE_PATTERN_ITEMS.findall(section), section
+
+
+@pytest.mark.parametrize(
+    "section",
+    (
+        "",
+        "\n",
+        "-- foo\nbar\n",
+        "x : int\n    The x.\n*args\n    Args.\n**kwargs\n    Kwargs.",
+        "x : int\n\n    The x.\n\ny : int\n\n",
+        "* not an item\n** nor this\n*** x",
+        "x" + "*" * 1000 + "\n" + "*" * 1000,
+        "*" * 1000,
+    ),
+)
+def test_parse_items_edge_cases(section):
+    assert parse_items(section) == RE_PATTERN_ITEMS.findall(section)
+
+
+def test_parse_items_is_linear_on_many_items():
+    section = "\n".join("x{0} : int\n    The x{0}.".format(n) for n in range(5000))
+    items = parse_items(section)
+    assert len(items) == 5000
+    assert items[-1] == ("x4999", " : int\n    The x4999.")
+
+
+# the pieces from which cleaned sections are drawn: text, line feeds and indentation
+INDENTED_PIECES = ("x", "y : int", "\n", "\n", " ", "  ", "    ", "\xa0", "\u3000")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_dedent_matches_cleandoc(seed):
+    rng = random.Random(seed)
+    for _ in range(5000):
+        section = "".join(
+            rng.choice(INDENTED_PIECES) for _ in range(rng.randint(0, 20))
+        )
+        # as cleaned by `section_scanner.clean_doc`
+        section = "\n".join(line.rstrip() for line in section.split("\n"))
+        assert dedent(section) == inspect.cleandoc(section), section
+
+
+@pytest.mark.parametrize("style, padding", [("numpy", ""), ("google", "    ")])
+def test_render_matches_indent(style, padding):
+    rng = random.Random(0)
+    for _ in range(2000):
+        body = OrderedDict(
+            (
+                "x{}".format(n),
+                "".join(rng.choice(INDENTED_PIECES) for _ in range(rng.randint(0, 8))),
+            )
+            for n in range(rng.randint(0, 3))
+        )
+        expected = "\n".join(
+            textwrap.indent(key + value, padding) for key, value in body.items()
+        )
+        assert render(body, style) == expected, body
@@ -0,0 +1,41 @@
+""" Tests behavior of custom_inherit._doc_parse_tools.section_scanner """
+
+import inspect
+import random
+
+import pytest
+
+from custom_inherit._doc_parse_tools.section_scanner import Span, clean_doc, dedent_doc
+
+# the pieces from which docstrings are drawn: text, line feeds, indentation and other whitespace
+PIECES = ("x", "y : int", "\n", "\n", "\n", " ", "  ", "    ", "\t", "\x1f")
+OTHER_PIECES = ("\xa0", "\r", "\x0c", "é")
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_clean_doc_and_dedent_doc_match_cleandoc(seed):
+    rng = random.Random(seed)
+    # the odd seeds draw docstrings that are not ascii, or that hold other line boundaries
+    pieces = PIECES + OTHER_PIECES if seed % 2 else PIECES
+    for _ in range(5000):
+        doc = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 25)))
+        expected = "\n".join(
+            line.rstrip() for line in inspect.cleandoc(doc).splitlines()
+        )
+        assert clean_doc(doc) == expected, doc
+        cleaned = inspect.cleandoc(doc)
+        assert dedent_doc(doc) == "\n".join(cleaned.splitlines()), doc
+
+
+def test_span_behaves_as_its_text():
+    doc = "Notes\n-----\n  Some notes.\n    Indented.  \n"
+    span = Span(doc, 14, len(doc), margin=2)
+    text = "Some notes.\n  Indented.  \n"
+    assert str(span) == text
+    assert span == text and not span != text
+    assert span == Span(text, 0, len(text))
+    assert hash(span) == hash(text)
+    assert "> " + span + "<" == "> " + text + "<"
+    assert "{}".format(span) == text
+    assert span.rstrip() == text.rstrip()
+    assert not Span(doc, 5, 5) and Span(doc, 5, 6)
@@ -0,0 +1,156 @@
+""" Tests the cache of merged docstrings that is shared with spawned processes """
+
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import custom_inherit
+from custom_inherit import DocInheritMeta, merge_cache
+from custom_inherit._cache import MemoizedStyle
+from custom_inherit._shared_cache import SharedDocTable
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="shared memory requires Python 3.8"
+)
+
+CALLS = []
+
+
+def counting_numpy(prnt_doc, child_doc):
+    CALLS.append(None)
+    return custom_inherit.numpy(prnt_doc, child_doc)
+
+
+# the merges of memoized styles (e.g. those in the style store) are shared
+memoized_numpy = MemoizedStyle(counting_numpy)
+
+
+def build_hierarchy():
+    meta = DocInheritMeta(style=memoized_numpy)
+
+    def parent_method(self):
+        """Method.
+
+        Returns
+        -------
+        int"""
+
+    def child_method(self):
+        """Parameters
+        ----------
+        a : int"""
+
+    Parent = meta(
+        "Parent", (object,), dict(__doc__="Parent.\n\nx : int", method=parent_method),
+    )
+    Child = meta("Child", (Parent,), dict(__doc__="Child.", method=child_method))
+    return Child.__doc__, Child.method.__doc__
+
+
+def worker(_):
+    DocInheritMeta(style=memoized_numpy)  # validates the style by a trial call
+    del CALLS[:]
+    docs = build_hierarchy()
+    return len(CALLS), docs
+
+
+class Joiner(object):
+    def __init__(self, sep):
+        self.sep = sep
+
+    def __call__(self, prnt_doc, child_doc):
+        return "{}{}{}".format(prnt_doc, self.sep, child_doc)
+
+
+def test_shared_table_lookups():
+    merge_cache.clear()
+    expected = build_hierarchy()
+    table = custom_inherit.publish_shared_cache()
+    try:
+        assert len(table) == len(merge_cache) > 0
+
+        merge_cache.clear()
+        del CALLS[:]
+        attached = custom_inherit.attach_shared_cache()
+        assert attached is not None and attached.name == table.name
+        assert build_hierarchy() == expected
+        assert len(CALLS) == 0
+
+        missing = attached.key(counting_numpy, ("a", "b"))
+        assert attached.get(missing, "missing") == "missing"
+
+        # a style that cannot be identified across processes is not shared
+        obj = object()
+        assert attached.key(lambda prnt_doc, child_doc: obj, ("a",)) is None
+        # nor is a callable object, whose state is not part of its code
+        assert attached.key(Joiner(" + "), ("a",)) is None
+    finally:
+        os.environ.pop("CUSTOM_INHERIT_SHARED_CACHE", None)
+        custom_inherit.detach_shared_cache()
+        table.unlink()
+
+
+def test_lookups_race_with_close():
+    table = SharedDocTable.publish([(counting_numpy, ("a", "b"), "merged")])
+    try:
+        key = table.key(counting_numpy, ("a", "b"))
+        attached = SharedDocTable.attach(table.name)
+        assert attached.get(key) == "merged"
+        errors = []
+
+        def read():
+            try:
+                while attached.get(key, "closed") != "closed":
+                    pass
+            except Exception as e:  # e.g. reading a released buffer
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        attached.close()
+        for reader in readers:
+            reader.join()
+        assert errors == []
+        assert attached.get(key, "closed") == "closed"
+    finally:
+        table.unlink()
+
+
+def test_spawned_workers_use_shared_table():
+    merge_cache.clear()
+    expected = build_hierarchy()
+    table = custom_inherit.publish_shared_cache()
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(2) as pool:
+            results = pool.map(worker, range(2))
+    finally:
+        os.environ.pop("CUSTOM_INHERIT_SHARED_CACHE", None)
+        table.unlink()
+    assert results == [(0, expected)] * 2
+
+
+def test_attaching_upon_import_defers_the_version():
+    merge_cache.clear()
+    build_hierarchy()
+    table = custom_inherit.publish_shared_cache()
+    try:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(custom_inherit.__file__))]
+            + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+        )
+        script = (
+            "import custom_inherit, sys\n"
+            "assert custom_inherit.attach_shared_cache() is not None\n"
+            "sys.exit('__version__' in vars(custom_inherit))"
+        )
+        assert subprocess.call([sys.executable, "-c", script], env=env) == 0
+    finally:
+        os.environ.pop("CUSTOM_INHERIT_SHARED_CACHE", None)
+        table.unlink()
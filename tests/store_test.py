@@ -1,7 +1,12 @@
 """ Tests behavior of custom_inherit._Store """
 
+import os
+import subprocess
+import sys
+
 from pytest import raises
 
+import custom_inherit
 from custom_inherit import _Store, _style_store, store
 
 
@@ -66,3 +71,95 @@ def test_store():
     )
     assert "parent" in store.keys()
     assert "numpy" in store.keys()
+
+
+def test_memoized_merges():
+    calls = []
+
+    def counting_style(prnt_doc, child_doc):
+        calls.append((prnt_doc, child_doc))
+        return child_doc if child_doc is not None else prnt_doc
+
+    _store = _Store()
+    _store.register("memo", counting_style)
+    _store.register("no_memo", counting_style, memoize=False)
+
+    # items of the store are always the styles as they were provided
+    assert _store["memo"] is counting_style
+    assert _store["no_memo"] is counting_style
+
+    merger = _store.get_merger("memo")
+    del calls[:]
+    assert merger("parent", None) == "parent"
+    assert merger("parent", None) == "parent"
+    assert merger("parent", "child") == "child"
+    assert calls == [("parent", None), ("parent", "child")]
+
+    merger = _store.get_merger("no_memo")
+    del calls[:]
+    merger("parent", None)
+    merger("parent", None)
+    assert len(calls) == 2
+
+    # functions supplied directly are used as-is
+    assert _store.get_merger(counting_style) is counting_style
+
+    _store.pop("memo")
+    with raises(TypeError):
+        _store.get_merger("memo")
+
+
+def test_add_style_memoize_opt_out():
+    calls = []
+
+    def impure_style(prnt_doc, child_doc):
+        calls.append(None)
+        return "call #{}".format(len(calls))
+
+    custom_inherit.add_style("impure_style", impure_style, memoize=False)
+    try:
+        merger = store.get_merger("impure_style")
+        assert merger("a", "b") != merger("a", "b")
+    finally:
+        custom_inherit.remove_style("impure_style")
+
+
+def test_style_functions_are_validated_once():
+    calls = []
+
+    def counting_style(prnt_doc, child_doc):
+        calls.append((prnt_doc, child_doc))
+        return child_doc
+
+    _store = _Store()
+    assert _store[counting_style] is counting_style
+    assert _store.get_merger(counting_style) is counting_style
+    _store.register("counting", counting_style)
+    assert calls == [("", "")]
+
+    # invalid styles are not remembered
+    with raises(TypeError):
+        _store[bad_style_type2]
+    with raises(TypeError):
+        _store[bad_style_type2]
+
+
+def test_builtin_styles_are_not_validated_by_a_trial_call():
+    def fail(prnt_doc, child_doc):
+        raise AssertionError("the built-in styles must not be called")
+
+    _store = _Store()
+    _store._register("numpy", fail)
+    assert _store["numpy"] is fail
+
+    # importing custom_inherit parses no docstrings
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(custom_inherit.__file__))
+    env.pop("CUSTOM_INHERIT_CACHE_DIR", None)
+    code = "import custom_inherit; print(custom_inherit.parse_cache.info().misses)"
+    assert int(subprocess.check_output([sys.executable, "-c", code], env=env)) == 0
+
+
+def test_parent_style_is_not_memoized():
+    assert store.get_merger("parent") is store["parent"]
+    assert store.get_merger("numpy") is not store["numpy"]
@@ -0,0 +1,124 @@
+""" Tests `python -m custom_inherit stubs` """
+
+import ast
+import os
+import sys
+import textwrap
+
+import pytest
+from inline_test import NAMES, _runtime_doc, _write_project
+
+from custom_inherit._stubs import generate_stubs
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 9), reason="generating stubs requires Python 3.9"
+)
+
+
+def _stub_doc(root, module_name, qualname):
+    with open(os.path.join(root, "inline_pkg", module_name + ".pyi")) as f:
+        node = ast.parse(f.read())
+    for name in qualname.split("."):
+        node = next(n for n in node.body if getattr(n, "name", None) == name)
+    return ast.get_docstring(node)
+
+
+def _names(paths):
+    return sorted(os.path.basename(path) for path in paths)
+
+
+def test_stubs_carry_runtime_docstrings(tmp_path, monkeypatch):
+    _write_project(tmp_path / "src")
+    out = str(tmp_path / "stubs")
+    written, problems = generate_stubs(str(tmp_path / "src"), output=out)
+    assert _names(written) == ["__init__.pyi", "base.pyi", "child.pyi"]
+    assert len(problems) == 1 and "json.JSONEncoder" in problems[0]
+
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    try:
+        for module_name, qualname in NAMES:
+            assert _stub_doc(out, module_name, qualname) == _runtime_doc(
+                module_name, qualname
+            )
+    finally:
+        for name in list(sys.modules):
+            if name.startswith("inline_pkg"):
+                del sys.modules[name]
+
+
+def test_stubs_are_regenerated_incrementally(tmp_path):
+    src = tmp_path / "src"
+    _write_project(src)
+    out = str(tmp_path / "stubs")
+    generate_stubs(str(src), output=out)
+    assert generate_stubs(str(src), output=out)[0] == []
+
+    # child.py imports base.py, but not vice versa
+    child = src / "inline_pkg" / "child.py"
+    child.write_text(child.read_text() + "\n\nX = 1\n")
+    assert _names(generate_stubs(str(src), output=out)[0]) == ["child.pyi"]
+
+    base = src / "inline_pkg" / "base.py"
+    base.write_text(base.read_text().replace('"""Method.', '"""A method.'))
+    assert _names(generate_stubs(str(src), output=out)[0]) == [
+        "base.pyi",
+        "child.pyi",
+    ]
+    assert _stub_doc(out, "child", "Child.method").startswith("A method.")
+
+    assert len(generate_stubs(str(src), output=out, force=True)[0]) == 3
+
+    os.remove(str(child))
+    generate_stubs(str(src), output=out)
+    assert not os.path.exists(os.path.join(out, "inline_pkg", "child.pyi"))
+
+
+def test_stubs_are_not_written_beside_the_modules(tmp_path):
+    _write_project(tmp_path / "src")
+    with pytest.raises(ValueError):
+        generate_stubs(str(tmp_path / "src"), output=str(tmp_path / "src"))
+    assert not os.path.exists(str(tmp_path / "src" / "inline_pkg" / "base.pyi"))
+
+
+def test_module_names_and_blocks_are_kept(tmp_path):
+    _write_project(tmp_path / "src")
+    (tmp_path / "src" / "inline_pkg" / "compat.py").write_text(
+        textwrap.dedent(
+            '''
+            import sys
+
+            VERSION = (1, 2)
+            NAMES: list = ["a"]
+
+            try:
+                from json import JSONDecodeError
+            except ImportError:
+
+                class JSONDecodeError(ValueError):
+                    """Fallback."""
+
+            if sys.version_info >= (3, 9):
+
+                def helper():
+                    """Helper."""
+                    return 1
+
+            else:
+                helper = None
+            '''
+        )
+    )
+    out = str(tmp_path / "stubs")
+    generate_stubs(str(tmp_path / "src"), output=out)
+    with open(os.path.join(out, "inline_pkg", "compat.pyi")) as f:
+        stub = ast.parse(f.read())
+
+    assert "Any" not in ast.dump(stub)
+    assign, ann_assign, try_stmt, if_stmt = stub.body[1:]
+    assert ast.literal_eval(assign.value) == (1, 2)
+    assert ast.literal_eval(ann_assign.value) == ["a"]
+    assert isinstance(try_stmt.body[0], ast.ImportFrom)
+    assert ast.get_docstring(try_stmt.handlers[0].body[0]) == "Fallback."
+    assert ast.get_docstring(if_stmt.body[0]) == "Helper."
+    assert len(if_stmt.body[0].body) == 1  # its implementation is dropped
+    assert isinstance(if_stmt.orelse[0], ast.Assign)
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import custom_inherit
+
+try:
+    _basestring = basestring
+except NameError:
+    _basestring = str  # Python 2 -> 3 alias
+
+
+def test_version():
+    import custom_inherit
+
+    assert isinstance(custom_inherit.__version__, _basestring)
+    assert custom_inherit.__version__
+
+
+@pytest.mark.skipif(
+    not os.path.exists(
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), ".git")
+    ),
+    reason="the version is derived from the git metadata of the source tree",
+)
+def test_version_is_known():
+    assert "unknown" not in custom_inherit.__version__
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="a lazy __version__ requires module __getattr__"
+)
+def test_version_is_resolved_lazily():
+    # resolving the version may spawn git subprocesses, which importing must not incur
+    code = (
+        "import sys, custom_inherit; "
+        "assert 'custom_inherit._version' not in sys.modules; "
+        "assert 'subprocess' not in sys.modules; "
+        "assert custom_inherit.__version__; "
+        "assert 'custom_inherit._version' in sys.modules"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(custom_inherit.__file__))]
+        + [p for p in [env.get("PYTHONPATH")] if p]
+    )
+    env.pop("CUSTOM_INHERIT_CACHE_DIR", None)
+    subprocess.check_call([sys.executable, "-c", code], env=env)
@@ -0,0 +1,133 @@
+""" Tests custom_inherit.warm """
+
+from types import FunctionType, ModuleType
+
+import pytest
+from metaclass_test import _documented_hierarchy
+
+import custom_inherit
+from custom_inherit import merge_cache, parse_cache, warm
+from custom_inherit._cache import BoundedCache
+from custom_inherit._warm import BackgroundWarmer
+
+
+@pytest.fixture(autouse=True)
+def _unfreeze_caches():
+    yield
+    parse_cache.unfreeze()
+    merge_cache.unfreeze()
+
+
+def _is_pending(cls):
+    return not isinstance(cls.__dict__["__doc__"], str) or not isinstance(
+        cls.__dict__["method"], FunctionType
+    )
+
+
+def test_warm_resolves_pending_docstrings_of_module():
+    module = ModuleType("warm_test_module")
+    Parent, Kid, GrandKid = _documented_hierarchy(lazy=True)
+    for cls in (Parent, Kid, GrandKid):
+        cls.__module__ = module.__name__
+        setattr(module, cls.__name__, cls)
+    module.Foreign = int  # not a doc-inheriting class
+
+    assert all(_is_pending(cls) for cls in (Parent, Kid, GrandKid))
+    info = warm(module)
+    # class docs: 3; attributes: 5 (Parent) + 5 (Kid) + 1 (GrandKid)
+    assert info == custom_inherit.WarmInfo(classes=3, resolved=14)
+    assert not any(_is_pending(cls) for cls in (Parent, Kid, GrandKid))
+    assert parse_cache.frozen and merge_cache.frozen
+
+    eager = _documented_hierarchy()
+    assert GrandKid.__doc__ == eager[2].__doc__
+    assert GrandKid.method.__doc__ == eager[2].method.__doc__
+
+    # nothing is left to resolve
+    assert warm([module]) == (3, 0)
+
+
+def test_warm_classes_and_nested_classes():
+    Parent, Kid, _ = _documented_hierarchy(lazy=True)
+    Kid.Nested = _documented_hierarchy(lazy=True)[1]
+    Kid.Nested.__module__ = Kid.__module__
+
+    info = warm(Kid)
+    # Kid, and Nested, along with their parents
+    assert info.classes == 2
+    assert not _is_pending(Kid) and not _is_pending(Kid.Nested)
+    assert not _is_pending(Parent)
+
+    with pytest.raises(TypeError):
+        warm(["not a module"])
+
+
+def test_warm_freezes_gc(monkeypatch):
+    import gc
+
+    calls = []
+    monkeypatch.setattr(gc, "freeze", lambda: calls.append(None), raising=False)
+    warm([], freeze_gc=True)
+    assert calls == [None]
+
+
+def test_frozen_cache_is_not_reordered():
+    cache = BoundedCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.freeze()
+    assert cache.get("a") == 1  # "a" remains the least recently used entry
+    assert cache.get("c", "missing") == "missing"
+    assert cache.info() == (0, 0, 2, 2)
+
+    cache.put("c", 3)  # new entries are still cached
+    assert "a" not in cache and cache.get("c") == 3
+
+    cache.unfreeze()
+    assert cache.get("b") == 2
+    assert cache.info().hits == 1
+
+
+def test_warm_in_background():
+    hierarchy = _documented_hierarchy(lazy=True)
+    assert all(_is_pending(cls) for cls in hierarchy)
+
+    warmer = custom_inherit.warm_in_background(time_slice=0.001, pause=0.0)
+    assert warmer.wait(timeout=10)
+    assert warmer.done and warmer.pending == 0
+    assert warmer.classes >= 3 and warmer.resolved >= 14
+    assert not any(_is_pending(cls) for cls in hierarchy)
+
+    eager = _documented_hierarchy()
+    assert hierarchy[2].__doc__ == eager[2].__doc__
+    assert hierarchy[2].method.__doc__ == eager[2].method.__doc__
+
+
+def test_background_warmer_can_be_cancelled():
+    hierarchy = _documented_hierarchy(lazy=True)
+    warmer = BackgroundWarmer()
+    assert not warmer.done
+    warmer.cancel()
+    assert warmer.start().wait(timeout=10)
+    assert warmer.done and (warmer.classes, warmer.resolved) == (0, 0)
+    assert warmer.pending >= 3
+    assert all(_is_pending(cls) for cls in hierarchy)
+
+
+def test_references_to_collected_lazy_classes_are_pruned():
+    import gc
+
+    from custom_inherit import _metaclass_base
+
+    Meta = custom_inherit.DocInheritMeta(style="numpy", lazy=True)
+    kept = []
+    for n in range(1000):
+        cls = Meta("Lazy", (object,), {"__doc__": "Lazy."})
+        if n % 10 == 0:
+            kept.append(cls)
+        del cls
+        gc.collect(0)
+
+    refs = list(_metaclass_base._lazy_classes)
+    assert all(any(ref() is cls for ref in refs) for cls in kept)
+    assert len(refs) < 3 * len(kept) + 64